@@ -0,0 +1,96 @@
+"""Memory held by a full Congress of mapped roll calls.
+
+Maps synthetic member-votes payloads (JSON-decoded one at a time, like real
+responses) with the current ``RollCallMapper`` and with a plain-dataclass,
+non-interning equivalent of the previous models, and reports the memory
+retained by the resulting ``RollCall`` lists via ``tracemalloc``.
+
+    python benchmarks/memory_models.py --roll-calls 1400 --members 435
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from congress_api.mappers.roll_call_mapper import RollCallMapper
+
+from payloads import synthetic_payloads
+
+
+@dataclass
+class LegacyMemberVote:
+    bioguide_id: Optional[str]
+    first_name: str
+    last_name: str
+    vote_cast: str
+    party: Optional[str] = None
+    state: Optional[str] = None
+
+
+@dataclass
+class LegacyRollCall:
+    congress: int
+    session_number: int
+    roll_call_number: int
+    start_date: Optional[str]
+    result: Optional[str] = None
+    vote_question: Optional[str] = None
+    legislation_type: Optional[str] = None
+    legislation_number: Optional[str] = None
+    members: List[LegacyMemberVote] = field(default_factory=list)
+
+
+def legacy_map(congress: int, roll_call_number: int, payload: Dict) -> LegacyRollCall:
+    block = payload["houseRollCallVoteMemberVotes"]
+    return LegacyRollCall(
+        congress=congress,
+        session_number=int(block["sessionNumber"]),
+        roll_call_number=roll_call_number,
+        start_date=block.get("startDate"),
+        result=block.get("result"),
+        vote_question=block.get("voteQuestion"),
+        members=[
+            LegacyMemberVote(
+                bioguide_id=mv.get("bioguideID"),
+                first_name=str(mv.get("firstName", "")),
+                last_name=str(mv.get("lastName", "")),
+                vote_cast=str(mv.get("voteCast", "")),
+                party=mv.get("voteParty"),
+                state=mv.get("voteState"),
+            )
+            for mv in block.get("results") or []
+        ],
+    )
+
+
+def retained_bytes(mapper: Callable[[int, int, Dict], object], payloads: List[bytes]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    held = [mapper(118, number, json.loads(raw)) for number, raw in enumerate(payloads, start=1)]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--roll-calls", type=int, default=1400)
+    parser.add_argument("--members", type=int, default=435)
+    args = parser.parse_args()
+
+    payloads = synthetic_payloads(args.roll_calls, args.members)
+    legacy = retained_bytes(legacy_map, payloads)
+    current = retained_bytes(RollCallMapper.from_api_payload, payloads)
+    print(f"roll calls: {args.roll_calls}, members per roll call: {args.members}")
+    print(f"plain dataclasses: {legacy / 2**20:8.1f} MiB")
+    print(f"slotted + interned: {current / 2**20:8.1f} MiB ({current / legacy:.0%} of plain)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Member-votes payloads for the benchmarks.
+
+``synthetic_congress`` builds a Congress-sized set of payloads (two sessions,
+a fixed roster voting on every roll call) and ``recorded_congress`` loads real
+responses saved in the response cache. ``payload_transport`` serves either set
+to ``CongressApiClient`` without touching the network, answering 404 after a
+session's last roll call like the API does.
+"""
+from __future__ import annotations
+
+import json
+import random
+import re
+from pathlib import Path
+from typing import Dict, List, Mapping, Tuple
+
+from congress_api.services.response_cache import ResponseCache
+from congress_api.services.transport import InMemoryTransport, TransportResponse
+
+
+# (session, roll call) → raw JSON body
+Payloads = Dict[Tuple[int, int], bytes]
+
+_URL_KEY = re.compile(r"/house-vote/(\d+)/(\d+)/(\d+)/members$")
+
+
+def synthetic_payloads(roll_calls: int, members: int, seed: int = 7, session_number: int = 1) -> List[bytes]:
+    """``roll_calls`` payloads in which the same ``members`` all vote."""
+    rng = random.Random(seed)
+    roster = [
+        {
+            "bioguideID": f"M{index:06d}",
+            "firstName": f"First{index}",
+            "lastName": f"Last{index}",
+            "voteParty": rng.choice(["D", "R"]),
+            "voteState": rng.choice(["CA", "TX", "NY", "FL", "MA", "OH"]),
+        }
+        for index in range(members)
+    ]
+    payloads = []
+    for number in range(1, roll_calls + 1):
+        results = [dict(member, voteCast=rng.choice(["Yea", "Nay", "Not Voting", "Present"])) for member in roster]
+        block = {
+            "sessionNumber": session_number,
+            "startDate": "2023-03-01T12:00:00-05:00",
+            "result": "Passed",
+            "voteQuestion": "On Passage",
+            "results": results,
+        }
+        payloads.append(json.dumps({"houseRollCallVoteMemberVotes": block}).encode("utf-8"))
+    return payloads
+
+
+def synthetic_congress(roll_calls: int, members: int, seed: int = 7) -> Payloads:
+    """Split ``roll_calls`` over sessions 1 and 2, about 55/45 like a real Congress."""
+    first = roll_calls * 55 // 100
+    payloads: Payloads = {}
+    for session_number, count in ((1, first), (2, roll_calls - first)):
+        for number, raw in enumerate(synthetic_payloads(count, members, seed + session_number, session_number), start=1):
+            payloads[(session_number, number)] = raw
+    return payloads
+
+
+def recorded_congress(cache_path: Path, congress: int) -> Payloads:
+    """Every cached 200 response of ``congress``, read until each session's first gap."""
+    cache = ResponseCache(cache_path)
+    payloads: Payloads = {}
+    try:
+        for session_number in (1, 2):
+            number = 1
+            while True:
+                cached = cache.get(congress, session_number, number)
+                if cached is None or cached.status_code != 200:
+                    break
+                payloads[(session_number, number)] = cached.content
+                number += 1
+    finally:
+        cache.close()
+    if not payloads:
+        raise ValueError(f"No cached responses for congress {congress} in {cache_path}")
+    return payloads
+
+
+def payload_transport(payloads: Payloads) -> InMemoryTransport:
+    def handler(url: str, params: Mapping[str, str]) -> TransportResponse:
+        _, session_number, number = (int(part) for part in _URL_KEY.search(url).groups())
+        raw = payloads.get((session_number, number))
+        if raw is None:
+            return TransportResponse(status_code=404, content=b"")
+        return TransportResponse(status_code=200, content=raw)
+
+    return InMemoryTransport(handler)
@@ -0,0 +1,259 @@
+"""Offline benchmarks for the fetch → map → filter → export pipeline.
+
+Runs each stage, then the whole ``ExportNotVotingCommand``, on a Congress of
+payloads (1,400 roll calls × 435 members by default, or real responses from
+the response cache with ``--recorded``) served by an in-memory transport, so
+no network is needed. Stages:
+
+- ``fetch``: ``CongressApiClient.get_member_votes`` (transport + JSON decode)
+- ``map``: ``RollCallMapper.from_api_payload`` on decoded payloads
+- ``iterate``: ``RollCallIterator`` over both sessions (fetch + map)
+- ``filter``: ``VotesFilter`` finding one member in every roll call
+- ``export``: ``CsvExporter`` writing every member vote (full-chamber rows)
+- ``export_command``: ``ExportNotVotingCommand.run`` for one member
+
+Each stage reports throughput, per-item latency percentiles and peak traced
+memory as JSON (stdout, or ``--out``). ``--baseline`` compares against an
+earlier result file.
+
+    python benchmarks/pipeline.py --out results.json
+    python benchmarks/pipeline.py --baseline results.json --stages map filter
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from unittest import mock
+
+from congress_api.commands import export_command
+from congress_api.commands.export_command import ExportNotVotingCommand
+from congress_api.domain.models import RollCall
+from congress_api.mappers.roll_call_mapper import RollCallMapper
+from congress_api.services.api_client import CongressApiClient
+from congress_api.services.exporter import CHAMBER_FIELDNAMES, CsvExporter
+from congress_api.services.roll_call_iterator import RollCallIterator
+from congress_api.services.votes_filter import VotesFilter, iter_chamber_values
+
+from payloads import Payloads, payload_transport, recorded_congress, synthetic_congress
+
+
+CONGRESS = 118
+PERCENTILES = (50, 90, 99)
+
+
+@dataclass
+class StageRun:
+    items: int
+    unit: str
+    # Per-item seconds; a single entry when only the whole run is timed
+    latencies: List[float] = field(default_factory=list)
+
+
+@dataclass
+class Workload:
+    payloads: Payloads
+    roll_calls: List[RollCall]
+    member: Dict[str, str]
+    scratch_dir: Path
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _client(payloads: Payloads) -> CongressApiClient:
+    return CongressApiClient(api_key="benchmark", transport=payload_transport(payloads))
+
+
+def bench_fetch(workload: Workload) -> StageRun:
+    client = _client(workload.payloads)
+    latencies = []
+    for session_number, number in workload.payloads:
+        start = time.perf_counter()
+        client.get_member_votes(CONGRESS, session_number, number)
+        latencies.append(time.perf_counter() - start)
+    return StageRun(items=len(latencies), unit="roll_calls", latencies=latencies)
+
+
+def bench_map(workload: Workload) -> StageRun:
+    latencies = []
+    for (_, number), raw in workload.payloads.items():
+        payload = json.loads(raw)
+        start = time.perf_counter()
+        RollCallMapper.from_api_payload(CONGRESS, number, payload)
+        latencies.append(time.perf_counter() - start)
+    return StageRun(items=len(latencies), unit="roll_calls", latencies=latencies)
+
+
+def bench_iterate(workload: Workload) -> StageRun:
+    latencies = []
+    iterator = iter(RollCallIterator(client=_client(workload.payloads), congress_number=CONGRESS))
+    while True:
+        start = time.perf_counter()
+        if next(iterator, None) is None:
+            break
+        latencies.append(time.perf_counter() - start)
+    return StageRun(items=len(latencies), unit="roll_calls", latencies=latencies)
+
+
+def bench_filter(workload: Workload) -> StageRun:
+    vf = VotesFilter(workload.member["first"], workload.member["last"])
+    latencies = []
+    for roll_call in workload.roll_calls:
+        start = time.perf_counter()
+        vf.matching(roll_call)
+        latencies.append(time.perf_counter() - start)
+    return StageRun(items=len(latencies), unit="roll_calls", latencies=latencies)
+
+
+def bench_export(workload: Workload) -> StageRun:
+    exporter = CsvExporter(outputs_dir=workload.scratch_dir)
+    latencies = []
+    with exporter.open_rows(workload.scratch_dir / "chamber.csv", CHAMBER_FIELDNAMES) as writer:
+        for roll_call in workload.roll_calls:
+            start = time.perf_counter()
+            writer.write_value_rows(iter_chamber_values((roll_call,)))
+            latencies.append(time.perf_counter() - start)
+    rows = sum(len(rc.members) for rc in workload.roll_calls)
+    return StageRun(items=rows, unit="rows", latencies=latencies)
+
+
+def bench_export_command(workload: Workload) -> StageRun:
+    def build_client(api_key: str, **kwargs) -> CongressApiClient:
+        return _client(workload.payloads)
+
+    command = ExportNotVotingCommand(
+        member_first=workload.member["first"],
+        member_last=workload.member["last"],
+        congress_number=CONGRESS,
+        outputs_dir=workload.scratch_dir,
+        api_key="benchmark",
+    )
+    with mock.patch.object(export_command, "_build_client", build_client):
+        start = time.perf_counter()
+        command.run()
+        seconds = time.perf_counter() - start
+    return StageRun(items=len(workload.payloads), unit="roll_calls", latencies=[seconds])
+
+
+STAGES: Dict[str, Callable[[Workload], StageRun]] = {
+    "fetch": bench_fetch,
+    "map": bench_map,
+    "iterate": bench_iterate,
+    "filter": bench_filter,
+    "export": bench_export,
+    "export_command": bench_export_command,
+}
+
+
+def run_stage(bench: Callable[[Workload], StageRun], workload: Workload, repeat: int) -> Dict:
+    """Best-of-``repeat`` throughput, latencies over every repeat, then one traced run for peak memory."""
+    runs = [bench(workload) for _ in range(repeat)]
+    seconds = min(sum(run.latencies) for run in runs)
+    latencies = sorted(latency for run in runs for latency in run.latencies)
+    tracemalloc.start()
+    try:
+        bench(workload)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "items": runs[0].items,
+        "unit": runs[0].unit,
+        "seconds": round(seconds, 6),
+        "throughput_per_s": round(runs[0].items / seconds, 1) if seconds else None,
+        "latency_ms": {
+            **{f"p{pct}": round(percentile(latencies, pct) * 1000, 4) for pct in PERCENTILES},
+            "max": round(latencies[-1] * 1000, 4),
+        },
+        "peak_memory_bytes": peak,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=Path(__file__).parent, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def compare(results: Dict, baseline: Dict) -> List[str]:
+    """One line per stage present in both: throughput and peak memory relative to ``baseline``."""
+    lines = []
+    for name, stage in results["stages"].items():
+        old = baseline.get("stages", {}).get(name)
+        if not old or not old.get("throughput_per_s") or not stage["throughput_per_s"]:
+            continue
+        speed = stage["throughput_per_s"] / old["throughput_per_s"]
+        memory = stage["peak_memory_bytes"] / old["peak_memory_bytes"] if old["peak_memory_bytes"] else float("nan")
+        lines.append(f"{name:>15}: throughput {speed:6.2f}x, p50 {stage['latency_ms']['p50']:.3f} ms "
+                     f"(was {old['latency_ms']['p50']:.3f}), peak memory {memory:6.2f}x")
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--roll-calls", type=int, default=1400)
+    parser.add_argument("--members", type=int, default=435)
+    parser.add_argument("--recorded", type=Path, metavar="CACHE", help="Use responses saved in this response cache.")
+    parser.add_argument("--congress", type=int, default=CONGRESS, help="Congress to read from --recorded.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), default=list(STAGES))
+    parser.add_argument("--out", type=Path, help="Write the JSON results here instead of stdout.")
+    parser.add_argument("--baseline", type=Path, help="Earlier JSON results to compare against (printed to stderr).")
+    args = parser.parse_args()
+
+    if args.recorded is not None:
+        payloads = recorded_congress(args.recorded, args.congress)
+        source = {"recorded": str(args.recorded), "congress": args.congress}
+    else:
+        payloads = synthetic_congress(args.roll_calls, args.members)
+        source = {"synthetic": True, "roll_calls": args.roll_calls, "members": args.members}
+    roll_calls = [
+        RollCallMapper.from_api_payload(CONGRESS, number, json.loads(raw)) for (_, number), raw in payloads.items()
+    ]
+    # A member in the middle of the roster, present on the first roll call
+    sample = roll_calls[0].members[len(roll_calls[0].members) // 2]
+    member = {"first": sample.first_name, "last": sample.last_name}
+
+    results = {
+        "benchmark": "pipeline",
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "workload": {**source, "payloads": len(payloads), "member_votes": sum(len(rc.members) for rc in roll_calls)},
+        "repeat": args.repeat,
+        "stages": {},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        workload = Workload(payloads=payloads, roll_calls=roll_calls, member=member, scratch_dir=Path(tmp))
+        for name in args.stages:
+            print(f"[INFO] Running {name}", file=sys.stderr)
+            results["stages"][name] = run_stage(STAGES[name], workload, args.repeat)
+
+    text = json.dumps(results, indent=2)
+    if args.out is not None:
+        args.out.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    if args.baseline is not None:
+        for line in compare(results, json.loads(args.baseline.read_text(encoding="utf-8"))):
+            print(line, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Rows per second written by the full-chamber CSV export.
+
+Writes every member vote of synthetic roll calls (1,400 × 435 ≈ 609k rows by
+default) twice: through the previous path, dict rows and ``csv.DictWriter``
+on a default-buffered file, and through the current one, value tuples passed
+to ``CsvExporter.write_value_rows``. Row building is included in the timings.
+
+    python benchmarks/writer_throughput.py --roll-calls 1400 --members 435
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from congress_api.domain.models import RollCall
+from congress_api.mappers.roll_call_mapper import RollCallMapper
+from congress_api.services.exporter import CHAMBER_FIELDNAMES, CsvExporter
+from congress_api.services.votes_filter import iter_chamber_rows, iter_chamber_values
+
+from payloads import synthetic_payloads
+
+
+def write_dicts(path: Path, roll_calls: List[RollCall]) -> None:
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CHAMBER_FIELDNAMES)
+        writer.writeheader()
+        for row in iter_chamber_rows(roll_calls):
+            writer.writerow(row)
+
+
+def write_values(path: Path, roll_calls: List[RollCall]) -> None:
+    CsvExporter().write_value_rows(path, iter_chamber_values(roll_calls), fieldnames=CHAMBER_FIELDNAMES)
+
+
+def best_seconds(write: Callable[[Path, List[RollCall]], None], path: Path, roll_calls: List[RollCall], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        write(path, roll_calls)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--roll-calls", type=int, default=1400)
+    parser.add_argument("--members", type=int, default=435)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    roll_calls = [
+        RollCallMapper.from_api_payload(118, number, json.loads(raw))
+        for number, raw in enumerate(synthetic_payloads(args.roll_calls, args.members), start=1)
+    ]
+    rows = sum(len(rc.members) for rc in roll_calls)
+    with tempfile.TemporaryDirectory() as tmp:
+        before_path, after_path = Path(tmp) / "dicts.csv", Path(tmp) / "values.csv"
+        before = best_seconds(write_dicts, before_path, roll_calls, args.repeat)
+        after = best_seconds(write_values, after_path, roll_calls, args.repeat)
+        assert before_path.read_bytes() == after_path.read_bytes()
+    print(f"rows: {rows}")
+    print(f"dict rows + DictWriter: {rows / before:12,.0f} rows/s")
+    print(f"value tuples + writerows: {rows / after:10,.0f} rows/s ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,31 +6,121 @@ objects. Keeps orchestration and business logic separate from the CLI layer.
 from __future__ import annotations
 
 import argparse
-from dataclasses import dataclass
-from typing import List, Optional
+import csv
+import logging
+import os
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from .commands.export_command import (
+    CHAMBER_LAYOUTS,
+    ExportChamberCommand,
+    ExportMembersCommand,
     ExportNotVotingCommand,
     SingleRollCallExportCommand,
 )
+from .repositories.sqlite_repository import SqliteVotesRepository
+from .services.checkpoint import DEFAULT_CHECKPOINT_DIR
+from .services.metrics import Metrics
+from .services.profiling import DEFAULT_PROFILE_DIR, RunProfiler
+from .services.rate_limiter import DEFAULT_REQUESTS_PER_HOUR
+from .services.response_cache import DEFAULT_CACHE_PATH
+from .services.writers import OUTPUT_FORMATS, STDOUT
 
 
 @dataclass
 class CliArgs:
     """Validated CLI arguments for this program.
 
-    - first: Member first name
-    - last: Member last name
+    - first: Member first name (optional when --member or --roster is used)
+    - last: Member last name (optional when --member or --roster is used)
     - congress: Two-year Congress number
     - session_year: Optional session year within the Congress (1 or 2)
     - rollcall: Optional roll call number, used only with a session year
+    - workers: Number of roll calls fetched concurrently during a full export
+    - discover: Find each session's last roll call before scanning
+    - cache_path: Response cache file, or None when caching is disabled
+    - refresh_cache: Refetch every roll call, updating the cache
+    - requests_per_hour: Hourly request quota the client paces itself to
+    - db_path: Optional SQLite database that fetched roll calls are saved to
+    - sync: Only fetch roll calls newer than those already in the database
+    - from_db_path: Optional SQLite database to export from instead of the API
+    - resume: Continue an interrupted single-member export from its checkpoint
+    - members: Additional (first, last) members from repeated --member flags
+    - bioguide_ids: Members given directly by bioguide ID (no name matching)
+    - roster: Optional CSV file of additional members, one "first,last" per row
+    - combined: Write all members to one CSV instead of one CSV per member
+    - all_members: Export every member's vote on every roll call
+    - layout: Full-chamber layout, "long" (row per vote) or "wide" (matrix)
+    - output_format: Output format, "csv", "csv.gz" or "ndjson"
+    - output_path: Optional output file, or "-" to stream to stdout
+    - metrics_out: Optional JSON file for the run's metrics report
+    - quiet: Suppress progress logging
+    - profile: Capture a cProfile CPU profile of the run
+    - profile_memory: Capture the run's top memory allocations with tracemalloc
+    - profile_dir: Directory profiles and per-stage timings are written to
     """
 
-    first: str
-    last: str
+    first: Optional[str]
+    last: Optional[str]
     congress: int
     session_year: Optional[int]
     rollcall: Optional[int]
+    workers: int = 1
+    discover: bool = False
+    cache_path: Optional[Path] = DEFAULT_CACHE_PATH
+    refresh_cache: bool = False
+    requests_per_hour: int = DEFAULT_REQUESTS_PER_HOUR
+    db_path: Optional[Path] = None
+    sync: bool = False
+    from_db_path: Optional[Path] = None
+    resume: bool = False
+    members: List[Tuple[str, str]] = field(default_factory=list)
+    bioguide_ids: List[str] = field(default_factory=list)
+    roster: Optional[Path] = None
+    combined: bool = False
+    all_members: bool = False
+    layout: str = "long"
+    output_format: str = "csv"
+    output_path: Optional[Path] = None
+    metrics_out: Optional[Path] = None
+    quiet: bool = False
+    profile: bool = False
+    profile_memory: bool = False
+    profile_dir: Path = DEFAULT_PROFILE_DIR
+
+
+def _configure_logging(quiet: bool) -> logging.Handler:
+    """Send the package's log records (progress lines) to stderr, or only warnings with ``quiet``.
+
+    Returns the handler so ``main`` can remove it when the run ends.
+    """
+    logger = logging.getLogger("congress_api")
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+    logger.addHandler(handler)
+    logger.propagate = False
+    logger.setLevel(logging.WARNING if quiet else logging.INFO)
+    return handler
+
+
+def _check_writable_dir(directory: Path, option: str) -> None:
+    """Create ``directory`` if needed and fail before the run unless files can be written there."""
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError as exc:
+        raise ValueError(f"{option}: cannot create {directory}: {exc.strerror or exc}") from exc
+    if not os.access(directory, os.W_OK):
+        raise ValueError(f"{option}: {directory} is not writable")
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return number
 
 
 def parse_args(argv: Optional[List[str]] = None) -> CliArgs:
@@ -44,8 +134,45 @@ def parse_args(argv: Optional[List[str]] = None) -> CliArgs:
             "specific member in a given two-year Congress term. Writes a CSV to outputs/."
         )
     )
-    parser.add_argument("--first", required=True, help="Member first name")
-    parser.add_argument("--last", required=True, help="Member last name")
+    parser.add_argument("--first", help="Member first name")
+    parser.add_argument("--last", help="Member last name")
+    parser.add_argument(
+        "--member",
+        nargs=2,
+        action="append",
+        default=[],
+        metavar=("FIRST", "LAST"),
+        help="Add a member to export; repeat to export many members from a single scan.",
+    )
+    parser.add_argument(
+        "--bioguide",
+        action="append",
+        default=[],
+        metavar="ID",
+        help="Add a member by bioguide ID (e.g. A000148), skipping name matching; repeatable.",
+    )
+    parser.add_argument(
+        "--roster",
+        type=Path,
+        help='CSV file of members to export, one "first,last" per row (a header row is optional).',
+    )
+    parser.add_argument(
+        "--combined",
+        action="store_true",
+        help="With several members, write a single CSV instead of one CSV per member.",
+    )
+    parser.add_argument(
+        "--all-members",
+        action="store_true",
+        help="Export every member's vote on every roll call in one pass.",
+    )
+    parser.add_argument(
+        "--layout",
+        choices=CHAMBER_LAYOUTS,
+        default="long",
+        help="With --all-members: 'long' writes one row per member vote, 'wide' one row per member "
+        "with a column per roll call (default: long).",
+    )
     parser.add_argument(
         "--congress", required=True, type=int, help="Congress number (e.g., 118)"
     )
@@ -60,55 +187,314 @@ def parse_args(argv: Optional[List[str]] = None) -> CliArgs:
         type=int,
         help="Roll call number to export a single vote. Requires --session.",
     )
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="Number of roll calls to fetch concurrently during a full export (default: 1).",
+    )
+    parser.add_argument(
+        "--discover",
+        action="store_true",
+        help="Locate each session's last roll call up front (a few probe requests) and scan that exact range.",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=DEFAULT_CACHE_PATH,
+        help=f"Response cache file (default: {DEFAULT_CACHE_PATH}).",
+    )
+    cache_mode = parser.add_mutually_exclusive_group()
+    cache_mode.add_argument(
+        "--no-cache", action="store_true", help="Do not read or write the response cache."
+    )
+    cache_mode.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached responses and refetch every roll call, updating the cache.",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=_positive_int,
+        default=DEFAULT_REQUESTS_PER_HOUR,
+        metavar="REQUESTS_PER_HOUR",
+        help=f"Hourly request quota to pace requests to (default: {DEFAULT_REQUESTS_PER_HOUR}).",
+    )
+    parser.add_argument(
+        "--db",
+        type=Path,
+        help="SQLite database to save every fetched roll call to.",
+    )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Requires --db. Only fetch roll calls newer than the latest stored per session.",
+    )
+    parser.add_argument(
+        "--from-db",
+        type=Path,
+        help="Export from a SQLite database saved with --db instead of the API; needs no API key.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted single-member export from its checkpoint and complete the same CSV.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="csv",
+        help="Output format: csv, gzip-compressed csv.gz, or ndjson (one JSON object per line). Default: csv.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        metavar="PATH",
+        help="Write to this file instead of a timestamped file in outputs/; use - to stream to stdout.",
+    )
+    parser.add_argument(
+        "--metrics-out",
+        type=Path,
+        metavar="PATH",
+        help="Write a JSON metrics report (request latency, status mix, bytes, mapper/filter time, rows) here.",
+    )
+    parser.add_argument("--quiet", action="store_true", help="Do not log scan progress.")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write a cProfile CPU profile and per-stage timings (key load, fetch, map, filter, write) "
+        "to the profile directory.",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Write the top memory allocations (tracemalloc) and per-stage timings to the profile directory.",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=DEFAULT_PROFILE_DIR,
+        help=f"Directory for --profile and --profile-memory output (default: {DEFAULT_PROFILE_DIR}).",
+    )
     ns = parser.parse_args(argv)
     return CliArgs(
-        first=ns.first.strip(),
-        last=ns.last.strip(),
+        first=ns.first.strip() if ns.first is not None else None,
+        last=ns.last.strip() if ns.last is not None else None,
         congress=ns.congress,
         session_year=ns.session,
         rollcall=ns.rollcall,
+        workers=ns.workers,
+        discover=ns.discover,
+        cache_path=None if ns.no_cache else ns.cache,
+        refresh_cache=ns.refresh,
+        requests_per_hour=ns.rate_limit,
+        db_path=ns.db,
+        sync=ns.sync,
+        from_db_path=ns.from_db,
+        resume=ns.resume,
+        members=[(first.strip(), last.strip()) for first, last in ns.member],
+        bioguide_ids=[bioguide_id.strip() for bioguide_id in ns.bioguide if bioguide_id.strip()],
+        roster=ns.roster,
+        combined=ns.combined,
+        all_members=ns.all_members,
+        layout=ns.layout,
+        output_format=ns.format,
+        output_path=ns.output,
+        metrics_out=ns.metrics_out,
+        quiet=ns.quiet,
+        profile=ns.profile,
+        profile_memory=ns.profile_memory,
+        profile_dir=ns.profile_dir,
     )
 
 
+def read_roster(path: Path) -> List[Tuple[str, str]]:
+    """Read (first, last) pairs from a roster CSV.
+
+    Skips blank rows, rows starting with "#", and a leading "first,last" header.
+    """
+    members: List[Tuple[str, str]] = []
+    with path.open("r", newline="", encoding="utf-8") as f:
+        for line_number, row in enumerate(csv.reader(f), start=1):
+            cells = [cell.strip() for cell in row]
+            if not any(cells) or cells[0].startswith("#"):
+                continue
+            if len(cells) < 2 or not cells[0] or not cells[1]:
+                raise ValueError(f"{path}:{line_number}: expected 'first,last'")
+            if line_number == 1 and (cells[0].lower(), cells[1].lower()) == ("first", "last"):
+                continue
+            members.append((cells[0], cells[1]))
+    return members
+
+
+def _output_options(args: CliArgs) -> Dict[str, Any]:
+    """Keyword arguments shared by every command that writes output."""
+    return {"output_format": args.output_format, "output_path": args.output_path}
+
+
+def _scan_options(args: CliArgs) -> Dict[str, Any]:
+    """Keyword arguments shared by every command that scans a whole Congress."""
+    if args.from_db_path is not None:
+        return {
+            "repository": SqliteVotesRepository(db_path=args.from_db_path, read_only=True),
+            "offline": True,
+            **_output_options(args),
+        }
+    return {
+        "workers": args.workers,
+        "discover": args.discover,
+        "cache_path": args.cache_path,
+        "refresh_cache": args.refresh_cache,
+        "requests_per_hour": args.requests_per_hour,
+        "repository": SqliteVotesRepository(db_path=args.db_path) if args.db_path else None,
+        "incremental": args.sync,
+        **_output_options(args),
+    }
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     """Program entry point.
 
-    Validates coupled optional arguments and dispatches to either the full
-    export command (covers all roll calls) or the single-roll-call command.
+    Validates coupled optional arguments and dispatches to the full export
+    command (covers all roll calls), the multi-member export command, the
+    full-chamber export command, or the single-roll-call command.
     Returns a shell-compatible exit code.
     """
     args = parse_args(argv)
+    handler = _configure_logging(args.quiet)
+    try:
+        return _run(args)
+    finally:
+        logger = logging.getLogger("congress_api")
+        logger.removeHandler(handler)
+        logger.propagate = True
+
+
+def _run(args: CliArgs) -> int:
+    """Run the export described by ``args`` and return its exit code."""
+    # Keep stdout clean for the data when streaming it
+    status_stream = sys.stderr if args.output_path == STDOUT else sys.stdout
+    profiler = None
+    if args.profile or args.profile_memory:
+        profiler = RunProfiler(args.profile_dir, cpu=args.profile, memory=args.profile_memory)
+    # Stage timings are read from the metrics, so profiling turns them on too
+    metrics = Metrics() if args.metrics_out is not None or profiler is not None else None
+    try:
+        if args.metrics_out is not None:
+            _check_writable_dir(args.metrics_out.parent, "--metrics-out")
+        if profiler is not None:
+            _check_writable_dir(args.profile_dir, "--profile-dir")
+            profiler.start()
+    except ValueError as exc:
+        print(f"[ERROR] {exc}", file=status_stream)
+        return 2
+    exit_code = 0
     try:
         # Validate coupled optional args: if one provided, both must be
         if (args.rollcall is None) ^ (args.session_year is None):
             raise ValueError(
                 "--rollcall requires --session, and --session requires --rollcall"
             )
+        if args.sync and args.db_path is None:
+            raise ValueError("--sync requires --db")
+        if args.from_db_path is not None:
+            if args.db_path is not None:
+                raise ValueError("--from-db reads a database; it cannot be combined with --db or --sync")
+            if not args.from_db_path.is_file():
+                raise ValueError(f"Database not found: {args.from_db_path}")
+        if (args.first is None) ^ (args.last is None):
+            raise ValueError("--first and --last must be given together")
 
-        if args.rollcall is not None:
+        members = list(args.members)
+        if args.roster is not None:
+            members.extend(read_roster(args.roster))
+        bioguide_ids = list(args.bioguide_ids)
+        has_named = args.first is not None or bool(members)
+        if args.all_members and (has_named or bioguide_ids):
+            raise ValueError("--all-members cannot be combined with --first/--last, --member, --roster or --bioguide")
+        if not has_named and not bioguide_ids and not args.all_members:
+            raise ValueError("Provide --first and --last, --member, --roster, --bioguide, or --all-members")
+        target_count = (args.first is not None) + len(members) + len(bioguide_ids)
+        if args.resume and (
+            args.all_members or members or target_count > 1 or args.rollcall is not None
+            or args.sync or args.from_db_path is not None
+        ):
+            raise ValueError("--resume applies to a single-member export of a whole Congress from the API")
+        if args.resume and (args.output_path == STDOUT or args.output_format == "csv.gz"):
+            raise ValueError("--resume cannot continue compressed output or output streamed to stdout")
+
+        if args.all_members:
+            if args.rollcall is not None:
+                raise ValueError("--all-members exports a whole Congress and cannot be used with --rollcall")
+            output_path = ExportChamberCommand(
+                congress_number=args.congress,
+                layout=args.layout,
+                metrics=metrics,
+                **_scan_options(args),
+            ).run()
+        elif args.rollcall is not None:
+            if target_count != 1 or members:
+                raise ValueError("--rollcall exports a single member given by --first and --last or --bioguide")
             output_path = SingleRollCallExportCommand(
-                member_first=args.first,
-                member_last=args.last,
+                member_first=args.first or "",
+                member_last=args.last or "",
                 congress_number=args.congress,
                 session_year=args.session_year,
                 roll_call_number=args.rollcall,
+                cache_path=args.cache_path,
+                refresh_cache=args.refresh_cache,
+                requests_per_hour=args.requests_per_hour,
+                bioguide_id=bioguide_ids[0] if bioguide_ids else None,
+                repository=SqliteVotesRepository(db_path=args.from_db_path, read_only=True) if args.from_db_path else None,
+                metrics=metrics,
+                **_output_options(args),
+            ).run()
+        elif members or target_count > 1:
+            if args.first is not None:
+                members.insert(0, (args.first, args.last))
+            output_paths = ExportMembersCommand(
+                members=members,
+                bioguide_ids=bioguide_ids,
+                congress_number=args.congress,
+                combined=args.combined,
+                metrics=metrics,
+                **_scan_options(args),
             ).run()
+            output_path = ", ".join(str(path) for path in output_paths)
         else:
             output_path = ExportNotVotingCommand(
-                member_first=args.first,
-                member_last=args.last,
+                member_first=args.first or "",
+                member_last=args.last or "",
                 congress_number=args.congress,
                 api_key=None,
+                bioguide_id=bioguide_ids[0] if bioguide_ids else None,
+                checkpoint_dir=DEFAULT_CHECKPOINT_DIR,
+                resume=args.resume,
+                metrics=metrics,
+                **_scan_options(args),
             ).run()
+        print(f"[OK] Wrote results to {output_path}", file=status_stream)
     except Exception as exc:
-        print(f"[ERROR] {exc}")
-        return 2
+        print(f"[ERROR] {exc}", file=status_stream)
+        exit_code = 2
     except KeyboardInterrupt:
-        print("[INFO] Aborted by user")
-        return 130
+        print("[INFO] Aborted by user", file=status_stream)
+        exit_code = 130
 
-    print(f"[OK] Wrote results to {output_path}")
-    return 0
+    # Also written for failed or interrupted runs, which is when they help most
+    if profiler is not None:
+        try:
+            profiler.stop(metrics)
+        except OSError as exc:
+            print(f"[ERROR] Could not write profile: {exc}", file=status_stream)
+            exit_code = exit_code or 2
+    if args.metrics_out is not None:
+        try:
+            metrics.write_json(args.metrics_out)
+        except OSError as exc:
+            print(f"[ERROR] Could not write metrics report: {exc}", file=status_stream)
+            exit_code = exit_code or 2
+    return exit_code
 
 
 if __name__ == "__main__":
@@ -1,90 +1,504 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from dotenv import load_dotenv, find_dotenv
+from dotenv import dotenv_values, load_dotenv, find_dotenv
 
-from congress_api.services.api_client import CongressApiClient
-from congress_api.services.exporter import CsvExporter
+from congress_api.services.api_client import BASE_URL_ENV, DEFAULT_BASE_URL, CongressApiClient
+from congress_api.services.rate_limiter import DEFAULT_REQUESTS_PER_HOUR, RateLimiter, RateLimitError
+from congress_api.services.checkpoint import CHECKPOINT_EVERY, CheckpointStore, ExportCheckpoint
+from congress_api.services.exporter import CHAMBER_FIELDNAMES, CsvExporter
+from congress_api.services.metrics import Metrics
+from congress_api.services.response_cache import ResponseCache
 from congress_api.services.roll_call_iterator import RollCallIterator
-from congress_api.services.votes_filter import VotesFilter
+from congress_api.services.transport import DEFAULT_POOL_SIZE
+from congress_api.services.vote_matrix import VoteMatrix
+from congress_api.services.writers import RowWriter, is_appendable
+from congress_api.services.votes_filter import MultiMemberVotesFilter, VotesFilter, iter_chamber_values
 from congress_api.repositories.base import VotesRepository
-from congress_api.mappers.roll_call_mapper import RollCallMapper
+from congress_api.mappers.roll_call_mapper import MemberPredicate, RollCallMapper
+from congress_api.domain.models import RollCall
+
+
+CHAMBER_LAYOUTS = ("long", "wide")
+
+# Roll calls buffered between repository saves while an export streams
+PERSIST_BATCH_SIZE = 100
+
+
+def _build_client(
+    api_key: str,
+    *,
+    workers: int = 1,
+    cache_path: Optional[Path] = None,
+    refresh_cache: bool = False,
+    requests_per_hour: int = DEFAULT_REQUESTS_PER_HOUR,
+    metrics: Optional[Metrics] = None,
+) -> CongressApiClient:
+    """Create an API client sized for `workers`, paced to the hourly quota and backed by the optional response cache.
+
+    The base URL comes from ``CONGRESS_API_BASE_URL`` when set (e.g. a local
+    replay server). The response cache is then bypassed: its entries are not
+    keyed by server, so it must neither answer for nor store another server's
+    responses.
+    """
+    base_url = resolve_base_url()
+    cache = ResponseCache(cache_path) if cache_path is not None and base_url is None else None
+    return CongressApiClient(
+        api_key=api_key,
+        base_url=base_url or DEFAULT_BASE_URL,
+        pool_size=max(DEFAULT_POOL_SIZE, workers),
+        cache=cache,
+        refresh_cache=refresh_cache,
+        rate_limiter=RateLimiter(requests_per_hour),
+        metrics=metrics,
+    )
+
+
+def resolve_base_url() -> Optional[str]:
+    """The ``CONGRESS_API_BASE_URL`` override from the environment or the nearest ``.env``, or None."""
+    base_url = os.getenv(BASE_URL_ENV)
+    if not base_url:
+        dotenv_path = find_dotenv(usecwd=True)
+        if dotenv_path:
+            base_url = dotenv_values(dotenv_path).get(BASE_URL_ENV)
+    return base_url or None
+
+
+def load_api_key(metrics: Optional[Metrics] = None) -> Optional[str]:
+    """Return ``CONGRESS_API_KEY`` from the environment or the nearest ``.env``, or None.
+
+    With ``metrics`` the lookup is timed as ``key_load_seconds``.
+    """
+    if metrics is None:
+        return _read_api_key()
+    with metrics.timer("key_load_seconds"):
+        return _read_api_key()
+
+
+def _read_api_key() -> Optional[str]:
+    # 1) Already in environment
+    api_key = os.getenv("CONGRESS_API_KEY")
+    if api_key:
+        return api_key
+    # 2) Load from nearest .env (current working directory preferred)
+    dotenv_path = find_dotenv(usecwd=True)
+    if dotenv_path:
+        load_dotenv(dotenv_path=dotenv_path, override=False)
+        api_key = os.getenv("CONGRESS_API_KEY")
+        if api_key:
+            return api_key
+    # 3) Standard load (python-dotenv default search)
+    load_dotenv(override=False)
+    api_key = os.getenv("CONGRESS_API_KEY")
+    if api_key:
+        return api_key
+    # 4) Manual fallback: read .env in CWD if present
+    env_file = Path.cwd() / ".env"
+    if env_file.exists():
+        try:
+            for line in env_file.read_text(encoding="utf-8").splitlines():
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if line.startswith("CONGRESS_API_KEY="):
+                    _, value = line.split("=", 1)
+                    value = value.strip().strip('"').strip("'")
+                    if value:
+                        os.environ["CONGRESS_API_KEY"] = value
+                        return value
+        except Exception:
+            pass
+    return None
+
+
+def _file_label(member_first: str, member_last: str, bioguide_id: Optional[str]) -> Tuple[str, str]:
+    """Name parts for a member's output file, falling back to the bioguide ID."""
+    if member_first or member_last:
+        return member_first, member_last
+    return bioguide_id or "", ""
+
+
+def _persist_in_batches(
+    roll_calls: Iterable[RollCall],
+    repository: VotesRepository,
+    batch_size: int,
+    metrics: Optional[Metrics] = None,
+) -> Iterator[RollCall]:
+    """Pass roll calls through while saving them to ``repository`` every ``batch_size``.
+
+    Only one batch is held at a time, and whatever was fetched is saved even if
+    the scan or the consumer stops early (error, Ctrl-C).
+    """
+
+    def save(pending: List[RollCall]) -> None:
+        if metrics is None:
+            repository.save_roll_calls(pending)
+            return
+        with metrics.timer("persist_seconds"):
+            repository.save_roll_calls(pending)
+        metrics.increment("roll_calls_persisted", len(pending))
+
+    batch: List[RollCall] = []
+    try:
+        for roll_call in roll_calls:
+            batch.append(roll_call)
+            if len(batch) >= batch_size:
+                pending, batch = batch, []
+                save(pending)
+            yield roll_call
+    finally:
+        if batch:
+            pending, batch = batch, []
+            save(pending)
+
+
+def _track_completed(roll_calls: Iterable[RollCall], on_complete: Callable[[], None]) -> Iterator[RollCall]:
+    """Yield roll calls, reporting each one as complete when the consumer asks for the next."""
+    for roll_call in roll_calls:
+        yield roll_call
+        # Runs when the consumer asks for the next roll call: it is done with this one
+        on_complete()
+
+
+class _RollCallScan:
+    """Shared roll call sourcing for commands that scan a whole Congress.
+
+    Expects the host dataclass to define ``congress_number``, ``repository``,
+    ``api_key``, ``workers``, ``discover``, ``cache_path``, ``refresh_cache``,
+    ``incremental``, ``requests_per_hour``, ``offline``, ``outputs_dir``,
+    ``output_format``, ``output_path`` and ``metrics``.
+
+    With ``offline=True`` roll calls are read from the repository instead of the
+    API, so no API key or network access is needed.
+    """
+
+    # The API scan behind the last ``_roll_calls``; None for offline exports
+    _scan: Optional[RollCallIterator] = None
+
+    def _roll_calls(
+        self,
+        member_filter: Optional[MemberPredicate] = None,
+        member_query: Optional[Dict[str, str]] = None,
+        resume_after: Optional[Tuple[int, int]] = None,
+    ) -> Iterable[RollCall]:
+        """Return the roll calls to export.
+
+        ``member_filter`` trims each roll call to the members the export needs;
+        it is ignored when a repository is attached, which stores every member.
+        Offline, ``member_query`` (``bioguide_id=`` or ``last_name=``) reads only
+        the roll calls holding that member through the repository's indexes.
+        ``resume_after`` is a (session, roll call) already exported; the scan
+        continues right after it.
+        """
+        if (self.incremental or self.offline) and self.repository is None:
+            raise ValueError("Incremental sync and offline exports require a repository")
+        if self.offline:
+            if self.incremental:
+                raise ValueError("Incremental sync fetches from the API and cannot run offline")
+            if member_query:
+                return self.repository.iter_member_roll_calls(self.congress_number, **member_query)
+            return self.repository.iter_roll_calls(self.congress_number)
+        api_key = self.api_key or load_api_key(self.metrics)
+        if not api_key:
+            raise RuntimeError("CONGRESS_API_KEY is not set in environment or .env file")
+
+        client = _build_client(
+            api_key,
+            workers=self.workers,
+            cache_path=self.cache_path,
+            refresh_cache=self.refresh_cache,
+            requests_per_hour=self.requests_per_hour,
+            metrics=self.metrics,
+        )
+        start_after = self._high_water_marks() if self.incremental else {}
+        sessions: Tuple[int, ...] = (1, 2)
+        if resume_after is not None:
+            session_year, roll_call = resume_after
+            start_after[session_year] = max(start_after.get(session_year, 0), roll_call)
+            sessions = tuple(s for s in sessions if s >= session_year)
+        iterator = RollCallIterator(
+            client=client,
+            congress_number=self.congress_number,
+            workers=self.workers,
+            discover=self.discover,
+            start_after=start_after,
+            member_filter=member_filter if self.repository is None else None,
+            sessions=sessions,
+            metrics=self.metrics,
+        )
+        self._scan = iterator
+
+        # Optionally persist roll calls as they stream past if a repository is provided
+        if self.repository is not None:
+            return _persist_in_batches(iterator, self.repository, PERSIST_BATCH_SIZE, self.metrics)
+        return iterator
+
+    def _high_water_marks(self) -> Dict[int, int]:
+        return {
+            session_year: self.repository.high_water_mark(self.congress_number, session_year)
+            for session_year in (1, 2)
+        }
 
 
 @dataclass
-class ExportNotVotingCommand:
+class ExportNotVotingCommand(_RollCallScan):
+    """Export every vote cast by one member across a Congress to CSV.
+
+    With ``incremental=True`` (requires a repository) only roll calls newer than
+    the repository's per-session high-water marks are fetched and saved, and the
+    CSV holds the member's rows from those new roll calls.
+
+    Pass ``bioguide_id`` to match on the member's ID alone; the name fields may
+    then be left empty and only label the output file.
+
+    With ``checkpoint_dir`` set, progress is checkpointed while the scan runs
+    and removed when it finishes; ``resume=True`` picks up an interrupted
+    export's checkpoint and completes the same output file.
+    """
+
     member_first: str
     member_last: str
     congress_number: int
     outputs_dir: Optional[Path] = None
+    output_format: str = "csv"
+    output_path: Optional[Path] = None
     repository: Optional[VotesRepository] = None
     api_key: Optional[str] = None
+    workers: int = 1
+    discover: bool = False
+    cache_path: Optional[Path] = None
+    refresh_cache: bool = False
+    incremental: bool = False
+    requests_per_hour: int = DEFAULT_REQUESTS_PER_HOUR
+    offline: bool = False
+    metrics: Optional[Metrics] = None
+    bioguide_id: Optional[str] = None
+    checkpoint_dir: Optional[Path] = None
+    resume: bool = False
 
     def run(self) -> Path:
-        api_key = self.api_key or self._load_api_key()
-        if not api_key:
-            raise RuntimeError("CONGRESS_API_KEY is not set in environment or .env file")
+        exporter = CsvExporter(
+            outputs_dir=self.outputs_dir,
+            output_format=self.output_format,
+            output_path=self.output_path,
+            metrics=self.metrics,
+        )
+        exporter.ensure_outputs_dir()
+        store = self._checkpoint_store()
+        checkpoint = store.load() if store is not None and self.resume else None
+        if checkpoint is not None and (
+            checkpoint.congress != self.congress_number
+            or checkpoint.member != self._member()
+            # Appending another format's rows at this offset would corrupt the file
+            or checkpoint.output_format != self.output_format
+            or not Path(checkpoint.output_path).is_file()
+        ):
+            checkpoint = None
+        if checkpoint is None:
+            output_path = exporter.build_output_filepath(
+                *_file_label(self.member_first, self.member_last, self.bioguide_id), self.congress_number
+            )
+            checkpoint = ExportCheckpoint(
+                congress=self.congress_number,
+                member=self._member(),
+                output_path=str(output_path),
+                output_format=self.output_format,
+            )
+            resume_at = None
+        else:
+            output_path = Path(checkpoint.output_path)
+            resume_at = checkpoint.output_offset
+
+        filter_service = VotesFilter(
+            target_first=self.member_first,
+            target_last=self.member_last,
+            bioguide_id=checkpoint.resolved_bioguide_id or self.bioguide_id,
+            metrics=self.metrics,
+        )
+        roll_calls = self._roll_calls(
+            filter_service.raw_member_predicate(),
+            {"bioguide_id": self.bioguide_id} if self.bioguide_id else {"last_name": self.member_last},
+            resume_after=checkpoint.position,
+        )
+        with exporter.open_rows(output_path, resume_at=resume_at) as writer:
+            if store is None:
+                writer.write_value_rows(filter_service.iter_member_values(roll_calls))
+            else:
+                self._write_with_checkpoints(store, checkpoint, filter_service, roll_calls, self._scan, writer)
+        return output_path
+
+    def _checkpoint_store(self) -> Optional[CheckpointStore]:
+        # Offline exports are fast enough to rerun; incremental ones resume from the repository;
+        # compressed and streamed output cannot be cut back to a checkpoint
+        if self.checkpoint_dir is None or self.offline or self.incremental:
+            return None
+        if not is_appendable(self.output_format, self.output_path):
+            return None
+        label = "_".join(part for part in _file_label(self.member_first, self.member_last, self.bioguide_id) if part)
+        return CheckpointStore(self.checkpoint_dir / f"{label}_congress_{self.congress_number}.json")
+
+    def _member(self) -> Dict[str, str]:
+        return {"first": self.member_first, "last": self.member_last, "bioguide_id": self.bioguide_id or ""}
+
+    @staticmethod
+    def _write_with_checkpoints(
+        store: CheckpointStore,
+        checkpoint: ExportCheckpoint,
+        filter_service: VotesFilter,
+        roll_calls: Iterable[RollCall],
+        scan: RollCallIterator,
+        writer: RowWriter,
+    ) -> None:
+        """Write rows, checkpointing every ``CHECKPOINT_EVERY`` roll calls and when the scan stops.
+
+        A roll call is complete once the filter asks for the next one: every row
+        it produced has been handed to the writer by then. The checkpoint keeps
+        the scan's position, the key the resumed scan starts after.
+        """
+        completed = saved = 0
+
+        def save() -> None:
+            nonlocal saved
+            checkpoint.resolved_bioguide_id = filter_service.resolved_bioguide_id
+            writer.stream.flush()
+            store.save(checkpoint)
+            saved = completed
+
+        def on_complete() -> None:
+            nonlocal completed
+            checkpoint.session_number, checkpoint.roll_call_number = scan.position
+            checkpoint.output_offset = writer.stream.tell()
+            completed += 1
+            if completed % CHECKPOINT_EVERY == 0:
+                save()
+
+        try:
+            writer.write_value_rows(filter_service.iter_member_values(_track_completed(roll_calls, on_complete)))
+        except BaseException:
+            # Error or Ctrl-C: record the last fully written roll call before unwinding
+            if completed != saved:
+                save()
+            raise
+        store.clear()
+
+
+@dataclass
+class ExportMembersCommand(_RollCallScan):
+    """Export votes for many members from a single scan of a Congress.
 
-        client = CongressApiClient(api_key=api_key)
-        iterator = RollCallIterator(client=client, congress_number=self.congress_number)
-        filter_service = VotesFilter(target_first=self.member_first, target_last=self.member_last)
+    Writes one CSV per member, or with ``combined=True`` a single CSV holding
+    every member's rows (told apart by ``memberName``). Members may be given by
+    name in ``members`` and/or by ID in ``bioguide_ids``. Returns the paths written.
+    """
+
+    members: List[Tuple[str, str]]
+    congress_number: int
+    combined: bool = False
+    outputs_dir: Optional[Path] = None
+    output_format: str = "csv"
+    output_path: Optional[Path] = None
+    repository: Optional[VotesRepository] = None
+    api_key: Optional[str] = None
+    workers: int = 1
+    discover: bool = False
+    cache_path: Optional[Path] = None
+    refresh_cache: bool = False
+    incremental: bool = False
+    requests_per_hour: int = DEFAULT_REQUESTS_PER_HOUR
+    offline: bool = False
+    metrics: Optional[Metrics] = None
+    bioguide_ids: List[str] = field(default_factory=list)
+
+    def run(self) -> List[Path]:
+        if not self.members and not self.bioguide_ids:
+            raise ValueError("At least one member is required")
+        if self.output_path is not None and not self.combined:
+            raise ValueError("Writing several members to one output requires a combined export (--combined)")
+        # Drop repeated roster entries while keeping roster order; ID-only members follow named ones
+        targets = list(dict.fromkeys((first.strip(), last.strip()) for first, last in self.members))
+        targets.extend(dict.fromkeys(bioguide_id.strip() for bioguide_id in self.bioguide_ids))
+        multi_filter = MultiMemberVotesFilter(
+            targets=[
+                VotesFilter(*target) if isinstance(target, tuple) else VotesFilter(bioguide_id=target)
+                for target in targets
+            ],
+            metrics=self.metrics,
+        )
+        roll_calls = self._roll_calls(multi_filter.raw_member_predicate())
 
-        exporter = CsvExporter(outputs_dir=self.outputs_dir)
+        exporter = CsvExporter(
+            outputs_dir=self.outputs_dir,
+            output_format=self.output_format,
+            output_path=self.output_path,
+            metrics=self.metrics,
+        )
         exporter.ensure_outputs_dir()
-        output_path = exporter.build_output_filepath(self.member_first, self.member_last, self.congress_number)
+        keyed_rows = multi_filter.iter_values(roll_calls)
+        if self.combined:
+            output_path = exporter.build_combined_output_filepath(self.congress_number)
+            exporter.write_value_rows(output_path, (row for _, row in keyed_rows))
+            return [output_path]
+        output_paths = {
+            index: exporter.build_output_filepath(
+                *(target if isinstance(target, tuple) else _file_label("", "", target)), self.congress_number
+            )
+            for index, target in enumerate(targets)
+        }
+        exporter.write_keyed_rows(output_paths, keyed_rows)
+        return list(output_paths.values())
 
-        # Optionally persist all roll calls if a repository is provided
-        if self.repository is not None:
-            # Note: iterator is a generator; create a list to allow reuse for filtering
-            roll_calls = list(iterator)
-            self.repository.save_roll_calls(roll_calls)
-            rows = filter_service.iter_member_rows(iter(roll_calls))
+
+@dataclass
+class ExportChamberCommand(_RollCallScan):
+    """Export every member's vote on every roll call of a Congress in one pass.
+
+    - layout "long": one row per member vote, streamed straight to disk
+    - layout "wide": one row per member and one column per roll call; votes are
+      accumulated as one byte per cell in a ``VoteMatrix`` rather than by
+      holding roll calls in memory
+    """
+
+    congress_number: int
+    layout: str = "long"
+    outputs_dir: Optional[Path] = None
+    output_format: str = "csv"
+    output_path: Optional[Path] = None
+    repository: Optional[VotesRepository] = None
+    api_key: Optional[str] = None
+    workers: int = 1
+    discover: bool = False
+    cache_path: Optional[Path] = None
+    refresh_cache: bool = False
+    incremental: bool = False
+    requests_per_hour: int = DEFAULT_REQUESTS_PER_HOUR
+    offline: bool = False
+    metrics: Optional[Metrics] = None
+
+    def run(self) -> Path:
+        if self.layout not in CHAMBER_LAYOUTS:
+            raise ValueError(f"Unknown layout {self.layout!r}; expected one of {', '.join(CHAMBER_LAYOUTS)}")
+        roll_calls = self._roll_calls()
+
+        exporter = CsvExporter(
+            outputs_dir=self.outputs_dir,
+            output_format=self.output_format,
+            output_path=self.output_path,
+            metrics=self.metrics,
+        )
+        exporter.ensure_outputs_dir()
+        output_path = exporter.build_chamber_output_filepath(self.congress_number, self.layout)
+        if self.layout == "long":
+            exporter.write_value_rows(
+                output_path, iter_chamber_values(roll_calls, self.metrics), fieldnames=CHAMBER_FIELDNAMES
+            )
         else:
-            rows = filter_service.iter_member_rows(iterator)
-        exporter.write_rows(output_path, rows)
+            exporter.write_matrix(output_path, VoteMatrix.from_roll_calls(roll_calls))
         return output_path
 
-    @staticmethod
-    def _load_api_key() -> Optional[str]:
-        # 1) Already in environment
-        api_key = os.getenv("CONGRESS_API_KEY")
-        if api_key:
-            return api_key
-        # 2) Load from nearest .env (current working directory preferred)
-        dotenv_path = find_dotenv(usecwd=True)
-        if dotenv_path:
-            load_dotenv(dotenv_path=dotenv_path, override=False)
-            api_key = os.getenv("CONGRESS_API_KEY")
-            if api_key:
-                return api_key
-        # 3) Standard load (python-dotenv default search)
-        load_dotenv(override=False)
-        api_key = os.getenv("CONGRESS_API_KEY")
-        if api_key:
-            return api_key
-        # 4) Manual fallback: read .env in CWD if present
-        from pathlib import Path
-        env_file = Path.cwd() / ".env"
-        if env_file.exists():
-            try:
-                for line in env_file.read_text(encoding="utf-8").splitlines():
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-                    if line.startswith("CONGRESS_API_KEY="):
-                        _, value = line.split("=", 1)
-                        value = value.strip().strip('"').strip("'")
-                        if value:
-                            os.environ["CONGRESS_API_KEY"] = value
-                            return value
-            except Exception:
-                pass
-        return None
-
 
 @dataclass
 class SingleRollCallExportCommand:
@@ -94,34 +508,70 @@ class SingleRollCallExportCommand:
     session_year: int
     roll_call_number: int
     outputs_dir: Optional[Path] = None
+    output_format: str = "csv"
+    output_path: Optional[Path] = None
+    cache_path: Optional[Path] = None
+    refresh_cache: bool = False
+    bioguide_id: Optional[str] = None
+    requests_per_hour: int = DEFAULT_REQUESTS_PER_HOUR
+    repository: Optional[VotesRepository] = None
+    metrics: Optional[Metrics] = None
 
     def run(self) -> Path:
-        api_key = ExportNotVotingCommand._load_api_key()
+        vf = VotesFilter(
+            target_first=self.member_first,
+            target_last=self.member_last,
+            bioguide_id=self.bioguide_id,
+            metrics=self.metrics,
+        )
+        if self.repository is not None:
+            # Offline: read the stored roll call, no API key needed
+            roll_call = self.repository.get_roll_call(self.congress_number, self.session_year, self.roll_call_number)
+            if roll_call is None:
+                raise RuntimeError("Roll call not found in the database for the given parameters")
+        else:
+            roll_call = self._fetch_roll_call(vf)
+
+        exporter = CsvExporter(
+            outputs_dir=self.outputs_dir,
+            output_format=self.output_format,
+            output_path=self.output_path,
+            metrics=self.metrics,
+        )
+        exporter.ensure_outputs_dir()
+        output_path = exporter.build_output_filepath(
+            *_file_label(self.member_first, self.member_last, self.bioguide_id), self.congress_number
+        )
+
+        rows = vf.iter_member_values(iter([roll_call]))
+        exporter.write_value_rows(output_path, rows)
+        return output_path
+
+    def _fetch_roll_call(self, vf: VotesFilter) -> RollCall:
+        api_key = load_api_key(self.metrics)
         if not api_key:
             raise RuntimeError("CONGRESS_API_KEY is not set in environment or .env file")
 
-        client = CongressApiClient(api_key=api_key)
+        client = _build_client(
+            api_key,
+            cache_path=self.cache_path,
+            refresh_cache=self.refresh_cache,
+            requests_per_hour=self.requests_per_hour,
+            metrics=self.metrics,
+        )
         resp = client.get_member_votes(self.congress_number, self.session_year, self.roll_call_number)
         if resp.status_code == 404:
             raise RuntimeError("Roll call not found for the given parameters")
+        if resp.status_code == 429:
+            raise RateLimitError("Congress.gov rate limit still exceeded after retries; try again later")
         if resp.status_code != 200 or not resp.json:
             raise RuntimeError(f"Unexpected response status: {resp.status_code}")
         if isinstance(resp.json, dict) and resp.json.get("error"):
             raise RuntimeError(str(resp.json.get("error")))
 
-        roll_call = RollCallMapper.from_api_payload(
+        return RollCallMapper.from_api_payload(
             congress=self.congress_number,
             roll_call_number=self.roll_call_number,
             payload=resp.json,
+            member_filter=vf.raw_member_predicate(),
         )
-
-        exporter = CsvExporter(outputs_dir=self.outputs_dir)
-        exporter.ensure_outputs_dir()
-        output_path = exporter.build_output_filepath(self.member_first, self.member_last, self.congress_number)
-
-        vf = VotesFilter(target_first=self.member_first, target_last=self.member_last)
-        rows = vf.iter_member_rows(iter([roll_call]))
-        exporter.write_rows(output_path, rows)
-        return output_path
-
-
@@ -1,10 +1,41 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List, Optional
 
 
-@dataclass
+def _slotted(cls):
+    """Rebuild a dataclass with ``__slots__`` (``dataclass(slots=True)`` needs Python 3.10).
+
+    Instances then carry no per-instance ``__dict__``, which matters when a
+    whole Congress of member votes is held in memory.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {key: value for key, value in cls.__dict__.items() if key not in names}
+    namespace["__slots__"] = names
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    if cls.__dataclass_params__.frozen:
+        # Frozen instances reject setattr, so restore state field by field
+        def __getstate__(self):
+            return [getattr(self, name) for name in names]
+
+        def __setstate__(self, state):
+            for name, value in zip(names, state):
+                object.__setattr__(self, name, value)
+
+        namespace["__getstate__"] = __getstate__
+        namespace["__setstate__"] = __setstate__
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def name_key(name: str) -> str:
+    """A name as member matching compares it: trimmed and lowercased, Unicode included."""
+    return name.strip().lower()
+
+
+@_slotted
+@dataclass(frozen=True)
 class MemberVote:
     bioguide_id: Optional[str]
     first_name: str
@@ -18,6 +49,7 @@ class MemberVote:
         return f"{self.first_name} {self.last_name}".strip()
 
 
+@_slotted
 @dataclass
 class RollCall:
     congress: int
@@ -29,5 +61,3 @@ class RollCall:
     legislation_type: Optional[str] = None
     legislation_number: Optional[str] = None
     members: List[MemberVote] = field(default_factory=list)
-
-
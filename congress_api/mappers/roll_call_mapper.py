@@ -1,13 +1,37 @@
 from __future__ import annotations
 
-from typing import Dict
+from sys import intern
+from typing import Any, Callable, Dict, Optional
 
 from congress_api.domain.models import MemberVote, RollCall
 
 
+# Decides from a raw ``results`` entry whether to build its MemberVote
+MemberPredicate = Callable[[Dict], bool]
+
+
+def intern_optional(value: Any) -> Optional[str]:
+    """Intern a string so repeated values share one object; anything else passes through."""
+    return intern(value) if isinstance(value, str) else value
+
+
 class RollCallMapper:
     @staticmethod
-    def from_api_payload(congress: int, roll_call_number: int, payload: Dict) -> RollCall:
+    def from_api_payload(
+        congress: int,
+        roll_call_number: int,
+        payload: Dict,
+        member_filter: Optional[MemberPredicate] = None,
+    ) -> RollCall:
+        """Map a member-votes payload to a ``RollCall``.
+
+        With ``member_filter`` only the raw member entries it accepts are turned
+        into ``MemberVote`` objects; the rest are never materialized.
+
+        Member strings (IDs, names, vote, party, state) are interned: they repeat
+        on every roll call, so a Congress held in memory shares one copy of each
+        instead of keeping every parsed payload's strings alive.
+        """
         block = payload.get("houseRollCallVoteMemberVotes") or {}
         session_number = int(block.get("sessionNumber")) if block.get("sessionNumber") else 0
         start_date = block.get("startDate")
@@ -16,16 +40,18 @@ class RollCallMapper:
         legislation_type = block.get("legislationType")
         legislation_number = block.get("legislationNumber")
         members_raw = block.get("results") or []
+        if member_filter is not None:
+            members_raw = [mv for mv in members_raw if member_filter(mv)]
         members = []
         for mv in members_raw:
             members.append(
                 MemberVote(
-                    bioguide_id=mv.get("bioguideID"),
-                    first_name=str(mv.get("firstName", "")),
-                    last_name=str(mv.get("lastName", "")),
-                    vote_cast=str(mv.get("voteCast", "")),
-                    party=mv.get("voteParty"),
-                    state=mv.get("voteState"),
+                    bioguide_id=intern_optional(mv.get("bioguideID")),
+                    first_name=intern(str(mv.get("firstName", ""))),
+                    last_name=intern(str(mv.get("lastName", ""))),
+                    vote_cast=intern(str(mv.get("voteCast", ""))),
+                    party=intern_optional(mv.get("voteParty")),
+                    state=intern_optional(mv.get("voteState")),
                 )
             )
         return RollCall(
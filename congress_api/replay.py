@@ -0,0 +1,333 @@
+"""Local record/replay stand-in for api.congress.gov.
+
+``record`` captures a Congress's member-votes responses once, from the API or
+from the response cache, into a recording directory with one JSON file per
+roll call (``<congress>/<session>/<roll_call>.json``). The 404 and
+200-with-error responses that end each session are kept too. ``serve``
+replays a recording over HTTP/1.1 keep-alive, with optional latency, jitter,
+5xx errors and 429 throttling, so the client, pooling, caching and rate
+limiting can be exercised offline. Point the CLI at it with
+``CONGRESS_API_BASE_URL``, or a client with ``base_url=server.base_url``::
+
+    python -m congress_api.replay record --congress 118 recordings/
+    python -m congress_api.replay serve recordings/ --port 8765 --latency-ms 80 --jitter-ms 40
+    CONGRESS_API_BASE_URL=http://127.0.0.1:8765/v3 congress-api --first Jake --last Auchincloss --congress 118 --no-cache
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .commands.export_command import load_api_key
+from .services.api_client import CongressApiClient
+from .services.rate_limiter import DEFAULT_REQUESTS_PER_HOUR, RateLimiter
+from .services.response_cache import DEFAULT_CACHE_PATH, ResponseCache
+from .services.roll_call_iterator import RollCallIterator
+from .services.transport import RequestsTransport, Transport, TransportResponse
+
+
+# (congress, session, roll call)
+ResponseKey = Tuple[int, int, int]
+
+_MEMBER_VOTES_PATH = re.compile(r"/house-vote/(\d+)/(\d+)/(\d+)/members/?$")
+# Statuses worth replaying; throttling and server errors are injected instead
+RECORDED_STATUSES = (200, 404)
+END_OF_SESSION_BODY = json.dumps({"error": "No Vote matches the given query."}).encode("utf-8")
+
+
+def parse_member_votes_url(url: str) -> Optional[ResponseKey]:
+    match = _MEMBER_VOTES_PATH.search(urlsplit(url).path)
+    if match is None:
+        return None
+    congress, session, roll_call = (int(part) for part in match.groups())
+    return congress, session, roll_call
+
+
+class Recording:
+    """A directory of recorded responses, one ``{"status", "body"}`` JSON file per roll call."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def path_for(self, key: ResponseKey) -> Path:
+        congress, session, roll_call = key
+        return self.root / str(congress) / str(session) / f"{roll_call}.json"
+
+    def save(self, key: ResponseKey, status_code: int, content: bytes) -> None:
+        try:
+            body = json.loads(content) if content else None
+        except ValueError:
+            body = content.decode("utf-8", errors="replace")
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"status": status_code, "body": body}), encoding="utf-8")
+
+    def load(self) -> Dict[ResponseKey, TransportResponse]:
+        """Every recorded response, with bodies encoded once up front."""
+        responses: Dict[ResponseKey, TransportResponse] = {}
+        for path in self.root.glob("*/*/*.json"):
+            try:
+                key = (int(path.parent.parent.name), int(path.parent.name), int(path.stem))
+            except ValueError:
+                continue
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            body = entry.get("body")
+            content = b"" if body is None else json.dumps(body).encode("utf-8")
+            responses[key] = TransportResponse(status_code=int(entry["status"]), content=content)
+        return responses
+
+
+class RecordingTransport(Transport):
+    """Wraps a transport and saves every 200/404 member-votes response it returns."""
+
+    def __init__(self, inner: Transport, recording: Recording) -> None:
+        self.inner = inner
+        self.recording = recording
+        self.recorded = 0
+
+    def get(self, url: str, params: Mapping[str, str]) -> TransportResponse:
+        response = self.inner.get(url, params)
+        key = parse_member_votes_url(url)
+        if key is not None and response.status_code in RECORDED_STATUSES:
+            self.recording.save(key, response.status_code, response.content)
+            self.recorded += 1
+        return response
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+def record_from_api(recording: Recording, congress: int, api_key: str, *, requests_per_hour: int) -> int:
+    """Scan ``congress`` through the API, recording each response; returns how many were saved."""
+    transport = RecordingTransport(RequestsTransport(), recording)
+    with CongressApiClient(api_key, transport=transport, rate_limiter=RateLimiter(requests_per_hour)) as client:
+        for _ in RollCallIterator(client=client, congress_number=congress):
+            pass
+    return transport.recorded
+
+
+def record_from_cache(recording: Recording, congress: int, cache_path: Path) -> int:
+    """Copy ``congress``'s responses out of the response cache, each session up to its first gap."""
+    cache = ResponseCache(cache_path)
+    recorded = 0
+    try:
+        for session in (1, 2):
+            roll_call = 1
+            while True:
+                cached = cache.get(congress, session, roll_call)
+                if cached is None:
+                    break
+                recording.save((congress, session, roll_call), cached.status_code, cached.content)
+                recorded += 1
+                if cached.status_code != 200:
+                    break
+                roll_call += 1
+    finally:
+        cache.close()
+    return recorded
+
+
+@dataclass
+class ReplayConfig:
+    """Network conditions the server simulates.
+
+    - latency: Seconds added to every response
+    - jitter: Up to this many extra seconds, drawn uniformly per response
+    - error_rate: Fraction of requests answered 503
+    - throttle_rate: Fraction of requests answered 429 with ``Retry-After``
+    - retry_after: Seconds sent in ``Retry-After`` on throttled responses
+    - seed: Seed for the jitter/error draws, for repeatable runs
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: int = 1
+    seed: Optional[int] = None
+
+
+class ReplayServer:
+    """Threaded HTTP server replaying recorded responses.
+
+    Unrecorded roll calls get the API's 404 end-of-session answer. Use as a
+    context manager to serve from a background thread; ``base_url`` is what
+    to pass to ``CongressApiClient``. ``status_counts`` tallies the statuses
+    sent, injected ones included.
+    """
+
+    def __init__(
+        self,
+        responses: Mapping[ResponseKey, TransportResponse],
+        config: Optional[ReplayConfig] = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.responses = dict(responses)
+        self.config = config or ReplayConfig()
+        self.status_counts: Counter = Counter()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v3"
+
+    def respond(self, path: str) -> Tuple[TransportResponse, float]:
+        """The response for ``path`` and the delay to apply before sending it."""
+        config = self.config
+        with self._lock:
+            delay = config.latency + (self._rng.uniform(0, config.jitter) if config.jitter else 0.0)
+            draw = self._rng.random()
+        key = parse_member_votes_url(path)
+        if draw < config.throttle_rate:
+            response = TransportResponse.from_json(
+                429, {"error": "Rate limit exceeded"}, headers={"Retry-After": str(config.retry_after)}
+            )
+        elif draw < config.throttle_rate + config.error_rate:
+            response = TransportResponse.from_json(503, {"error": "Service Unavailable"})
+        elif key is None:
+            response = TransportResponse.from_json(400, {"error": "Unsupported path"})
+        else:
+            response = self.responses.get(key) or TransportResponse(status_code=404, content=END_OF_SESSION_BODY)
+        with self._lock:
+            self.status_counts[response.status_code] += 1
+        return response, delay
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                response, delay = server.respond(self.path)
+                if delay:
+                    time.sleep(delay)
+                self.send_response(response.status_code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response.content)))
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(response.content)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return Handler
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def _fraction(value: str) -> float:
+    number = float(value)
+    if not 0.0 <= number <= 1.0:
+        raise argparse.ArgumentTypeError("must be between 0 and 1")
+    return number
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m congress_api.replay", description="Record and replay Congress.gov member-votes responses."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="Capture a Congress's responses into a recording directory.")
+    record.add_argument("recording", type=Path)
+    record.add_argument("--congress", type=int, required=True)
+    record.add_argument(
+        "--from-cache",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_CACHE_PATH,
+        metavar="CACHE",
+        help=f"Copy from the response cache (default: {DEFAULT_CACHE_PATH}) instead of calling the API.",
+    )
+    record.add_argument("--rate-limit", type=int, default=DEFAULT_REQUESTS_PER_HOUR, metavar="REQUESTS_PER_HOUR")
+
+    serve = commands.add_parser("serve", help="Replay a recording over HTTP.")
+    serve.add_argument("recording", type=Path)
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every response.")
+    serve.add_argument("--jitter-ms", type=float, default=0.0, help="Up to this much extra random delay.")
+    serve.add_argument("--error-rate", type=_fraction, default=0.0, help="Fraction of requests answered 503.")
+    serve.add_argument("--throttle-rate", type=_fraction, default=0.0, help="Fraction of requests answered 429.")
+    serve.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429s.")
+    serve.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    try:
+        recording = Recording(args.recording)
+        if args.command == "record":
+            if args.from_cache is not None:
+                if not args.from_cache.is_file():
+                    raise ValueError(f"Response cache not found: {args.from_cache}")
+                count = record_from_cache(recording, args.congress, args.from_cache)
+            else:
+                api_key = load_api_key()
+                if not api_key:
+                    raise ValueError("CONGRESS_API_KEY is not set. Add it to your environment or .env file.")
+                count = record_from_api(recording, args.congress, api_key, requests_per_hour=args.rate_limit)
+            print(f"[OK] Recorded {count} responses to {args.recording}")
+            return 0
+
+        responses = recording.load()
+        if not responses:
+            raise ValueError(f"No recorded responses in {args.recording}")
+        config = ReplayConfig(
+            latency=args.latency_ms / 1000,
+            jitter=args.jitter_ms / 1000,
+            error_rate=args.error_rate,
+            throttle_rate=args.throttle_rate,
+            retry_after=args.retry_after,
+            seed=args.seed,
+        )
+        server = ReplayServer(responses, config, host=args.host, port=args.port)
+        print(f"[OK] Replaying {len(responses)} responses at {server.base_url}")
+        server.serve_forever()
+    except Exception as exc:
+        print(f"[ERROR] {exc}")
+        return 2
+    except KeyboardInterrupt:
+        print("[INFO] Stopped")
+        return 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
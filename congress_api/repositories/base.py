@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Iterable, Iterator, Optional
 
 from congress_api.domain.models import RollCall
 
@@ -12,5 +12,34 @@ class VotesRepository(ABC):
         """Persist roll call data."""
         raise NotImplementedError
 
+    @abstractmethod
+    def high_water_mark(self, congress: int, session_number: int) -> int:
+        """Return the highest stored roll call number for a session (0 if none)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_roll_calls(self, congress: int) -> Iterator[RollCall]:
+        """Yield a Congress's stored roll calls in session/roll-call order."""
+        raise NotImplementedError
 
+    @abstractmethod
+    def get_roll_call(self, congress: int, session_number: int, roll_call_number: int) -> Optional[RollCall]:
+        """Return one stored roll call with all its member votes, or None."""
+        raise NotImplementedError
 
+    @abstractmethod
+    def iter_member_roll_calls(
+        self,
+        first_congress: int,
+        last_congress: Optional[int] = None,
+        *,
+        bioguide_id: Optional[str] = None,
+        last_name: Optional[str] = None,
+    ) -> Iterator[RollCall]:
+        """Yield stored roll calls in which a member voted, holding only that member's votes.
+
+        Covers ``first_congress`` through ``last_congress`` (inclusive; defaults to
+        ``first_congress``). The member is selected by bioguide ID, or by last name
+        (compared as ``name_key`` does) leaving first-name matching to ``VotesFilter``.
+        """
+        raise NotImplementedError
@@ -1,16 +1,15 @@
 from __future__ import annotations
 
 import sqlite3
+from itertools import groupby
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator, List, Optional, Tuple
 
-from congress_api.domain.models import RollCall, MemberVote
+from congress_api.domain.models import RollCall, MemberVote, name_key
 from .base import VotesRepository
 
 
 SCHEMA_SQL = """
-PRAGMA foreign_keys = ON;
-
 CREATE TABLE IF NOT EXISTS roll_calls (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     congress INTEGER NOT NULL,
@@ -32,49 +31,284 @@ CREATE TABLE IF NOT EXISTS member_votes (
 );
 """
 
+# Applied in order to databases whose PRAGMA user_version is below the step number
+MIGRATIONS = [
+    # 1: unique roll call key (keeping the latest copy of duplicates) and a
+    #    member_votes → roll call index for replacing a roll call's votes
+    """
+    DELETE FROM member_votes WHERE roll_call_id NOT IN (
+        SELECT MAX(id) FROM roll_calls GROUP BY congress, session_number, roll_call_number
+    );
+    DELETE FROM roll_calls WHERE id NOT IN (
+        SELECT MAX(id) FROM roll_calls GROUP BY congress, session_number, roll_call_number
+    );
+    DROP INDEX IF EXISTS ix_roll_calls_session;
+    CREATE UNIQUE INDEX IF NOT EXISTS ux_roll_calls_key
+        ON roll_calls (congress, session_number, roll_call_number);
+    CREATE INDEX IF NOT EXISTS ix_member_votes_roll_call ON member_votes (roll_call_id);
+    """,
+    # 2: every field the CSV export needs, and covering indexes for member lookups
+    """
+    ALTER TABLE roll_calls ADD COLUMN vote_question TEXT;
+    ALTER TABLE roll_calls ADD COLUMN legislation_type TEXT;
+    ALTER TABLE roll_calls ADD COLUMN legislation_number TEXT;
+    CREATE INDEX IF NOT EXISTS ix_member_votes_bioguide
+        ON member_votes (bioguide_id, roll_call_id);
+    CREATE INDEX IF NOT EXISTS ix_member_votes_name
+        ON member_votes (last_name COLLATE NOCASE, first_name COLLATE NOCASE, roll_call_id);
+    """,
+    # 3: last names keyed the way VotesFilter compares them (NOCASE only folds ASCII),
+    #    so offline lookups match exactly the members an online export would
+    """
+    ALTER TABLE member_votes ADD COLUMN last_name_key TEXT;
+    UPDATE member_votes SET last_name_key = name_key(last_name);
+    DROP INDEX IF EXISTS ix_member_votes_name;
+    CREATE INDEX IF NOT EXISTS ix_member_votes_last_name_key
+        ON member_votes (last_name_key, roll_call_id);
+    """,
+]
+
+# Roll calls written per transaction by save_roll_calls
+DEFAULT_BATCH_SIZE = 200
+
+UPSERT_ROLL_CALL_SQL = """
+INSERT INTO roll_calls (
+    congress, session_number, roll_call_number, start_date, result,
+    vote_question, legislation_type, legislation_number
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (congress, session_number, roll_call_number)
+DO UPDATE SET
+    start_date = excluded.start_date,
+    result = excluded.result,
+    vote_question = excluded.vote_question,
+    legislation_type = excluded.legislation_type,
+    legislation_number = excluded.legislation_number
+"""
+
+# Roll call columns then member vote columns, as read by _group_roll_calls
+SELECT_JOINED_SQL = """
+SELECT rc.id, rc.congress, rc.session_number, rc.roll_call_number, rc.start_date, rc.result,
+       rc.vote_question, rc.legislation_type, rc.legislation_number,
+       mv.bioguide_id, mv.first_name, mv.last_name, mv.vote_cast, mv.party, mv.state
+FROM roll_calls rc
+"""
+
+INSERT_MEMBER_VOTE_SQL = """
+INSERT INTO member_votes (roll_call_id, bioguide_id, first_name, last_name, last_name_key, vote_cast, party, state)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class SqliteVotesRepository(VotesRepository):
-    def __init__(self, db_path: Path) -> None:
+    """SQLite-backed votes store.
+
+    Roll calls are keyed by (congress, session_number, roll_call_number);
+    saving one that is already stored updates it and replaces its member votes,
+    so re-ingesting is idempotent. Writes use ``executemany`` in transactions
+    of ``batch_size`` roll calls on a WAL-mode database.
+
+    With ``read_only=True`` (offline exports) the file is opened with
+    ``mode=ro`` and never written: no WAL switch and no migrations. A database
+    on an older schema raises ``ValueError`` instead of being upgraded.
+    """
+
+    def __init__(self, db_path: Path, *, batch_size: int = DEFAULT_BATCH_SIZE, read_only: bool = False) -> None:
         self.db_path = db_path
-        self._ensure_schema()
+        self.batch_size = batch_size
+        self.read_only = read_only
+        if read_only:
+            self._check_schema()
+        else:
+            self._ensure_schema()
 
     def _get_conn(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path)
+        if self.read_only:
+            conn = sqlite3.connect(f"{Path(self.db_path).resolve().as_uri()}?mode=ro", uri=True)
+        else:
+            conn = sqlite3.connect(self.db_path)
+        # Used by migrations; Python's lowercasing matches VotesFilter beyond ASCII
+        conn.create_function("name_key", 1, name_key, deterministic=True)
+        # Safe with WAL: a crash can lose the last commits but never corrupts the file
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -65536")
+        return conn
 
     def _ensure_schema(self) -> None:
-        with self._get_conn() as conn:
+        conn = self._get_conn()
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
             conn.executescript(SCHEMA_SQL)
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            for step, script in enumerate(MIGRATIONS[version:], start=version + 1):
+                conn.executescript(f"BEGIN;\n{script}\nPRAGMA user_version = {step};\nCOMMIT;")
+        finally:
+            conn.close()
+
+    def _check_schema(self) -> None:
+        conn = self._get_conn()
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+        finally:
+            conn.close()
+        if version < len(MIGRATIONS):
+            raise ValueError(
+                f"{self.db_path} uses schema version {version}, older than version {len(MIGRATIONS)}; "
+                "open it once with --db to upgrade it"
+            )
 
     def save_roll_calls(self, roll_calls: Iterable[RollCall]) -> None:
-        with self._get_conn() as conn:
-            cur = conn.cursor()
-            for rc in roll_calls:
-                cur.execute(
-                    """
-                    INSERT INTO roll_calls (congress, session_number, roll_call_number, start_date, result)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (rc.congress, rc.session_number, rc.roll_call_number, rc.start_date, rc.result),
+        if self.read_only:
+            raise ValueError(f"{self.db_path} is open read-only")
+        conn = self._get_conn()
+        try:
+            for chunk in _chunks(roll_calls, self.batch_size):
+                with conn:
+                    self._save_chunk(conn, chunk)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _save_chunk(conn: sqlite3.Connection, roll_calls: List[RollCall]) -> None:
+        # A roll call repeated within the chunk keeps its last copy
+        by_key = {(rc.congress, rc.session_number, rc.roll_call_number): rc for rc in roll_calls}
+        conn.executemany(
+            UPSERT_ROLL_CALL_SQL,
+            [
+                (
+                    rc.congress,
+                    rc.session_number,
+                    rc.roll_call_number,
+                    rc.start_date,
+                    rc.result,
+                    rc.vote_question,
+                    rc.legislation_type,
+                    rc.legislation_number,
+                )
+                for rc in by_key.values()
+            ],
+        )
+        ids = [
+            conn.execute(
+                "SELECT id FROM roll_calls WHERE congress = ? AND session_number = ? AND roll_call_number = ?", key
+            ).fetchone()[0]
+            for key in by_key
+        ]
+        conn.executemany("DELETE FROM member_votes WHERE roll_call_id = ?", [(roll_call_id,) for roll_call_id in ids])
+        conn.executemany(
+            INSERT_MEMBER_VOTE_SQL,
+            [
+                (
+                    roll_call_id,
+                    mv.bioguide_id,
+                    mv.first_name,
+                    mv.last_name,
+                    name_key(mv.last_name),
+                    mv.vote_cast,
+                    mv.party,
+                    mv.state,
                 )
-                roll_call_id = cur.lastrowid
-                for mv in rc.members:
-                    cur.execute(
-                        """
-                        INSERT INTO member_votes (
-                            roll_call_id, bioguide_id, first_name, last_name, vote_cast, party, state
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            roll_call_id,
-                            mv.bioguide_id,
-                            mv.first_name,
-                            mv.last_name,
-                            mv.vote_cast,
-                            mv.party,
-                            mv.state,
-                        ),
-                    )
-            conn.commit()
+                for roll_call_id, rc in zip(ids, by_key.values())
+                for mv in rc.members
+            ],
+        )
 
+    def high_water_mark(self, congress: int, session_number: int) -> int:
+        with self._get_conn() as conn:
+            row = conn.execute(
+                "SELECT MAX(roll_call_number) FROM roll_calls WHERE congress = ? AND session_number = ?",
+                (congress, session_number),
+            ).fetchone()
+        return int(row[0]) if row and row[0] is not None else 0
+
+    def iter_roll_calls(self, congress: int) -> Iterator[RollCall]:
+        return self._query(
+            SELECT_JOINED_SQL
+            + """
+            LEFT JOIN member_votes mv ON mv.roll_call_id = rc.id
+            WHERE rc.congress = ?
+            ORDER BY rc.session_number, rc.roll_call_number, mv.id
+            """,
+            (congress,),
+        )
+
+    def get_roll_call(self, congress: int, session_number: int, roll_call_number: int) -> Optional[RollCall]:
+        return next(
+            self._query(
+                SELECT_JOINED_SQL
+                + """
+                LEFT JOIN member_votes mv ON mv.roll_call_id = rc.id
+                WHERE rc.congress = ? AND rc.session_number = ? AND rc.roll_call_number = ?
+                ORDER BY mv.id
+                """,
+                (congress, session_number, roll_call_number),
+            ),
+            None,
+        )
+
+    def iter_member_roll_calls(
+        self,
+        first_congress: int,
+        last_congress: Optional[int] = None,
+        *,
+        bioguide_id: Optional[str] = None,
+        last_name: Optional[str] = None,
+    ) -> Iterator[RollCall]:
+        if (bioguide_id is None) == (last_name is None):
+            raise ValueError("Query by exactly one of bioguide_id or last_name")
+        if bioguide_id is not None:
+            member_clause, value = "mv.bioguide_id = ?", bioguide_id
+        else:
+            member_clause, value = "mv.last_name_key = ?", name_key(last_name)
+        return self._query(
+            SELECT_JOINED_SQL
+            + f"""
+            JOIN member_votes mv ON mv.roll_call_id = rc.id
+            WHERE {member_clause} AND rc.congress BETWEEN ? AND ?
+            ORDER BY rc.congress, rc.session_number, rc.roll_call_number, mv.id
+            """,
+            (value, first_congress, last_congress if last_congress is not None else first_congress),
+        )
+
+    def _query(self, sql: str, params: Tuple) -> Iterator[RollCall]:
+        conn = self._get_conn()
+        try:
+            # One pass over the join; rows of a roll call arrive together
+            for _, group in groupby(conn.execute(sql, params), key=lambda row: row[0]):
+                group = list(group)
+                head = group[0]
+                yield RollCall(
+                    congress=head[1],
+                    session_number=head[2],
+                    roll_call_number=head[3],
+                    start_date=head[4],
+                    result=head[5],
+                    vote_question=head[6],
+                    legislation_type=head[7],
+                    legislation_number=head[8],
+                    members=[
+                        MemberVote(
+                            bioguide_id=row[9],
+                            first_name=row[10],
+                            last_name=row[11],
+                            vote_cast=row[12],
+                            party=row[13],
+                            state=row[14],
+                        )
+                        for row in group
+                        if row[10] is not None
+                    ],
+                )
+        finally:
+            conn.close()
 
 
+def _chunks(items: Iterable[RollCall], size: int) -> Iterator[List[RollCall]]:
+    chunk: List[RollCall] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -1,10 +1,26 @@
 from __future__ import annotations
 
+import json
 import time
 from dataclasses import dataclass
 from typing import Any, Optional
 
-import requests
+from .metrics import MEMBER_VOTES_ENDPOINT, Metrics
+from .rate_limiter import DEFAULT_MAX_RETRIES, RateLimiter, backoff_delay, retry_after_seconds
+from .response_cache import ResponseCache
+from .transport import (
+    DEFAULT_POOL_SIZE,
+    DEFAULT_TIMEOUT,
+    RequestsTransport,
+    Timeout,
+    Transport,
+    TransportError,
+)
+
+
+DEFAULT_BASE_URL = "https://api.congress.gov/v3"
+# Overrides the base URL of clients built by the CLI, e.g. to use a local replay server
+BASE_URL_ENV = "CONGRESS_API_BASE_URL"
 
 
 @dataclass
@@ -14,44 +30,141 @@ class SimpleResponse:
 
 
 class CongressApiClient:
-    def __init__(self, api_key: str, *, base_url: str = "https://api.congress.gov/v3") -> None:
+    """Client for the Congress.gov member votes endpoint.
+
+    Requests go through a pluggable ``Transport``. By default the client owns a
+    ``RequestsTransport`` whose pooled keep-alive session lives as long as the
+    client; call ``close`` (or use it as a context manager) to release it.
+
+    With a ``ResponseCache`` attached, fresh cached payloads are served without
+    a request. ``refresh_cache=True`` skips cache reads but still stores results.
+
+    A shared ``RateLimiter`` paces requests against the hourly quota. A 429 is
+    retried up to ``max_retries`` times, waiting for ``Retry-After`` when the
+    server sends it and a jittered exponential backoff otherwise.
+
+    With ``metrics`` every request records its latency, status and response
+    size, plus retries, rate limiter waits and cache hits/misses, and each
+    call's total time (cache, waits and retries included) as ``fetch_seconds``.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        base_url: str = DEFAULT_BASE_URL,
+        transport: Optional[Transport] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        cache: Optional[ResponseCache] = None,
+        refresh_cache: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        metrics: Optional[Metrics] = None,
+    ) -> None:
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        self.transport = transport or RequestsTransport(pool_size=pool_size, timeout=timeout)
+        self.cache = cache
+        self.refresh_cache = refresh_cache
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.metrics = metrics
 
     def get_member_votes(self, congress: int, session: int, roll_call: int) -> SimpleResponse:
         """Fetch the member votes payload for a given roll call.
 
         Returns a SimpleResponse with numeric status_code and a json attribute that
-        is either a parsed object (dict) or None. Handles transient 429 with a short
-        delay and retries, and converts network errors into status_code 0.
+        is either a parsed object (dict) or None. Retries 429s (see class docstring);
+        if every attempt is throttled the 429 is returned. Converts network errors
+        into status_code 0.
         """
+        if self.metrics is None:
+            return self._get_member_votes(congress, session, roll_call)
+        with self.metrics.timer("fetch_seconds"):
+            return self._get_member_votes(congress, session, roll_call)
+
+    def _get_member_votes(self, congress: int, session: int, roll_call: int) -> SimpleResponse:
+        metrics = self.metrics
+        if self.cache is not None and not self.refresh_cache:
+            cached = self.cache.get(congress, session, roll_call)
+            if metrics is not None:
+                metrics.increment("cache_lookups", result="miss" if cached is None else "hit")
+            if cached is not None:
+                return SimpleResponse(status_code=cached.status_code, json=self._parse_json(cached.content))
+
         url = (
             f"{self.base_url}/house-vote/{int(congress)}/{int(session)}/{int(roll_call)}/members"
         )
         params = {"api_key": self.api_key, "format": "json"}
 
-        max_attempts = 2
-        for attempt in range(max_attempts):
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limiter is not None:
+                if metrics is not None:
+                    with metrics.timer("rate_limit_wait_seconds"):
+                        self.rate_limiter.acquire()
+                else:
+                    self.rate_limiter.acquire()
+            start = time.perf_counter()
             try:
-                resp = requests.get(url, params=params, timeout=30)
-            except requests.RequestException:
+                resp = self.transport.get(url, params)
+            except TransportError:
+                if metrics is not None:
+                    self._record_request(metrics, "error", time.perf_counter() - start, 0)
                 return SimpleResponse(status_code=0, json=None)
+            if metrics is not None:
+                self._record_request(metrics, resp.status_code, time.perf_counter() - start, len(resp.content))
+            if self.rate_limiter is not None:
+                self.rate_limiter.observe(resp.headers)
 
-            # Retry once on 429
-            if resp.status_code == 429 and attempt < max_attempts - 1:
-                time.sleep(1)
+            if resp.status_code == 429 and attempt < self.max_retries:
+                if metrics is not None:
+                    metrics.increment("retries", endpoint=MEMBER_VOTES_ENDPOINT, status=429)
+                delay = retry_after_seconds(resp.headers)
+                if delay is None:
+                    delay = backoff_delay(attempt)
+                if self.rate_limiter is not None:
+                    # Hold back every worker sharing the limiter, not just this one
+                    self.rate_limiter.pause(delay)
+                else:
+                    time.sleep(delay)
                 continue
 
-            parsed = None
-            try:
-                # Support both mocks where .json is a callable and real responses
-                parsed = resp.json() if callable(getattr(resp, "json", None)) else getattr(resp, "json", None)
-            except Exception:
-                parsed = None
-
+            parsed = self._parse_json(resp.content)
+            if self.cache is not None:
+                self._store(congress, session, roll_call, resp.status_code, resp.content, parsed)
             return SimpleResponse(status_code=resp.status_code, json=parsed)
 
         # Fallback (should not hit due to return inside loop)
         return SimpleResponse(status_code=0, json=None)
 
+    def _store(self, congress: int, session: int, roll_call: int, status_code: int, content: bytes, parsed: Any) -> None:
+        # Real payloads are always cached; end-of-session markers only once the
+        # session has closed, since an open session keeps growing
+        has_error = isinstance(parsed, dict) and bool(parsed.get("error"))
+        if status_code == 200 and parsed and not has_error:
+            self.cache.put(congress, session, roll_call, status_code, content)
+        elif (status_code == 404 or (status_code == 200 and has_error)) and self.cache.policy.is_immutable(congress, session):
+            self.cache.put(congress, session, roll_call, status_code, content)
+
+    @staticmethod
+    def _record_request(metrics: Metrics, status: object, seconds: float, size: int) -> None:
+        metrics.increment("requests", endpoint=MEMBER_VOTES_ENDPOINT, status=status)
+        metrics.observe("request_seconds", seconds, endpoint=MEMBER_VOTES_ENDPOINT, status=status)
+        metrics.increment("bytes_received", size, endpoint=MEMBER_VOTES_ENDPOINT)
+
+    @staticmethod
+    def _parse_json(content: bytes) -> Optional[Any]:
+        try:
+            return json.loads(content) if content else None
+        except ValueError:
+            return None
+
+    def close(self) -> None:
+        self.transport.close()
+
+    def __enter__(self) -> "CongressApiClient":
+        return self
 
+    def __exit__(self, *exc_info) -> None:
+        self.close()
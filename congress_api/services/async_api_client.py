@@ -0,0 +1,78 @@
+"""Asyncio-facing client for the Congress.gov member votes endpoint.
+
+Returns the same ``SimpleResponse`` contract as ``CongressApiClient``. Requests
+run on a private thread pool over the client's pooled keep-alive transport so
+awaiting them never blocks the event loop, and an ``asyncio.Semaphore`` bounds
+how many are in flight at once across every caller sharing the client.
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from .api_client import DEFAULT_BASE_URL, CongressApiClient, SimpleResponse
+from .metrics import Metrics
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
+from .transport import Transport
+
+
+class AsyncCongressApiClient:
+    """Async counterpart of ``CongressApiClient``.
+
+    Use as an async context manager (or call ``aclose``) to release the pooled
+    connections and worker threads. A ``RateLimiter`` passed here may also be
+    shared with synchronous clients; waits happen on the worker threads.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        base_url: str = DEFAULT_BASE_URL,
+        max_concurrency: int = 10,
+        transport: Optional[Transport] = None,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        metrics: Optional[Metrics] = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._client = CongressApiClient(
+            api_key=api_key,
+            base_url=base_url,
+            transport=transport,
+            pool_size=max_concurrency,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            metrics=metrics,
+        )
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="congress-api")
+        # Created lazily so it binds to the running loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def base_url(self) -> str:
+        return self._client.base_url
+
+    async def get_member_votes(self, congress: int, session: int, roll_call: int) -> SimpleResponse:
+        """Fetch the member votes payload for a given roll call without blocking the loop."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, self._client.get_member_votes, congress, session, roll_call
+            )
+
+    async def aclose(self) -> None:
+        self._executor.shutdown(wait=False)
+        self._client.close()
+
+    async def __aenter__(self) -> "AsyncCongressApiClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
@@ -0,0 +1,70 @@
+"""Async iteration over roll call votes across both session years.
+
+Mirrors ``RollCallIterator`` for use with ``async for``: the same termination
+signals, skip rules and ordering, with up to ``concurrency`` requests in flight
+per iterator on the shared event loop.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import AsyncGenerator, Deque, Tuple
+
+from .async_api_client import AsyncCongressApiClient
+from .metrics import ProgressReporter
+from .roll_call_iterator import _END, _OK, _classify, _map_response
+from ..domain.models import RollCall
+
+
+class AsyncRollCallIterator:
+    """Asynchronously iterates all roll call votes across both session years.
+
+    Results are yielded strictly in session/roll-call order. Requests issued
+    past the end-of-session signal are cancelled and their results discarded.
+    The client's own semaphore bounds concurrency across iterators that share it.
+    """
+
+    def __init__(self, client: AsyncCongressApiClient, congress_number: int, *, concurrency: int = 8) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.client = client
+        self.congress_number = congress_number
+        self.concurrency = concurrency
+
+    def __aiter__(self) -> AsyncGenerator[RollCall, None]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncGenerator[RollCall, None]:
+        pending: Deque[Tuple[int, asyncio.Future]] = deque()
+        progress = ProgressReporter(self.congress_number)
+        try:
+            for session_year in (1, 2):
+                next_roll_call = 1
+                while True:
+                    while len(pending) < self.concurrency:
+                        pending.append(
+                            (
+                                next_roll_call,
+                                asyncio.ensure_future(
+                                    self.client.get_member_votes(self.congress_number, session_year, next_roll_call)
+                                ),
+                            )
+                        )
+                        next_roll_call += 1
+                    roll_call, task = pending.popleft()
+                    response = await task
+                    status = _classify(response)
+                    if status == _END:
+                        self._cancel(pending)
+                        break
+                    if status == _OK:
+                        progress.advance(session_year, roll_call)
+                        yield _map_response(self.congress_number, session_year, roll_call, response)
+        finally:
+            self._cancel(pending)
+
+    @staticmethod
+    def _cancel(pending: Deque[Tuple[int, asyncio.Future]]) -> None:
+        while pending:
+            _, task = pending.popleft()
+            task.cancel()
@@ -0,0 +1,66 @@
+"""Checkpoints for resuming interrupted Congress scans.
+
+A checkpoint records how far an export got: the last roll call whose rows are
+fully written, the output file's format and its byte offset at that point, and
+the member's resolved bioguide ID. Resuming truncates the output back to that
+offset and continues the scan just after that roll call, so the finished CSV
+is identical to one from an uninterrupted run.
+"""
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+DEFAULT_CHECKPOINT_DIR = Path(".cache") / "checkpoints"
+# Roll calls between checkpoint writes (one is also written when a scan stops)
+CHECKPOINT_EVERY = 10
+
+
+@dataclass
+class ExportCheckpoint:
+    congress: int
+    member: Dict[str, str]
+    output_path: str
+    # Checkpoints written before output formats existed were all CSV
+    output_format: str = "csv"
+    session_number: int = 0
+    roll_call_number: int = 0
+    output_offset: int = 0
+    resolved_bioguide_id: Optional[str] = None
+
+    @property
+    def position(self) -> Optional[Tuple[int, int]]:
+        """(session, roll call) of the last completed roll call, or None before the first."""
+        if not self.session_number:
+            return None
+        return self.session_number, self.roll_call_number
+
+
+class CheckpointStore:
+    """One checkpoint stored as JSON; writes are atomic (temp file + rename)."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def load(self) -> Optional[ExportCheckpoint]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            return ExportCheckpoint(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def save(self, checkpoint: ExportCheckpoint) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        temp_path.write_text(json.dumps(asdict(checkpoint)), encoding="utf-8")
+        os.replace(temp_path, self.path)
+
+    def clear(self) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
@@ -1,56 +1,180 @@
-"""CSV export utilities.
+"""Export utilities.
 
 Responsible for creating the outputs directory, constructing a timestamped
-filename, and writing rows to disk in a consistent format.
+filename, and writing rows in a consistent column order through the row
+writer for the chosen output format.
 """
 from __future__ import annotations
 
-import csv
+import time
+from contextlib import ExitStack, contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable
+from typing import Dict, Hashable, Iterable, Iterator, Mapping, Optional, Sequence, Tuple, Union
+
+from .metrics import Metrics
+from .vote_matrix import VoteMatrix
+from .writers import FORMAT_SUFFIXES, RowWriter, check_format, open_row_writer
 
 
 OUTPUTS_DIR = Path("outputs")
 
+FIELDNAMES = [
+    "congress",
+    "sessionNumber",
+    "date",
+    "memberName",
+    "voteCast",
+    "rollCallNumber",
+    "voteUrl",
+    "voteQuestion",
+    "legislation",
+]
+
+CHAMBER_FIELDNAMES = [
+    "congress",
+    "sessionNumber",
+    "date",
+    "rollCallNumber",
+    "bioguideId",
+    "memberName",
+    "party",
+    "state",
+    "voteCast",
+    "voteUrl",
+    "voteQuestion",
+    "legislation",
+]
+
+MATRIX_MEMBER_FIELDNAMES = ["bioguideId", "memberName", "party", "state"]
+
 
 class CsvExporter:
-    """Exporter for writing filtered vote rows to a CSV file."""
+    """Exporter for writing filtered vote rows to a CSV file.
 
-    def __init__(self, outputs_dir: Path | None = None) -> None:
+    ``output_format`` picks the row writer (CSV, gzip CSV or NDJSON; see
+    ``writers``) and the file extension. ``output_path`` replaces the
+    timestamped paths with a fixed one, or ``STDOUT`` to stream the rows.
+    With ``metrics`` the rows written to each output are counted, and the time
+    spent opening, flushing and closing it is recorded as ``write_seconds``.
+    The row producers (the filters, ``iter_chamber_values``) time writing
+    their rows once per roll call, so rows still go to the writer untouched.
+    """
+
+    def __init__(
+        self,
+        outputs_dir: Path | None = None,
+        *,
+        output_format: str = "csv",
+        output_path: Optional[Path] = None,
+        metrics: Optional[Metrics] = None,
+    ) -> None:
         self.outputs_dir = outputs_dir or OUTPUTS_DIR
+        self.output_format = check_format(output_format)
+        self.output_path = output_path
+        self.metrics = metrics
 
     def ensure_outputs_dir(self) -> None:
         """Ensure the outputs directory exists."""
-        self.outputs_dir.mkdir(parents=True, exist_ok=True)
+        if self.output_path is None:
+            self.outputs_dir.mkdir(parents=True, exist_ok=True)
 
     def build_output_filepath(
         self, member_first: str, member_last: str, congress_number: int
     ) -> Path:
-        """Return a timestamped CSV path under the outputs directory."""
+        """Return a timestamped CSV path under the outputs directory.
+
+        Empty name parts are left out, so a member known only by bioguide ID
+        can pass the ID as ``member_first`` and an empty ``member_last``.
+        """
+        member = "_".join(part for part in (member_first, member_last) if part)
+        return self._build(f"{member}_congress_{congress_number}")
+
+    def build_combined_output_filepath(self, congress_number: int) -> Path:
+        """Return a timestamped CSV path for a multi-member export."""
+        return self._build(f"members_congress_{congress_number}")
+
+    def build_chamber_output_filepath(self, congress_number: int, layout: str) -> Path:
+        """Return a timestamped CSV path for a full-chamber export."""
+        return self._build(f"house_congress_{congress_number}_{layout}")
+
+    def _build(self, stem: str) -> Path:
+        if self.output_path is not None:
+            return self.output_path
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = (
-            f"{member_first}_{member_last}_congress_{congress_number}_{timestamp}.csv"
-        )
-        return self.outputs_dir / filename
+        return self.outputs_dir / f"{stem}_{timestamp}{FORMAT_SUFFIXES[self.output_format]}"
 
-    def write_rows(self, output_path: Path, rows: Iterable[Dict]) -> None:
+    def write_rows(
+        self, output_path: Path, rows: Iterable[Dict], fieldnames: Sequence[str] = FIELDNAMES
+    ) -> None:
         """Write iterable of dict rows using a fixed set/order of columns."""
-        fieldnames = [
-            "congress",
-            "sessionNumber",
-            "date",
-            "memberName",
-            "voteCast",
-            "rollCallNumber",
-            "voteUrl",
-            "voteQuestion",
-            "legislation",
-        ]
-        with output_path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for row in rows:
-                writer.writerow(row)
+        with self.open_rows(output_path, fieldnames) as writer:
+            writer.writerows(rows)
+
+    def write_value_rows(
+        self, output_path: Path, rows: Iterable[Sequence], fieldnames: Sequence[str] = FIELDNAMES
+    ) -> None:
+        """Write iterable of value tuples already in ``fieldnames`` order (faster than dicts)."""
+        with self.open_rows(output_path, fieldnames) as writer:
+            writer.write_value_rows(rows)
+
+    @contextmanager
+    def open_rows(
+        self, output_path: Path, fieldnames: Sequence[str] = FIELDNAMES, *, resume_at: Optional[int] = None
+    ) -> Iterator[RowWriter]:
+        """Open output for row-by-row writing and yield the ``RowWriter``.
 
+        With ``resume_at`` the existing file is cut back to that byte offset
+        (as reported by ``writer.stream.tell()`` earlier) and appended to.
+        """
+        metrics = self.metrics
+        if metrics is None:
+            with open_row_writer(output_path, self.output_format, fieldnames, resume_at=resume_at) as writer:
+                yield writer
+            return
+        start = time.perf_counter()
+        opened = closing = start
+        writer = None
+        try:
+            with open_row_writer(output_path, self.output_format, fieldnames, resume_at=resume_at) as writer:
+                opened = time.perf_counter()
+                try:
+                    yield writer
+                finally:
+                    closing = time.perf_counter()
+        finally:
+            if writer is not None:
+                # Opening (header included) and the final flush/close
+                seconds = (opened - start) + (time.perf_counter() - closing)
+                metrics.increment("rows_written", writer.rows_written, format=self.output_format)
+                metrics.observe("write_seconds", seconds, format=self.output_format)
 
+    def write_keyed_rows(
+        self, output_paths: Mapping[Hashable, Path], keyed_rows: Iterable[Tuple[Hashable, Union[Dict, Sequence]]]
+    ) -> None:
+        """Fan ``(key, row)`` pairs out to one file per key, all open for a single pass.
+
+        Rows are dicts keyed by column, or value tuples in ``FIELDNAMES`` order.
+        """
+        with ExitStack() as stack:
+            writers = {key: stack.enter_context(self.open_rows(path)) for key, path in output_paths.items()}
+            for key, row in keyed_rows:
+                writer = writers[key]
+                if isinstance(row, dict):
+                    writer.writerow(row)
+                else:
+                    writer.write_values(row)
+
+    def write_matrix(self, output_path: Path, matrix: VoteMatrix) -> None:
+        """Write a wide matrix: one row per member, one column per roll call."""
+        roll_call_columns = [f"{session}-{number}" for _, session, number in matrix.roll_call_keys]
+        rows = (
+            [info.bioguide_id, info.name, info.party, info.state] + votes for info, votes in matrix.iter_labeled_rows()
+        )
+        with self.open_rows(output_path, MATRIX_MEMBER_FIELDNAMES + roll_call_columns) as writer:
+            if self.metrics is None:
+                writer.write_value_rows(rows)
+            else:
+                # The matrix is already in memory, so the whole call is writing
+                with self.metrics.timer("write_seconds", format=self.output_format):
+                    writer.write_value_rows(rows)
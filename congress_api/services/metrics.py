@@ -0,0 +1,192 @@
+"""Run metrics and progress reporting.
+
+``Metrics`` collects counters and latency histograms keyed by a name plus
+labels (e.g. ``requests{endpoint=house-vote/members,status=200}``) from the
+client, iterator, filters and exporter, and renders them as one JSON report
+at the end of a run. Recording takes a lock and a dict lookup, so it is cheap
+enough for every request and roll call. Components take ``metrics=None`` and
+record nothing without one.
+
+``ProgressReporter`` logs scan progress with rate and ETA through the
+``congress_api.progress`` logger, so it is silenced like any other logger.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+# Upper bounds in seconds; a final implicit bucket catches anything slower
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+REPORT_PERCENTILES = (50, 90, 99)
+
+# The one endpoint the client calls, as a metrics label
+MEMBER_VOTES_ENDPOINT = "house-vote/members"
+
+PROGRESS_LOGGER = logging.getLogger("congress_api.progress")
+# Roll calls between progress lines
+PROGRESS_EVERY = 10
+
+_Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class Histogram:
+    """Bucketed latency distribution with exact count, sum, min and max."""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, pct: float) -> float:
+        """Upper bound of the bucket holding the ``pct``-th percentile (capped at ``max``)."""
+        rank = self.count * pct / 100
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict:
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "sum_seconds": round(self.total, 6),
+            "mean_seconds": round(self.total / self.count, 6),
+            "min_seconds": round(self.min, 6),
+            "max_seconds": round(self.max, 6),
+            **{f"p{pct}_seconds": round(self.percentile(pct), 6) for pct in REPORT_PERCENTILES},
+            "buckets": {
+                **{f"le_{bound:g}": count for bound, count in zip(LATENCY_BUCKETS, self.counts)},
+                "inf": self.counts[-1],
+            },
+        }
+
+
+class Metrics:
+    """Thread-safe counters and latency histograms for one run."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._started = clock()
+        self._lock = threading.Lock()
+        self._counters: Dict[_Key, float] = {}
+        self._histograms: Dict[_Key, Histogram] = {}
+
+    def increment(self, name: str, value: float = 1, **labels: object) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels: object) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, name: str, **labels: object) -> Iterator[None]:
+        """Observe the time spent in the ``with`` block under ``name``."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.observe(name, self._clock() - start, **labels)
+
+    def counter(self, name: str, **labels: object) -> float:
+        with self._lock:
+            return self._counters.get(_key(name, labels), 0)
+
+    def histogram(self, name: str, **labels: object) -> Optional[Histogram]:
+        with self._lock:
+            return self._histograms.get(_key(name, labels))
+
+    def report(self) -> Dict:
+        """Everything recorded so far, sorted by name then labels."""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items(), key=lambda item: item[0])
+            return {
+                "elapsed_seconds": round(self._clock() - self._started, 6),
+                "counters": [{"name": name, "labels": dict(labels), "value": value} for (name, labels), value in counters],
+                "histograms": [
+                    {"name": name, "labels": dict(labels), **histogram.to_dict()}
+                    for (name, labels), histogram in histograms
+                ],
+            }
+
+    def write_json(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2) + "\n", encoding="utf-8")
+
+
+def _key(name: str, labels: Dict[str, object]) -> _Key:
+    return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+
+class ProgressReporter:
+    """Logs a progress line with rate and ETA every ``every`` roll calls.
+
+    ``total`` (when known, e.g. after discovery) enables the ETA. Nothing is
+    formatted while the progress logger is disabled for INFO.
+    """
+
+    def __init__(
+        self,
+        congress_number: int,
+        total: Optional[int] = None,
+        *,
+        every: int = PROGRESS_EVERY,
+        logger: logging.Logger = PROGRESS_LOGGER,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.congress_number = congress_number
+        self.total = total
+        self.every = every
+        self.logger = logger
+        self._clock = clock
+        self._started = clock()
+        self.count = 0
+
+    def advance(self, session_year: int, roll_call: int) -> None:
+        self.count += 1
+        if self.count % self.every or not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info(self.message(session_year, roll_call))
+
+    def message(self, session_year: int, roll_call: int) -> str:
+        elapsed = self._clock() - self._started
+        rate = self.count / elapsed if elapsed > 0 else 0.0
+        parts: List[str] = [f"{self.count} of {self.total}" if self.total else f"{self.count} done"]
+        parts.append(f"{rate:.1f} roll calls/s")
+        if self.total and rate > 0:
+            remaining = max(0, self.total - self.count) / rate
+            parts.append(f"ETA {timedelta(seconds=round(remaining))}")
+        return (
+            f"Processing congress={self.congress_number} session={session_year} roll_call={roll_call} "
+            f"({', '.join(parts)})"
+        )
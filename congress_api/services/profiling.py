@@ -0,0 +1,158 @@
+"""Profiling hooks for a single run.
+
+``RunProfiler`` wraps a run (the CLI's ``--profile`` and ``--profile-memory``)
+and writes, under one timestamped prefix in its directory:
+
+- ``<run>.prof``: cProfile dump, for ``pstats``/snakeviz, plus ``<run>.cpu.txt``
+  with the top functions by cumulative time
+- ``<run>.memory.txt``: tracemalloc's top allocation sites and the peak
+- ``<run>.stages.json``: wall-clock seconds per pipeline stage
+
+Stage timings are read from the run's ``Metrics`` (see ``STAGE_HISTOGRAMS``).
+Stages overlap in a streaming export, and fetches on worker threads are summed
+across threads, so the stage totals can exceed the elapsed time. cProfile only
+sees the thread that started it: with ``--workers`` above 1 the fetches run on
+worker threads and show up in the stage timings but not in the CPU profile.
+"""
+from __future__ import annotations
+
+import cProfile
+import io
+import json
+import logging
+import pstats
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .metrics import Metrics
+
+
+DEFAULT_PROFILE_DIR = Path("profiles")
+
+# Pipeline stage -> the metrics histogram whose total is that stage's time
+STAGE_HISTOGRAMS = {
+    "key_load": "key_load_seconds",
+    "fetch": "fetch_seconds",
+    "map": "map_seconds",
+    "filter": "filter_seconds",
+    "write": "write_seconds",
+}
+# Lines kept in the text summaries
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+# Stack frames tracemalloc keeps per allocation
+TRACE_FRAMES = 1
+
+logger = logging.getLogger(__name__)
+
+
+def stage_timings(metrics: Metrics) -> Dict[str, Dict]:
+    """Total seconds and number of timed calls per stage, summed across labels."""
+    totals = {stage: {"seconds": 0.0, "calls": 0} for stage in STAGE_HISTOGRAMS}
+    stages = {name: stage for stage, name in STAGE_HISTOGRAMS.items()}
+    for histogram in metrics.report()["histograms"]:
+        stage = stages.get(histogram["name"])
+        if stage is not None and histogram["count"]:
+            totals[stage]["seconds"] += histogram["sum_seconds"]
+            totals[stage]["calls"] += histogram["count"]
+    for timing in totals.values():
+        timing["seconds"] = round(timing["seconds"], 6)
+    return totals
+
+
+class RunProfiler:
+    """Captures a CPU profile, top memory allocations and stage timings for one run.
+
+    Call ``start`` before the work and ``stop`` after it, also when it fails;
+    ``stop`` writes the files and returns their paths. ``start`` raises
+    ``ValueError`` if another profiler is already active.
+    """
+
+    def __init__(
+        self,
+        directory: Path = DEFAULT_PROFILE_DIR,
+        *,
+        cpu: bool = True,
+        memory: bool = False,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.directory = directory
+        self.cpu = cpu
+        self.memory = memory
+        self._clock = clock
+        self._profile: Optional[cProfile.Profile] = None
+        self._started = 0.0
+        self._tracing = False
+
+    def start(self) -> None:
+        self._started = self._clock()
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+            self._tracing = True
+        if self.cpu:
+            profile = cProfile.Profile()
+            try:
+                # Python 3.12+ raises ValueError while another profiler is active
+                profile.enable()
+            except ValueError:
+                if self._tracing:
+                    tracemalloc.stop()
+                    self._tracing = False
+                raise
+            self._profile = profile
+
+    def stop(self, metrics: Optional[Metrics] = None) -> List[Path]:
+        if self._profile is not None:
+            self._profile.disable()
+        elapsed = self._clock() - self._started
+        written: List[Path] = []
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            prefix = self.directory / datetime.now().strftime("run_%Y%m%d_%H%M%S")
+            if self.memory and tracemalloc.is_tracing():
+                written.append(self._write_memory(prefix))
+            if self._profile is not None:
+                written += self._write_cpu(prefix)
+            if metrics is not None:
+                written.append(self._write_stages(prefix, metrics, elapsed))
+        finally:
+            # Stop tracing even when a write fails
+            if self._tracing:
+                tracemalloc.stop()
+                self._tracing = False
+        logger.info("Profile written to %s", ", ".join(str(path) for path in written))
+        return written
+
+    def _write_cpu(self, prefix: Path) -> List[Path]:
+        dump = prefix.with_suffix(".prof")
+        self._profile.dump_stats(str(dump))
+        summary = io.StringIO()
+        pstats.Stats(self._profile, stream=summary).sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+        text = prefix.with_suffix(".cpu.txt")
+        text.write_text(summary.getvalue(), encoding="utf-8")
+        return [dump, text]
+
+    def _write_memory(self, prefix: Path) -> Path:
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [f"Traced memory: current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB", ""]
+        lines += [f"Top {TOP_ALLOCATIONS} allocation sites:"]
+        lines += [str(stat) for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]]
+        path = prefix.with_suffix(".memory.txt")
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return path
+
+    @staticmethod
+    def _write_stages(prefix: Path, metrics: Metrics, elapsed: float) -> Path:
+        timings = stage_timings(metrics)
+        logger.info(
+            "Stage timings: %s",
+            ", ".join(f"{stage} {timing['seconds']:.3f}s" for stage, timing in timings.items()),
+        )
+        path = prefix.with_suffix(".stages.json")
+        report = {"elapsed_seconds": round(elapsed, 6), "stages": timings}
+        path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        return path
@@ -0,0 +1,135 @@
+"""Client-side pacing for the Congress.gov hourly request quota.
+
+A token bucket refilled at ``requests_per_hour / 3600`` tokens per second paces
+every request made through a shared ``RateLimiter``. The bucket is corrected
+from the ``X-RateLimit-Remaining`` header when the API reports fewer requests
+left than the bucket holds, and a 429 pauses all callers until the
+``Retry-After`` time (or a jittered exponential backoff) has passed.
+"""
+from __future__ import annotations
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Mapping, Optional
+
+
+# Congress.gov allows 5,000 requests per hour per API key
+DEFAULT_REQUESTS_PER_HOUR = 5000
+DEFAULT_MAX_RETRIES = 5
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_CAP_SECONDS = 60.0
+
+
+class RateLimitError(RuntimeError):
+    """Raised when a request is still throttled (HTTP 429) after all retries."""
+
+
+def backoff_delay(
+    attempt: int,
+    *,
+    base: float = BACKOFF_BASE_SECONDS,
+    cap: float = BACKOFF_CAP_SECONDS,
+    rng: Callable[[], float] = random.random,
+) -> float:
+    """Return a "full jitter" delay: uniform in ``[0, min(cap, base * 2**attempt)]``."""
+    return min(cap, base * (2 ** attempt)) * rng()
+
+
+def retry_after_seconds(headers: Mapping[str, str], *, now: Optional[datetime] = None) -> Optional[float]:
+    """Parse a ``Retry-After`` header given as seconds or an HTTP date."""
+    value = _header(headers, "Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    value = headers.get(name)
+    if value is None:
+        lowered = name.lower()
+        value = next((v for k, v in headers.items() if k.lower() == lowered), None)
+    return value
+
+
+class RateLimiter:
+    """Thread-safe token bucket shared by every request of a client.
+
+    ``acquire`` reserves a token under the lock and sleeps outside it, so
+    concurrent workers queue up at the refill rate instead of contending.
+    The bucket starts full (``burst`` defaults to the hourly quota), so short
+    runs are not slowed down; long runs settle at the quota ceiling.
+    The async client shares the limiter through its worker threads.
+    """
+
+    def __init__(
+        self,
+        requests_per_hour: int = DEFAULT_REQUESTS_PER_HOUR,
+        *,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if requests_per_hour < 1:
+            raise ValueError("requests_per_hour must be positive")
+        self.rate = requests_per_hour / 3600.0
+        self.capacity = float(burst if burst is not None else requests_per_hour)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+
+    def acquire(self) -> float:
+        """Block until a request may be sent; return the seconds waited."""
+        delay = self.reserve()
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+    def reserve(self) -> float:
+        """Take a token now and return how long the caller must wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for ``seconds`` (e.g. after a 429)."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Align the bucket with the server's ``X-RateLimit-Remaining`` count."""
+        value = _header(headers, "X-RateLimit-Remaining")
+        if value is None:
+            return
+        try:
+            remaining = float(value)
+        except ValueError:
+            return
+        with self._lock:
+            self._refill(self._clock())
+            if remaining < self._tokens:
+                self._tokens = remaining
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
@@ -0,0 +1,164 @@
+"""Persistent cache for member-votes responses.
+
+Entries are keyed by (congress, session, roll call) and hold the raw JSON body
+zlib-compressed in a single SQLite file. Roll calls from sessions that have
+ended are treated as immutable and served indefinitely; roll calls from the
+current session are served only while younger than a TTL and are refetched
+afterwards. The cache is bounded in size and evicts least-recently-used entries.
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Callable, Optional
+
+
+DEFAULT_CACHE_PATH = Path(".cache") / "congress_api_responses.sqlite3"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS responses (
+    congress INTEGER NOT NULL,
+    session_number INTEGER NOT NULL,
+    roll_call_number INTEGER NOT NULL,
+    status_code INTEGER NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (congress, session_number, roll_call_number)
+);
+
+CREATE INDEX IF NOT EXISTS ix_responses_accessed_at ON responses (accessed_at);
+"""
+
+
+def session_calendar_year(congress: int, session: int) -> int:
+    """Calendar year of a Congress session (the 1st Congress met in 1789)."""
+    return 1789 + 2 * (int(congress) - 1) + (int(session) - 1)
+
+
+@dataclass
+class CachePolicy:
+    """Decides whether a cached entry may be served.
+
+    - recent_ttl_seconds: Maximum age of an entry from a session that may
+      still receive votes; older entries are refetched
+    - today: Date source, injectable for tests
+    """
+
+    recent_ttl_seconds: float = 6 * 60 * 60
+    today: Callable[[], date] = date.today
+
+    def is_immutable(self, congress: int, session: int) -> bool:
+        """A session is closed once its calendar year has passed."""
+        return self.today().year > session_calendar_year(congress, session)
+
+    def is_fresh(self, congress: int, session: int, fetched_at: float, now: float) -> bool:
+        if self.is_immutable(congress, session):
+            return True
+        return now - fetched_at < self.recent_ttl_seconds
+
+
+@dataclass
+class CachedResponse:
+    status_code: int
+    content: bytes
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of raw member-votes responses stored in SQLite.
+
+    Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        db_path: Path = DEFAULT_CACHE_PATH,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        policy: Optional[CachePolicy] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self.policy = policy or CachePolicy()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.executescript(SCHEMA_SQL)
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, congress: int, session: int, roll_call: int) -> Optional[CachedResponse]:
+        """Return a fresh cached response, or None on a miss or stale entry."""
+        key = (int(congress), int(session), int(roll_call))
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status_code, body, fetched_at FROM responses "
+                "WHERE congress = ? AND session_number = ? AND roll_call_number = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+            status_code, body, fetched_at = row
+            if not self.policy.is_fresh(congress, session, fetched_at, now):
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? "
+                "WHERE congress = ? AND session_number = ? AND roll_call_number = ?",
+                (now,) + key,
+            )
+        return CachedResponse(status_code=status_code, content=zlib.decompress(body))
+
+    def put(self, congress: int, session: int, roll_call: int, status_code: int, content: bytes) -> None:
+        """Store a response body, evicting least-recently-used entries if over budget."""
+        key = (int(congress), int(session), int(roll_call))
+        body = zlib.compress(content)
+        now = self._clock()
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM responses WHERE congress = ? AND session_number = ? AND roll_call_number = ?",
+                key,
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(congress, session_number, roll_call_number, status_code, body, size, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                key + (status_code, body, len(body), now, now),
+            )
+            self._total_bytes += len(body) - (previous[0] if previous else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._total_bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self) -> None:
+        cursor = self._conn.execute(
+            "SELECT congress, session_number, roll_call_number, size FROM responses ORDER BY accessed_at"
+        )
+        victims = []
+        for congress, session, roll_call, size in cursor:
+            if self._total_bytes <= self.max_bytes:
+                break
+            victims.append((congress, session, roll_call))
+            self._total_bytes -= size
+        cursor.close()
+        self._conn.executemany(
+            "DELETE FROM responses WHERE congress = ? AND session_number = ? AND roll_call_number = ?",
+            victims,
+        )
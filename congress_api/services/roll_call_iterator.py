@@ -1,16 +1,77 @@
 """Iteration over roll call votes across both session years.
 
-Respects termination signals (HTTP 404 or specific error payload) and prints a
-progress message every 10th roll call to balance visibility and performance.
+Respects termination signals (HTTP 404 or specific error payload) and logs a
+progress line with rate and ETA every 10th roll call to balance visibility and
+performance.
+Optionally keeps several requests in flight on a thread pool while still
+yielding roll calls in session/roll-call order, and can discover each session's
+length up front so the scan covers an exact, known range.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Generator
+import itertools
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, Generator, Iterator, Mapping, Optional, Sequence, Tuple
 
-from .api_client import CongressApiClient
+from .api_client import CongressApiClient, SimpleResponse
+from .metrics import Metrics, ProgressReporter
+from .rate_limiter import RateLimitError
 from ..domain.models import RollCall
-from ..mappers.roll_call_mapper import RollCallMapper
+from ..mappers.roll_call_mapper import MemberPredicate, RollCallMapper
+
+
+# Classification of a single member-votes response
+_OK = "ok"
+_SKIP = "skip"
+_END = "end"
+
+# Discovery gives up after this many failed probes in a row, or past this roll call
+MAX_PROBE_FAILURES = 3
+MAX_ROLL_CALL_NUMBER = 10_000
+
+
+class DiscoveryError(RuntimeError):
+    """Raised when probing cannot find a session's end (the API keeps failing)."""
+
+
+def _classify(response: SimpleResponse) -> str:
+    if response.status_code == 404:
+        return _END
+    if response.status_code == 429:
+        # The client already retried; skipping would silently drop the roll call
+        raise RateLimitError("Congress.gov rate limit still exceeded after retries; try again later")
+    if response.status_code != 200 or not response.json:
+        # Skip on transient/non-200 issues
+        return _SKIP
+    # Some Congress.gov responses return 200 with an error payload when beyond range
+    if isinstance(response.json, dict) and response.json.get("error"):
+        error_msg = str(response.json.get("error", "")).strip()
+        if error_msg.lower().startswith("no vote matches the given query"):
+            return _END
+    return _OK
+
+
+def _map_response(
+    congress_number: int,
+    session_year: int,
+    roll_call: int,
+    response: SimpleResponse,
+    member_filter: Optional[MemberPredicate] = None,
+    metrics: Optional[Metrics] = None,
+) -> RollCall:
+    start = time.perf_counter()
+    mapped = RollCallMapper.from_api_payload(
+        congress=congress_number,
+        roll_call_number=roll_call,
+        payload=response.json,
+        member_filter=member_filter,
+    )
+    if metrics is not None:
+        metrics.observe("map_seconds", time.perf_counter() - start)
+        metrics.increment("members_mapped", len(mapped.members))
+    return mapped
 
 
 class RollCallIterator:
@@ -19,37 +80,191 @@ class RollCallIterator:
     For each of the two session years (1 and 2), starts at roll call 1 and
     increments until terminated by a 404 or a 200 response containing an error
     payload indicating no matching vote.
+
+    With ``workers > 1`` up to ``workers`` roll calls are fetched concurrently.
+    Results are still yielded strictly in order, and anything fetched past the
+    end-of-session signal is discarded.
+
+    With ``discover=True`` the last roll call of each session is located first
+    by exponential probing plus binary search (see ``discover_session_lengths``),
+    and each session is then fetched over its exact ``[1..N]`` range.
+
+    ``start_after`` maps a session year to a roll call number already processed
+    (for example a repository high-water mark); that session resumes just after it.
+    ``sessions`` limits the scan to some session years, e.g. ``(2,)`` when
+    resuming a scan that already finished session 1. ``position`` is the
+    (session year, roll call) the last yielded roll call was fetched as, which
+    is what ``start_after`` expects; the payload's own ``sessionNumber`` may differ.
+
+    ``member_filter`` is handed to ``RollCallMapper`` so yielded roll calls hold
+    only the members it accepts (see ``VotesFilter.raw_member_predicate``).
+
+    Progress is logged through ``ProgressReporter``; with ``metrics`` the scan
+    also records mapper time and how many roll calls ended each way.
     """
 
-    def __init__(self, client: CongressApiClient, congress_number: int) -> None:
+    def __init__(
+        self,
+        client: CongressApiClient,
+        congress_number: int,
+        *,
+        workers: int = 1,
+        discover: bool = False,
+        start_after: Optional[Mapping[int, int]] = None,
+        member_filter: Optional[MemberPredicate] = None,
+        sessions: Sequence[int] = (1, 2),
+        metrics: Optional[Metrics] = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
         self.client = client
         self.congress_number = congress_number
+        self.workers = workers
+        self.discover = discover
+        self.start_after: Dict[int, int] = dict(start_after or {})
+        self.sessions = tuple(sessions)
+        self.member_filter = member_filter
+        self.metrics = metrics
+        self._progress = ProgressReporter(congress_number)
+        # Last valid roll call per session, populated by discovery
+        self.session_lengths: Dict[int, int] = {}
+        # Successful probe responses kept so the scan does not fetch them twice
+        self._prefetched: Dict[Tuple[int, int], SimpleResponse] = {}
+        # Failed discovery probes since the last answer
+        self._probe_failures = 0
+        # (session year, roll call) of the last roll call yielded, as scanned
+        self.position: Optional[Tuple[int, int]] = None
+
+    @property
+    def total(self) -> Optional[int]:
+        """Number of roll calls the scan covers across both sessions, once discovered."""
+        if any(session_year not in self.session_lengths for session_year in self.sessions):
+            return None
+        return sum(
+            max(0, self.session_lengths[session_year] - self.start_after.get(session_year, 0))
+            for session_year in self.sessions
+        )
+
+    def discover_session_lengths(self) -> Dict[int, int]:
+        """Find the last valid roll call number of each session."""
+        for session_year in self.sessions:
+            if session_year not in self.session_lengths:
+                self.session_lengths[session_year] = self.discover_session_length(session_year)
+        return dict(self.session_lengths)
+
+    def discover_session_length(self, session_year: int) -> int:
+        """Return the last valid roll call number in a session (0 if none).
+
+        Probes roll calls 1, 2, 4, 8, ... past the session's ``start_after``
+        floor until the end-of-session signal, then binary searches between the
+        last hit and the first miss. Transient failures count as hits, matching
+        how the scan treats them, but ``MAX_PROBE_FAILURES`` of them in a row or
+        probing past ``MAX_ROLL_CALL_NUMBER`` raises ``DiscoveryError`` rather
+        than galloping on through an outage.
+        """
+        floor = self.start_after.get(session_year, 0)
+        last_hit = floor
+        step = 1
+        probe = floor + step
+        while self._exists(session_year, probe):
+            last_hit = probe
+            step *= 2
+            probe = floor + step
+            if probe > MAX_ROLL_CALL_NUMBER:
+                raise DiscoveryError(
+                    f"Session {session_year} has no end below roll call {MAX_ROLL_CALL_NUMBER}; run without --discover"
+                )
+        first_miss = probe
+        while first_miss - last_hit > 1:
+            middle = (last_hit + first_miss) // 2
+            if self._exists(session_year, middle):
+                last_hit = middle
+            else:
+                first_miss = middle
+        return last_hit
+
+    def _exists(self, session_year: int, roll_call: int) -> bool:
+        response = self.client.get_member_votes(self.congress_number, session_year, roll_call)
+        status = _classify(response)
+        if status == _OK:
+            self._prefetched[(session_year, roll_call)] = response
+        if status != _SKIP:
+            self._probe_failures = 0
+        else:
+            self._probe_failures += 1
+            if self._probe_failures >= MAX_PROBE_FAILURES:
+                raise DiscoveryError(
+                    f"{self._probe_failures} probes in a row failed (last: session {session_year}, "
+                    f"roll call {roll_call}, HTTP {response.status_code}); try again later or run without --discover"
+                )
+        return status != _END
 
     def __iter__(self) -> Generator[RollCall, None, None]:
-        for session_year in (1, 2):
-            roll_call = 1
-            while True:
-                response = self.client.get_member_votes(self.congress_number, session_year, roll_call)
-                if response.status_code == 404:
+        if self.discover:
+            self.discover_session_lengths()
+        self._progress = ProgressReporter(self.congress_number, self.total)
+        if self.workers > 1:
+            yield from self._iter_concurrent()
+            return
+        for session_year in self.sessions:
+            for roll_call in self._roll_call_numbers(session_year):
+                response = self._fetch(session_year, roll_call)
+                status = self._outcome(response)
+                if status == _END:
                     break
-                if response.status_code != 200 or not response.json:
-                    # Skip on transient/non-200 issues
-                    roll_call += 1
-                    continue
-                # Some Congress.gov responses return 200 with an error payload when beyond range
-                if isinstance(response.json, dict) and response.json.get("error"):
-                    error_msg = str(response.json.get("error", "")).strip()
-                    if error_msg.lower().startswith("no vote matches the given query"):
+                if status == _OK:
+                    yield self._map(session_year, roll_call, response)
+
+    def _iter_concurrent(self) -> Generator[RollCall, None, None]:
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="roll-call")
+        try:
+            for session_year in self.sessions:
+                numbers = self._roll_call_numbers(session_year)
+                pending: Deque[Tuple[int, Future]] = deque()
+                while True:
+                    # Keep the window full so `workers` requests are always in flight
+                    while len(pending) < self.workers:
+                        next_roll_call = next(numbers, None)
+                        if next_roll_call is None:
+                            break
+                        pending.append(
+                            (next_roll_call, executor.submit(self._fetch, session_year, next_roll_call))
+                        )
+                    if not pending:
                         break
-                if roll_call % 10 == 0:
-                    print(
-                        f"[INFO] Processing congress={self.congress_number} session={session_year} roll_call={roll_call}"
-                    )
-                yield RollCallMapper.from_api_payload(
-                    congress=self.congress_number,
-                    roll_call_number=roll_call,
-                    payload=response.json,
-                )
-                roll_call += 1
+                    roll_call, future = pending.popleft()
+                    response = future.result()
+                    status = self._outcome(response)
+                    if status == _END:
+                        for _, outstanding in pending:
+                            outstanding.cancel()
+                        break
+                    if status == _OK:
+                        yield self._map(session_year, roll_call, response)
+        finally:
+            executor.shutdown(wait=True)
+
+    def _roll_call_numbers(self, session_year: int) -> Iterator[int]:
+        first = self.start_after.get(session_year, 0) + 1
+        if session_year in self.session_lengths:
+            return iter(range(first, self.session_lengths[session_year] + 1))
+        return itertools.count(first)
+
+    def _fetch(self, session_year: int, roll_call: int) -> SimpleResponse:
+        prefetched = self._prefetched.pop((session_year, roll_call), None)
+        if prefetched is not None:
+            return prefetched
+        return self.client.get_member_votes(self.congress_number, session_year, roll_call)
 
+    def _outcome(self, response: SimpleResponse) -> str:
+        status = _classify(response)
+        if self.metrics is not None:
+            self.metrics.increment("roll_calls", outcome=status)
+        return status
 
+    def _map(self, session_year: int, roll_call: int, response: SimpleResponse) -> RollCall:
+        self._progress.advance(session_year, roll_call)
+        self.position = (session_year, roll_call)
+        return _map_response(
+            self.congress_number, session_year, roll_call, response, self.member_filter, self.metrics
+        )
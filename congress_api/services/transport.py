@@ -0,0 +1,102 @@
+"""HTTP transports used by ``CongressApiClient``.
+
+A transport performs a single GET and returns the raw status, body bytes and
+headers. ``RequestsTransport`` owns a long-lived pooled ``requests.Session`` so
+consecutive roll calls reuse keep-alive connections instead of paying a fresh
+TCP+TLS handshake each. ``InMemoryTransport`` answers from a Python callable,
+which lets tests and benchmarks drive the client without touching the network.
+"""
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+Timeout = Union[float, Tuple[float, float]]
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT: Timeout = (10.0, 30.0)
+
+
+class TransportError(Exception):
+    """Raised when a request fails before any HTTP response is received."""
+
+
+@dataclass
+class TransportResponse:
+    status_code: int
+    content: bytes
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_json(cls, status_code: int, payload: Any, headers: Optional[Mapping[str, str]] = None) -> "TransportResponse":
+        content = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        return cls(status_code=status_code, content=content, headers=dict(headers or {}))
+
+
+class Transport(ABC):
+    @abstractmethod
+    def get(self, url: str, params: Mapping[str, str]) -> TransportResponse:
+        """Perform a GET request, raising ``TransportError`` on network failure."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any pooled resources."""
+
+
+class RequestsTransport(Transport):
+    """Transport backed by a pooled, keep-alive ``requests.Session``.
+
+    - pool_size: Maximum connections kept open per host; match it to the
+      number of concurrent callers to avoid discarding connections
+    - timeout: Seconds, or a ``(connect, read)`` pair
+    - keep_alive: When False, asks the server to close each connection
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        keep_alive: bool = True,
+    ) -> None:
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def get(self, url: str, params: Mapping[str, str]) -> TransportResponse:
+        try:
+            resp = self.session.get(url, params=params, timeout=self.timeout)
+        except requests.RequestException as exc:
+            raise TransportError(str(exc)) from exc
+        return TransportResponse(status_code=resp.status_code, content=resp.content, headers=dict(resp.headers))
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class InMemoryTransport(Transport):
+    """Transport that answers every request from ``handler(url, params)``.
+
+    Each request is recorded in ``requests`` as a ``(url, params)`` tuple.
+    The handler may raise ``TransportError`` to simulate a network failure.
+    """
+
+    def __init__(self, handler: Callable[[str, Mapping[str, str]], TransportResponse]) -> None:
+        self.handler = handler
+        self.requests: List[Tuple[str, Dict[str, str]]] = []
+
+    def get(self, url: str, params: Mapping[str, str]) -> TransportResponse:
+        self.requests.append((url, dict(params)))
+        return self.handler(url, params)
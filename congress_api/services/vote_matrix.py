@@ -0,0 +1,155 @@
+"""Columnar in-memory store of a Congress's votes.
+
+Holds three tables instead of ``RollCall``/``MemberVote`` objects:
+
+- a member roster (``members`` plus a bioguide ID → row index)
+- roll call metadata as parallel columns (``array`` for numbers, lists of
+  shared strings for dates, questions and results)
+- a members × roll calls matrix of uint8 vote codes, one ``bytearray`` row per
+  member, so a full Congress (about 450 members × 1,400 roll calls) takes well
+  under a megabyte regardless of how many roll calls streamed through it
+
+Per-member slices are contiguous byte rows and counts run in C
+(``bytes.count``); ``to_numpy`` exposes the matrix as a 2-D ``uint8`` array
+when NumPy is installed.
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from ..domain.models import MemberVote, RollCall
+from ..mappers.roll_call_mapper import intern_optional
+
+if TYPE_CHECKING:
+    import numpy
+    from ..repositories.base import VotesRepository
+
+
+# Code 0 marks a member who was not on the roll (vacancy, not yet sworn in)
+ABSENT = 0
+DEFAULT_VOTE_LABELS = ["", "Yea", "Nay", "Present", "Not Voting", "Aye", "No"]
+
+
+@dataclass
+class MemberInfo:
+    key: str
+    bioguide_id: Optional[str]
+    name: str
+    party: Optional[str]
+    state: Optional[str]
+
+
+def member_key(mv: MemberVote) -> str:
+    """Stable identity for a member: bioguide ID when present, else full name."""
+    return mv.bioguide_id or mv.full_name
+
+
+class VoteMatrix:
+    """Accumulates roll calls into a columnar members × roll calls vote store."""
+
+    def __init__(self) -> None:
+        self.labels: List[str] = list(DEFAULT_VOTE_LABELS)
+        self.codes: Dict[str, int] = {label: code for code, label in enumerate(self.labels)}
+        # Roll call metadata, one entry per column
+        self.congresses = array("H")
+        self.session_numbers = array("B")
+        self.roll_call_numbers = array("H")
+        self.start_dates: List[Optional[str]] = []
+        self.vote_questions: List[Optional[str]] = []
+        self.results: List[Optional[str]] = []
+        # Member roster, one entry per row
+        self.members: List[MemberInfo] = []
+        self.member_index: Dict[str, int] = {}
+        self.rows: List[bytearray] = []
+
+    @classmethod
+    def from_roll_calls(cls, roll_calls: Iterable[RollCall]) -> "VoteMatrix":
+        """Build a store from roll calls in order, e.g. a ``RollCallIterator``."""
+        return cls().add_roll_calls(roll_calls)
+
+    @classmethod
+    def from_repository(cls, repository: "VotesRepository", congress: int) -> "VoteMatrix":
+        """Build a store from a Congress saved in a repository, without calling the API."""
+        return cls().add_roll_calls(repository.iter_roll_calls(congress))
+
+    @property
+    def roll_call_keys(self) -> List[Tuple[int, int, int]]:
+        return list(zip(self.congresses, self.session_numbers, self.roll_call_numbers))
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.members), len(self.roll_call_numbers)
+
+    def code_for(self, vote_cast: str) -> int:
+        label = vote_cast.strip()
+        code = self.codes.get(label)
+        if code is None:
+            if len(self.labels) > 255:
+                raise ValueError(f"Too many distinct vote values to encode: {label!r}")
+            code = len(self.labels)
+            self.labels.append(label)
+            self.codes[label] = code
+        return code
+
+    def add_roll_call(self, roll_call: RollCall) -> None:
+        column = len(self.roll_call_numbers)
+        self.congresses.append(roll_call.congress)
+        self.session_numbers.append(roll_call.session_number)
+        self.roll_call_numbers.append(roll_call.roll_call_number)
+        self.start_dates.append(roll_call.start_date)
+        self.vote_questions.append(intern_optional(roll_call.vote_question))
+        self.results.append(intern_optional(roll_call.result))
+        for row in self.rows:
+            row.append(ABSENT)
+        for mv in roll_call.members:
+            key = member_key(mv)
+            index = self.member_index.get(key)
+            if index is None:
+                index = len(self.members)
+                self.member_index[key] = index
+                self.members.append(
+                    MemberInfo(key=key, bioguide_id=mv.bioguide_id, name=mv.full_name, party=mv.party, state=mv.state)
+                )
+                self.rows.append(bytearray(column + 1))
+            self.rows[index][column] = self.code_for(mv.vote_cast)
+
+    def add_roll_calls(self, roll_calls: Iterable[RollCall]) -> "VoteMatrix":
+        for roll_call in roll_calls:
+            self.add_roll_call(roll_call)
+        return self
+
+    def member_codes(self, key: str) -> memoryview:
+        """Read-only view of one member's vote codes in roll call order."""
+        return memoryview(self.rows[self.member_index[key]]).toreadonly()
+
+    def member_counts(self, key: str) -> Dict[str, int]:
+        """Count one member's votes by label, e.g. ``{"Yea": 812, "Nay": 530, ...}``."""
+        row = self.rows[self.member_index[key]]
+        counts = {}
+        for code, label in enumerate(self.labels):
+            if code != ABSENT:
+                count = row.count(code)
+                if count:
+                    counts[label] = count
+        return counts
+
+    def roll_call_codes(self, column: int) -> bytes:
+        """Every member's vote code on one roll call, in roster order."""
+        return bytes(row[column] for row in self.rows)
+
+    def to_numpy(self) -> "numpy.ndarray":
+        """Return the vote codes as a members × roll calls ``uint8`` array (requires NumPy)."""
+        try:
+            import numpy as np
+        except ImportError as exc:  # pragma: no cover - depends on the environment
+            raise RuntimeError("VoteMatrix.to_numpy requires NumPy (pip install numpy)") from exc
+        members, roll_calls = self.shape
+        return np.frombuffer(b"".join(self.rows), dtype=np.uint8).reshape(members, roll_calls)
+
+    def iter_labeled_rows(self) -> Iterable[Tuple[MemberInfo, List[str]]]:
+        """Yield each member with their vote labels in roll call order."""
+        labels = self.labels
+        for info, row in zip(self.members, self.rows):
+            yield info, [labels[code] for code in row]
@@ -1,15 +1,116 @@
 """Filtering utilities for member vote results.
 
 Contains logic for matching on member name (case-insensitive, tolerant of first
-name prefixes) and producing normalized CSV-ready row dictionaries.
+name prefixes) and producing normalized CSV-ready rows, either as dictionaries
+keyed by column or as value tuples in column order (cheaper to build and the
+exporter's fast path). Last-name matches are remembered per raw spelling so
+lookups are hash hits. A single scan can serve many members at once through
+``MultiMemberVotesFilter``, or the whole chamber through ``iter_chamber_rows``.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Generator
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Generator, Iterable, List, Mapping, Optional, Tuple
 
+from .metrics import Metrics
 from .roll_call_iterator import RollCallIterator
-from ..domain.models import RollCall
+from ..domain.models import MemberVote, RollCall, name_key
+from ..mappers.roll_call_mapper import MemberPredicate
+
+
+def _vote_url_and_legislation(roll_call: RollCall) -> Tuple[Optional[str], Optional[str]]:
+    year = None
+    if roll_call.start_date and len(roll_call.start_date) >= 4:
+        year = roll_call.start_date[:4]
+    vote_url = None
+    if year:
+        vote_url = f"https://clerk.house.gov/Votes/{year}{roll_call.roll_call_number}"
+    leg_concat = None
+    if roll_call.legislation_type or roll_call.legislation_number:
+        left = (roll_call.legislation_type or "").strip()
+        right = (roll_call.legislation_number or "").strip()
+        leg_concat = (left + (" " if left and right else "") + right) or None
+    return vote_url, leg_concat
+
+
+class RollCallRows:
+    """Builds CSV rows for one roll call.
+
+    The roll-call-level fields (``voteUrl``, ``legislation``, ...) are computed
+    once and shared by every member row produced for that roll call.
+    """
+
+    __slots__ = ("_head", "_tail")
+
+    def __init__(self, roll_call: RollCall) -> None:
+        vote_url, leg_concat = _vote_url_and_legislation(roll_call)
+        # Columns before and after the member fields, in CSV column order
+        self._head = (roll_call.congress, roll_call.session_number, roll_call.start_date)
+        self._tail = (roll_call.roll_call_number, vote_url, roll_call.vote_question, leg_concat)
+
+    def values(self, mv: MemberVote) -> Tuple:
+        """The row as a tuple in ``FIELDNAMES`` order."""
+        return self._head + (mv.full_name, mv.vote_cast.strip()) + self._tail
+
+    def row(self, mv: MemberVote) -> Dict:
+        congress, session_number, date = self._head
+        roll_call_number, vote_url, vote_question, legislation = self._tail
+        return {
+            "congress": congress,
+            "sessionNumber": session_number,
+            "date": date,
+            "memberName": mv.full_name,
+            "voteCast": mv.vote_cast.strip(),
+            "rollCallNumber": roll_call_number,
+            "voteUrl": vote_url,
+            "voteQuestion": vote_question,
+            "legislation": legislation,
+        }
+
+
+def iter_chamber_values(
+    iterator: Iterable[RollCall], metrics: Optional[Metrics] = None
+) -> Generator[Tuple, None, None]:
+    """Yield one long-format row per member vote as a tuple in ``CHAMBER_FIELDNAMES`` order.
+
+    With ``metrics`` the time the consumer spends on each roll call's rows is
+    recorded as ``write_seconds``.
+    """
+    for roll_call in iterator:
+        vote_url, leg_concat = _vote_url_and_legislation(roll_call)
+        head = (roll_call.congress, roll_call.session_number, roll_call.start_date, roll_call.roll_call_number)
+        tail = (vote_url, roll_call.vote_question, leg_concat)
+        start = time.perf_counter() if metrics is not None else 0.0
+        for mv in roll_call.members:
+            yield head + (mv.bioguide_id, mv.full_name, mv.party, mv.state, mv.vote_cast.strip()) + tail
+        if metrics is not None:
+            metrics.observe("write_seconds", time.perf_counter() - start)
+
+
+def iter_chamber_rows(iterator: Iterable[RollCall]) -> Generator[Dict, None, None]:
+    """Yield one long-format row per member vote of every roll call."""
+    for roll_call in iterator:
+        vote_url, leg_concat = _vote_url_and_legislation(roll_call)
+        for mv in roll_call.members:
+            yield {
+                "congress": roll_call.congress,
+                "sessionNumber": roll_call.session_number,
+                "date": roll_call.start_date,
+                "rollCallNumber": roll_call.roll_call_number,
+                "bioguideId": mv.bioguide_id,
+                "memberName": mv.full_name,
+                "party": mv.party,
+                "state": mv.state,
+                "voteCast": mv.vote_cast.strip(),
+                "voteUrl": vote_url,
+                "voteQuestion": roll_call.vote_question,
+                "legislation": leg_concat,
+            }
+
+
+class AmbiguousMemberError(ValueError):
+    """Raised when a name matches more than one member (distinct bioguide IDs)."""
 
 
 @dataclass
@@ -19,50 +120,240 @@ class VotesFilter:
     Name matching is case-insensitive. First names are matched with tolerance
     for prefixes (e.g., "Katie" vs "Katherine"), while last names must match
     exactly (ignoring case).
+
+    Each distinct raw last-name spelling is normalized once and its outcome
+    kept in a hash index that persists across roll calls, so checking a member
+    costs a single dictionary lookup for the rest of the Congress.
+
+    Names are resolved to a bioguide ID on the first roll call where they
+    match; from then on only ``MemberVote.bioguide_id`` is compared. If a name
+    matches several members, an exact first-name match breaks the tie,
+    otherwise ``AmbiguousMemberError`` is raised. Passing ``bioguide_id``
+    skips name matching entirely.
+
+    With ``metrics`` the time spent matching each roll call is recorded as
+    ``filter_seconds``, and the time the consumer spends on its rows (encoding
+    and writing them) as ``write_seconds``. Timing once per roll call leaves
+    the writers' C-level loops untouched.
     """
 
-    target_first: str
-    target_last: str
+    target_first: str = ""
+    target_last: str = ""
+    bioguide_id: Optional[str] = None
+    metrics: Optional[Metrics] = field(default=None, repr=False, compare=False)
+    _first: str = field(init=False, repr=False, compare=False)
+    _last: str = field(init=False, repr=False, compare=False)
+    _resolved_id: Optional[str] = field(init=False, repr=False, compare=False)
+    _last_index: Dict[str, bool] = field(init=False, repr=False, compare=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._first = name_key(self.target_first)
+        self._last = name_key(self.target_last)
+        self._resolved_id = self.bioguide_id.strip() if self.bioguide_id else None
+        if not self._resolved_id and not self._last:
+            raise ValueError("A member needs a last name or a bioguide ID")
+
+    @property
+    def resolved_bioguide_id(self) -> Optional[str]:
+        """The bioguide ID being matched, once given or resolved."""
+        return self._resolved_id
+
+    def raw_member_predicate(self) -> MemberPredicate:
+        """Predicate over raw API member entries for ``RollCallMapper`` projection.
+
+        Accepts only entries this filter could match: the resolved bioguide ID
+        once known, otherwise the target's last name. State is read at call
+        time, so the projection narrows as soon as the ID resolves.
+        """
+
+        def keep(raw: Mapping) -> bool:
+            if self._resolved_id is not None:
+                return raw.get("bioguideID") == self._resolved_id
+            return self.matches_last_name(str(raw.get("lastName", "")))
+
+        return keep
+
+    def matches(self, mv: MemberVote) -> bool:
+        if self._resolved_id is not None:
+            return mv.bioguide_id == self._resolved_id
+        return self.matches_last_name(mv.last_name) and self.matches_first_name(mv)
+
+    def matching(self, roll_call: RollCall) -> List[MemberVote]:
+        """Return this target's member votes in a roll call."""
+        resolved_id = self._resolved_id
+        if resolved_id is not None:
+            return [mv for mv in roll_call.members if mv.bioguide_id == resolved_id]
+        index_get = self._last_index.get
+        found = []
+        for mv in roll_call.members:
+            hit = index_get(mv.last_name)
+            if hit is None:
+                hit = self.matches_last_name(mv.last_name)
+            if hit and self.matches_first_name(mv):
+                found.append(mv)
+        return self.resolve(found)
+
+    def resolve(self, name_matches: List[MemberVote]) -> List[MemberVote]:
+        """Resolve the bioguide ID from a roll call's name matches and keep that member's votes.
+
+        Payloads without IDs leave the filter on name matching. Raises
+        ``AmbiguousMemberError`` if the matches name several members and no
+        exact first-name match picks one.
+        """
+        ids = {mv.bioguide_id for mv in name_matches if mv.bioguide_id}
+        if not ids:
+            # Payload without IDs: stay on name matching
+            return name_matches
+        if len(ids) > 1:
+            exact_ids = {
+                mv.bioguide_id
+                for mv in name_matches
+                if mv.bioguide_id and name_key(mv.first_name) == self._first
+            }
+            if len(exact_ids) != 1:
+                candidates = ", ".join(
+                    sorted(f"{mv.bioguide_id} ({mv.full_name}, {mv.party or '?'}-{mv.state or '?'})"
+                           for mv in name_matches if mv.bioguide_id)
+                )
+                raise AmbiguousMemberError(
+                    f"'{self.target_first} {self.target_last}' matches several members: {candidates}. "
+                    "Select one by bioguide ID (--bioguide)."
+                )
+            ids = exact_ids
+        self._resolved_id = ids.pop()
+        return [mv for mv in name_matches if mv.bioguide_id == self._resolved_id]
+
+    def matches_last_name(self, last_name: str) -> bool:
+        """Whether a raw last-name spelling is the target's (never, without a target last name)."""
+        if not self._last:
+            return False
+        hit = self._last_index.get(last_name)
+        if hit is None:
+            hit = self._last_index[last_name] = name_key(last_name) == self._last
+        return hit
+
+    def matches_first_name(self, mv: MemberVote) -> bool:
+        """Whether the member's first name matches the target's, allowing prefixes."""
+        first = name_key(mv.first_name)
+        return first == self._first or first.startswith(self._first) or self._first.startswith(first)
 
     def iter_member_rows(self, iterator: RollCallIterator) -> Generator[Dict, None, None]:
-        normalized_first = self.target_first.strip().lower()
-        normalized_last = self.target_last.strip().lower()
+        for rows, mv in self._iter_matches(iterator):
+            yield rows.row(mv)
+
+    def iter_member_values(self, iterator: Iterable[RollCall]) -> Generator[Tuple, None, None]:
+        """Like ``iter_member_rows``, with each row as a tuple in ``FIELDNAMES`` order."""
+        for rows, mv in self._iter_matches(iterator):
+            yield rows.values(mv)
 
+    def _iter_matches(self, iterator: Iterable[RollCall]) -> Generator[Tuple[RollCallRows, MemberVote], None, None]:
+        metrics = self.metrics
         for roll_call in iterator:
+            start = time.perf_counter()
+            matched = self.matching(roll_call)
+            if metrics is not None:
+                metrics.observe("filter_seconds", time.perf_counter() - start)
+            if matched:
+                rows = RollCallRows(roll_call)
+                start = time.perf_counter()
+                for mv in matched:
+                    yield rows, mv
+                if metrics is not None:
+                    metrics.observe("write_seconds", time.perf_counter() - start)
+
+
+@dataclass
+class MultiMemberVotesFilter:
+    """Filter producing rows for many members from a single pass over roll calls.
+
+    Rows are yielded as ``(target_index, row)`` pairs, where ``target_index`` is
+    the position of the matching filter in ``targets``. Targets with a known
+    bioguide ID are found through one ID → targets hash index; the rest go
+    through a last-name spelling → targets index built once across the
+    Congress, and each is switched to ID matching as soon as it resolves. The
+    per-member cost does not grow with the number of targets.
+
+    With ``metrics`` it records ``filter_seconds`` and ``write_seconds`` like
+    ``VotesFilter``.
+    """
+
+    targets: List[VotesFilter]
+    metrics: Optional[Metrics] = field(default=None, repr=False, compare=False)
+    _last_index: Dict[str, Tuple[int, ...]] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _id_index: Dict[str, List[int]] = field(init=False, repr=False, compare=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        for position, target in enumerate(self.targets):
+            if target.resolved_bioguide_id is not None:
+                self._id_index.setdefault(target.resolved_bioguide_id, []).append(position)
+
+    def iter_rows(self, iterator: Iterable[RollCall]) -> Generator[Tuple[int, Dict], None, None]:
+        for position, rows, mv in self._iter_matches(iterator):
+            yield position, rows.row(mv)
+
+    def iter_values(self, iterator: Iterable[RollCall]) -> Generator[Tuple[int, Tuple], None, None]:
+        """Like ``iter_rows``, with each row as a tuple in ``FIELDNAMES`` order."""
+        for position, rows, mv in self._iter_matches(iterator):
+            yield position, rows.values(mv)
+
+    def _iter_matches(
+        self, iterator: Iterable[RollCall]
+    ) -> Generator[Tuple[int, RollCallRows, MemberVote], None, None]:
+        last_get = self._last_index.get
+        metrics = self.metrics
+        for roll_call in iterator:
+            start = time.perf_counter()
+            id_get = self._id_index.get
+            hits: List[Tuple[int, MemberVote]] = []
+            name_matched: Dict[int, List[MemberVote]] = {}
             for mv in roll_call.members:
-                first = mv.first_name.strip().lower()
-                last = mv.last_name.strip().lower()
-                name_match = (
-                    last == normalized_last
-                    and (
-                        first == normalized_first
-                        or first.startswith(normalized_first)
-                        or normalized_first.startswith(first)
-                    )
-                )
-                if name_match:
-                    year = None
-                    if roll_call.start_date and len(roll_call.start_date) >= 4:
-                        year = roll_call.start_date[:4]
-                    vote_url = None
-                    if year:
-                        vote_url = f"https://clerk.house.gov/Votes/{year}{roll_call.roll_call_number}"
-                    leg_concat = None
-                    if roll_call.legislation_type or roll_call.legislation_number:
-                        left = (roll_call.legislation_type or "").strip()
-                        right = (roll_call.legislation_number or "").strip()
-                        leg_concat = (left + (" " if left and right else "") + right) or None
-
-                    yield {
-                        "congress": roll_call.congress,
-                        "sessionNumber": roll_call.session_number,
-                        "date": roll_call.start_date,
-                        "memberName": mv.full_name,
-                        "voteCast": mv.vote_cast.strip(),
-                        "rollCallNumber": roll_call.roll_call_number,
-                        "voteUrl": vote_url,
-                        "voteQuestion": roll_call.vote_question,
-                        "legislation": leg_concat,
-                    }
+                if mv.bioguide_id is not None:
+                    for position in id_get(mv.bioguide_id, ()):
+                        hits.append((position, mv))
+                positions = last_get(mv.last_name)
+                if positions is None:
+                    positions = self._index_last_name(mv.last_name)
+                for position in positions:
+                    target = self.targets[position]
+                    if target.resolved_bioguide_id is None and target.matches_first_name(mv):
+                        name_matched.setdefault(position, []).append(mv)
+                        hits.append((position, mv))
+            if name_matched:
+                kept = set()
+                for position, candidates in name_matched.items():
+                    target = self.targets[position]
+                    kept.update((position, id(mv)) for mv in target.resolve(candidates))
+                    # Only a newly resolved target changes the ID index
+                    if target.resolved_bioguide_id is not None:
+                        self._id_index.setdefault(target.resolved_bioguide_id, []).append(position)
+                hits = [(p, mv) for p, mv in hits if p not in name_matched or (p, id(mv)) in kept]
+            if metrics is not None:
+                metrics.observe("filter_seconds", time.perf_counter() - start)
+            if hits:
+                rows = RollCallRows(roll_call)
+                start = time.perf_counter()
+                for position, mv in hits:
+                    yield position, rows, mv
+                if metrics is not None:
+                    metrics.observe("write_seconds", time.perf_counter() - start)
+
+    def raw_member_predicate(self) -> MemberPredicate:
+        """Predicate over raw API member entries accepting any entry a target could match."""
+
+        def keep(raw: Mapping) -> bool:
+            if raw.get("bioguideID") in self._id_index:
+                return True
+            last_name = str(raw.get("lastName", ""))
+            positions = self._last_index.get(last_name)
+            if positions is None:
+                positions = self._index_last_name(last_name)
+            return any(self.targets[position].resolved_bioguide_id is None for position in positions)
 
+        return keep
 
+    def _index_last_name(self, last_name: str) -> Tuple[int, ...]:
+        positions = tuple(
+            position for position, target in enumerate(self.targets) if target.matches_last_name(last_name)
+        )
+        self._last_index[last_name] = positions
+        return positions
@@ -0,0 +1,189 @@
+"""Row writers for export output formats.
+
+Every writer takes rows in a fixed column order, either as dicts keyed by
+column name or as value sequences in column order, and writes them to an open
+text stream:
+
+- ``csv``: CSV with a header row
+- ``csv.gz``: the same CSV, gzip-compressed while it is written
+- ``ndjson``: one JSON object per line (JSON Lines)
+
+``open_row_writer`` opens the destination, a file path or ``STDOUT`` for
+streaming into another program, and yields the matching writer. Files are
+written through a ``WRITE_BUFFER_SIZE`` buffer; value rows passed to
+``write_value_rows`` go through ``csv.writer.writerows`` in one C-level loop,
+the fast path for large exports.
+"""
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+import sys
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from itertools import count
+from operator import itemgetter
+from pathlib import Path
+from typing import IO, Dict, Iterable, Iterator, Optional, Sequence
+
+
+OUTPUT_FORMATS = ("csv", "csv.gz", "ndjson")
+FORMAT_SUFFIXES = {"csv": ".csv", "csv.gz": ".csv.gz", "ndjson": ".ndjson"}
+# Passing this path writes to standard output instead of a file
+STDOUT = Path("-")
+# Bytes buffered before each write to an output file
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+class RowWriter(ABC):
+    """Writes rows with a fixed set/order of columns to a text stream.
+
+    ``rows_written`` counts the rows written so far, header excluded.
+    """
+
+    def __init__(self, stream: IO[str], fieldnames: Sequence[str]) -> None:
+        self.stream = stream
+        self.fieldnames = list(fieldnames)
+        self.rows_written = 0
+
+    def write_header(self) -> None:
+        """Write whatever precedes the first row (nothing by default)."""
+
+    @abstractmethod
+    def writerow(self, row: Dict) -> None:
+        """Write one row given as a dict keyed by column name."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def write_values(self, values: Sequence) -> None:
+        """Write one row given as values in column order."""
+        raise NotImplementedError
+
+    def writerows(self, rows: Iterable[Dict]) -> None:
+        for row in rows:
+            self.writerow(row)
+
+    def write_value_rows(self, rows: Iterable[Sequence]) -> None:
+        """Write many rows given as values in column order (the fast path)."""
+        for values in rows:
+            self.write_values(values)
+
+
+class CsvRowWriter(RowWriter):
+    def __init__(self, stream: IO[str], fieldnames: Sequence[str]) -> None:
+        super().__init__(stream, fieldnames)
+        self._dict_writer = csv.DictWriter(stream, fieldnames=self.fieldnames)
+        self._writer = csv.writer(stream)
+
+    def write_header(self) -> None:
+        self._dict_writer.writeheader()
+
+    def writerow(self, row: Dict) -> None:
+        self._dict_writer.writerow(row)
+        self.rows_written += 1
+
+    def write_values(self, values: Sequence) -> None:
+        self._writer.writerow(values)
+        self.rows_written += 1
+
+    def write_value_rows(self, rows: Iterable[Sequence]) -> None:
+        # Count rows with zip/itemgetter so the whole loop stays in C
+        counter = count()
+        try:
+            self._writer.writerows(map(itemgetter(0), zip(rows, counter)))
+        finally:
+            self.rows_written += next(counter)
+
+
+class NdjsonRowWriter(RowWriter):
+    def __init__(self, stream: IO[str], fieldnames: Sequence[str]) -> None:
+        super().__init__(stream, fieldnames)
+        self._encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+    def writerow(self, row: Dict) -> None:
+        self.stream.write(self._encode({name: row.get(name) for name in self.fieldnames}) + "\n")
+        self.rows_written += 1
+
+    def write_values(self, values: Sequence) -> None:
+        self.stream.write(self._encode(dict(zip(self.fieldnames, values))) + "\n")
+        self.rows_written += 1
+
+    def write_value_rows(self, rows: Iterable[Sequence]) -> None:
+        encode, fieldnames = self._encode, self.fieldnames
+        counter = count()
+        try:
+            self.stream.writelines(encode(dict(zip(fieldnames, values))) + "\n" for values, _ in zip(rows, counter))
+        finally:
+            self.rows_written += next(counter)
+
+
+ROW_WRITERS = {"csv": CsvRowWriter, "csv.gz": CsvRowWriter, "ndjson": NdjsonRowWriter}
+
+
+def check_format(output_format: str) -> str:
+    if output_format not in ROW_WRITERS:
+        raise ValueError(f"Unknown output format {output_format!r}; expected one of {', '.join(OUTPUT_FORMATS)}")
+    return output_format
+
+
+def is_appendable(output_format: str, output_path: Optional[Path]) -> bool:
+    """Whether output can be cut back to a byte offset and appended to (used by resume).
+
+    ``output_path`` is None for the default timestamped file.
+    """
+    return output_path != STDOUT and not output_format.endswith(".gz")
+
+
+@contextmanager
+def open_row_writer(
+    output_path: Path,
+    output_format: str,
+    fieldnames: Sequence[str],
+    *,
+    resume_at: Optional[int] = None,
+) -> Iterator[RowWriter]:
+    """Open ``output_path`` (or ``STDOUT``) and yield a writer for ``output_format``.
+
+    With ``resume_at`` the existing file is cut back to that byte offset and
+    appended to without a new header; only uncompressed files support this.
+    """
+    writer_cls = ROW_WRITERS[check_format(output_format)]
+    if output_path == STDOUT:
+        if resume_at is not None:
+            raise ValueError("Cannot resume output written to stdout")
+        if output_format.endswith(".gz"):
+            # Compressed bytes go to the binary stream under sys.stdout, which stays open
+            sys.stdout.flush()
+            with _gzip_text_stream(gzip.GzipFile(filename="", mode="wb", fileobj=sys.stdout.buffer)) as stream:
+                writer = writer_cls(stream, fieldnames)
+                writer.write_header()
+                yield writer
+            sys.stdout.buffer.flush()
+            return
+        writer = writer_cls(sys.stdout, fieldnames)
+        writer.write_header()
+        yield writer
+        sys.stdout.flush()
+        return
+    if resume_at is not None:
+        if not is_appendable(output_format, output_path):
+            raise ValueError(f"Cannot resume {output_format} output")
+        with output_path.open("r+b") as raw:
+            raw.truncate(resume_at)
+        stream = output_path.open("a", buffering=WRITE_BUFFER_SIZE, newline="", encoding="utf-8")
+    elif output_format.endswith(".gz"):
+        stream = _gzip_text_stream(gzip.GzipFile(output_path, "wb"))
+    else:
+        stream = output_path.open("w", buffering=WRITE_BUFFER_SIZE, newline="", encoding="utf-8")
+    with stream:
+        writer = writer_cls(stream, fieldnames)
+        if resume_at is None:
+            writer.write_header()
+        yield writer
+
+
+def _gzip_text_stream(compressed: gzip.GzipFile) -> IO[str]:
+    # Compress in large blocks rather than per text chunk
+    return io.TextIOWrapper(io.BufferedWriter(compressed, WRITE_BUFFER_SIZE), newline="", encoding="utf-8")
@@ -0,0 +1,137 @@
+"""Shared test fakes: a manual clock, member-votes payloads and a fake Congress.gov client."""
+import random
+import threading
+import time
+from contextlib import ExitStack
+from unittest import mock
+
+import pytest
+
+from congress_api.domain.models import MemberVote, RollCall
+from congress_api.services.api_client import SimpleResponse
+
+
+CLIENT_TARGET = "congress_api.commands.export_command.CongressApiClient"
+
+# (bioguide ID, first name, last name, vote)
+ZINKE = ("Z000017", "Ryan", "Zinke", "Yea")
+
+
+class FakeClock:
+    """Clock for ``clock=``/``sleep=`` parameters; time moves only when a test or ``sleep`` moves it."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def member_votes_payload(session, voters=(ZINKE,), **fields):
+    """A member-votes API payload for one roll call; ``fields`` add or replace vote metadata."""
+    vote = {"sessionNumber": session, "startDate": "2023-03-01T12:00:00-05:00", **fields}
+    vote["results"] = [
+        {"bioguideID": bioguide_id, "firstName": first, "lastName": last, "voteCast": cast}
+        for bioguide_id, first, last, cast in voters
+    ]
+    return {"houseRollCallVoteMemberVotes": vote}
+
+
+def zinke_roll_call(session_number, roll_call_number):
+    """A Congress 118 roll call, as stored, with Ryan Zinke voting Yea."""
+    bioguide_id, first, last, cast = ZINKE
+    return RollCall(
+        congress=118,
+        session_number=session_number,
+        roll_call_number=roll_call_number,
+        start_date=None,
+        members=[MemberVote(bioguide_id=bioguide_id, first_name=first, last_name=last, vote_cast=cast)],
+    )
+
+
+class FakeApiClient:
+    """Stands in for ``CongressApiClient``: roll calls 1..N per session, then the end-of-session 404.
+
+    - last_by_session: Last roll call of each session
+    - payload: Builds the payload for (session, roll call); Ryan Zinke voting Yea by default
+    - skip: (session, roll call) pairs answered with a 500
+    - error_payload_end: End sessions with the 200 error payload instead of a 404
+    - delay: Up to this many seconds of random delay, so concurrent completions arrive out of order
+    - fail_at: (session, roll call) whose request raises ``KeyboardInterrupt``
+
+    ``calls`` records every request. Calling the instance returns it, so it can
+    replace the ``CongressApiClient`` class wherever the commands build a client.
+    """
+
+    def __init__(
+        self,
+        last_by_session,
+        *,
+        payload=lambda session, roll_call: member_votes_payload(session),
+        skip=(),
+        error_payload_end=False,
+        delay=0.0,
+        fail_at=None,
+    ):
+        self.last_by_session = last_by_session
+        self.payload = payload
+        self.skip = set(skip)
+        self.error_payload_end = error_payload_end
+        self.delay = delay
+        self.fail_at = fail_at
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def get_member_votes(self, congress_number, session_year, roll_call_number):
+        key = (session_year, roll_call_number)
+        if key == self.fail_at:
+            raise KeyboardInterrupt
+        with self._lock:
+            self.calls.append(key)
+        if self.delay:
+            time.sleep(random.uniform(0, self.delay))
+        if roll_call_number > self.last_by_session[session_year]:
+            if self.error_payload_end:
+                return SimpleResponse(status_code=200, json={"error": "No Vote matches the given query."})
+            return SimpleResponse(status_code=404, json=None)
+        if key in self.skip:
+            return SimpleResponse(status_code=500, json=None)
+        return SimpleResponse(status_code=200, json=self.payload(session_year, roll_call_number))
+
+
+@pytest.fixture
+def fake_clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def member_votes():
+    """``member_votes_payload``: ``member_votes(session, voters=..., **fields)``."""
+    return member_votes_payload
+
+
+@pytest.fixture
+def make_roll_call():
+    """``zinke_roll_call``: ``make_roll_call(session_number, roll_call_number)``."""
+    return zinke_roll_call
+
+
+@pytest.fixture
+def fake_api():
+    """Factory for ``FakeApiClient``s, each also patched in as the export commands' client."""
+    with ExitStack() as stack:
+
+        def make(last_by_session, **options):
+            client = FakeApiClient(last_by_session, **options)
+            stack.enter_context(mock.patch(CLIENT_TARGET, client))
+            return client
+
+        yield make
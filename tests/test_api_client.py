@@ -1,71 +1,102 @@
-from unittest.mock import patch, Mock
+from unittest.mock import patch
+
 import requests
 
 from congress_api.services.api_client import CongressApiClient
+from congress_api.services.transport import (
+    InMemoryTransport,
+    RequestsTransport,
+    TransportError,
+    TransportResponse,
+)
+
 
+def make_transport(*responses):
+    """Transport replaying the given responses (or raising exceptions) in order."""
+    queue = list(responses)
 
-def make_response(status_code=200, json_payload=None):
-    m = Mock()
-    m.status_code = status_code
-    def _json():
-        if isinstance(json_payload, Exception):
-            raise json_payload
-        return json_payload
-    m.json = _json
-    return m
+    def handler(url, params):
+        item = queue.pop(0) if len(queue) > 1 else queue[0]
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    return InMemoryTransport(handler)
 
 
 @patch("congress_api.services.api_client.time.sleep")
-@patch("congress_api.services.api_client.requests.get")
-def test_api_client_200(mock_get, mock_sleep):
-    mock_get.return_value = make_response(200, {"ok": True})
-    client = CongressApiClient(api_key="k")
+def test_api_client_200(mock_sleep):
+    transport = make_transport(TransportResponse.from_json(200, {"ok": True}))
+    client = CongressApiClient(api_key="k", transport=transport)
     resp = client.get_member_votes(118, 1, 1)
     assert resp.status_code == 200
     assert resp.json == {"ok": True}
+    url, params = transport.requests[0]
+    assert url == "https://api.congress.gov/v3/house-vote/118/1/1/members"
+    assert params == {"api_key": "k", "format": "json"}
 
 
 @patch("congress_api.services.api_client.time.sleep")
-@patch("congress_api.services.api_client.requests.get")
-def test_api_client_404(mock_get, mock_sleep):
-    mock_get.return_value = make_response(404, {"error": "No Vote matches the given query"})
-    client = CongressApiClient(api_key="k")
+def test_api_client_404(mock_sleep):
+    transport = make_transport(TransportResponse.from_json(404, {"error": "No Vote matches the given query"}))
+    client = CongressApiClient(api_key="k", transport=transport)
     resp = client.get_member_votes(118, 1, 99999)
     assert resp.status_code == 404
 
 
 @patch("congress_api.services.api_client.time.sleep")
-@patch("congress_api.services.api_client.requests.get")
-def test_api_client_429_then_200(mock_get, mock_sleep):
-    mock_get.side_effect = [
-        make_response(429, {"retry": True}),
-        make_response(200, {"ok": True}),
-    ]
-    client = CongressApiClient(api_key="k")
+def test_api_client_429_then_200(mock_sleep):
+    transport = make_transport(
+        TransportResponse.from_json(429, {"retry": True}),
+        TransportResponse.from_json(200, {"ok": True}),
+    )
+    client = CongressApiClient(api_key="k", transport=transport)
     resp = client.get_member_votes(118, 1, 1)
     assert resp.status_code == 200
     assert resp.json == {"ok": True}
 
 
 @patch("congress_api.services.api_client.time.sleep")
-@patch("congress_api.services.api_client.requests.get")
-def test_api_client_bad_json(mock_get, mock_sleep):
-    class BadJson(Exception):
-        pass
-    mock_get.return_value = make_response(200, BadJson("boom"))
-    client = CongressApiClient(api_key="k")
+def test_api_client_bad_json(mock_sleep):
+    transport = make_transport(TransportResponse(status_code=200, content=b"<html>boom"))
+    client = CongressApiClient(api_key="k", transport=transport)
     resp = client.get_member_votes(118, 1, 1)
     assert resp.status_code == 200
     assert resp.json is None
 
 
 @patch("congress_api.services.api_client.time.sleep")
-@patch("congress_api.services.api_client.requests.get")
-def test_api_client_network_error(mock_get, mock_sleep):
-    mock_get.side_effect = requests.RequestException("net")
-    client = CongressApiClient(api_key="k")
+def test_api_client_network_error(mock_sleep):
+    transport = make_transport(TransportError("net"))
+    client = CongressApiClient(api_key="k", transport=transport)
     resp = client.get_member_votes(118, 1, 1)
     assert resp.status_code == 0
     assert resp.json is None
 
 
+def test_requests_transport_reuses_one_session():
+    transport = RequestsTransport(pool_size=4, timeout=(1.0, 2.0))
+    adapter = transport.session.get_adapter("https://api.congress.gov")
+    assert adapter._pool_maxsize == 4
+
+    class FakeResponse:
+        status_code = 200
+        content = b'{"ok": true}'
+        headers = {"Content-Type": "application/json"}
+
+    with patch.object(transport.session, "get", return_value=FakeResponse()) as mock_get:
+        client = CongressApiClient(api_key="k", transport=transport)
+        client.get_member_votes(118, 1, 1)
+        client.get_member_votes(118, 1, 2)
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs["timeout"] == (1.0, 2.0)
+
+
+def test_requests_transport_wraps_network_errors():
+    transport = RequestsTransport()
+    with patch.object(transport.session, "get", side_effect=requests.ConnectionError("down")):
+        try:
+            transport.get("https://example.invalid", {})
+            assert False, "Expected TransportError"
+        except TransportError as exc:
+            assert "down" in str(exc)
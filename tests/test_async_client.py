@@ -0,0 +1,74 @@
+import asyncio
+import random
+
+from congress_api.services.async_api_client import AsyncCongressApiClient
+from congress_api.services.async_roll_call_iterator import AsyncRollCallIterator
+from congress_api.services.transport import InMemoryTransport, TransportResponse
+
+
+def make_payload(session_year):
+    return {
+        "houseRollCallVoteMemberVotes": {
+            "sessionNumber": session_year,
+            "startDate": "2023-01-01T00:00:00-05:00",
+            "results": [{"firstName": "Ada", "lastName": "Lovelace", "voteCast": "Yea"}],
+        }
+    }
+
+
+class FakeAsyncClient:
+    def __init__(self, last_by_session, skip=()):
+        self.last_by_session = last_by_session
+        self.skip = set(skip)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_member_votes(self, congress, session, roll_call):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(random.uniform(0, 0.003))
+            if roll_call > self.last_by_session[session]:
+                return type("Resp", (), {"status_code": 404, "json": None})
+            if (session, roll_call) in self.skip:
+                return type("Resp", (), {"status_code": 500, "json": None})
+            return type("Resp", (), {"status_code": 200, "json": make_payload(session)})
+        finally:
+            self.in_flight -= 1
+
+
+async def collect(iterator):
+    return [(rc.session_number, rc.roll_call_number) async for rc in iterator]
+
+
+def test_async_iterator_in_order_and_bounded():
+    client = FakeAsyncClient({1: 15, 2: 4}, skip={(1, 3)})
+    keys = asyncio.run(collect(AsyncRollCallIterator(client, 118, concurrency=4)))
+    assert keys == [(1, n) for n in range(1, 16) if n != 3] + [(2, n) for n in range(1, 5)]
+    assert client.max_in_flight <= 4
+
+
+def test_async_iterators_share_one_loop():
+    async def run_both():
+        client = FakeAsyncClient({1: 6, 2: 2})
+        return await asyncio.gather(
+            collect(AsyncRollCallIterator(client, 117, concurrency=3)),
+            collect(AsyncRollCallIterator(client, 118, concurrency=3)),
+        )
+
+    first, second = asyncio.run(run_both())
+    assert len(first) == len(second) == 8
+
+
+def test_async_client_returns_simple_response():
+    transport = InMemoryTransport(lambda url, params: TransportResponse.from_json(200, {"ok": True}))
+
+    async def fetch():
+        async with AsyncCongressApiClient(api_key="k", max_concurrency=2, transport=transport) as client:
+            result = await client.get_member_votes(118, 1, 1)
+            return result, transport.requests[0][0]
+
+    result, url = asyncio.run(fetch())
+    assert result.status_code == 200
+    assert result.json == {"ok": True}
+    assert url.endswith("/house-vote/118/1/1/members")
@@ -0,0 +1,105 @@
+from unittest import mock
+
+import pytest
+
+import congress_api.cli as cli
+from congress_api.domain.models import MemberVote, RollCall
+from congress_api.services.votes_filter import AmbiguousMemberError, MultiMemberVotesFilter, VotesFilter
+
+
+def make_roll_call(number, members):
+    return RollCall(
+        congress=118,
+        session_number=1,
+        roll_call_number=number,
+        start_date="2023-01-09T12:00:00-05:00",
+        members=[
+            MemberVote(bioguide_id=bioguide, first_name=first, last_name=last, vote_cast="Yea", party=party, state=state)
+            for bioguide, first, last, party, state in members
+        ],
+    )
+
+
+def test_name_resolves_to_bioguide_id_once():
+    vf = VotesFilter("Jake", "Auchincloss")
+    roll_calls = [
+        make_roll_call(1, [("A000148", "Jake", "Auchincloss", "D", "MA"), ("H1", "Grace", "Hopper", "D", "VA")]),
+        # Later payload spells the name differently; the ID still matches
+        make_roll_call(2, [("A000148", "Jacob", "Auchincloss ", "D", "MA")]),
+    ]
+    rows = list(vf.iter_member_rows(roll_calls))
+    assert vf.resolved_bioguide_id == "A000148"
+    assert [r["memberName"] for r in rows] == ["Jake Auchincloss", "Jacob Auchincloss"]
+
+
+def test_bioguide_only_filter_skips_names():
+    vf = VotesFilter(bioguide_id="H1")
+    rows = list(vf.iter_member_rows([make_roll_call(1, [("H1", "Grace", "Hopper", "D", "VA"), ("L1", "Ada", "Lovelace", "D", "MA")])]))
+    assert [r["memberName"] for r in rows] == ["Grace Hopper"]
+
+
+def test_ambiguous_name_raises_and_exact_first_name_wins():
+    roll_call = make_roll_call(1, [
+        ("J1", "Mike", "Johnson", "R", "LA"),
+        ("J2", "Mike", "Johnson", "R", "SD"),
+        ("J3", "Michael", "Johnson", "R", "OH"),
+    ])
+    with pytest.raises(AmbiguousMemberError) as excinfo:
+        VotesFilter("Mike", "Johnson").matching(roll_call)
+    assert "J1 (Mike Johnson, R-LA)" in str(excinfo.value)
+
+    vf = VotesFilter("Michael", "Johnson")
+    assert [mv.bioguide_id for mv in vf.matching(roll_call)] == ["J3"]
+
+
+def test_multi_filter_mixes_names_and_ids():
+    targets = [VotesFilter("Grace", "Hopper"), VotesFilter(bioguide_id="L1")]
+    multi = MultiMemberVotesFilter(targets=targets)
+    roll_calls = [
+        make_roll_call(1, [("L1", "Ada", "Lovelace", "D", "MA"), ("H1", "Grace", "Hopper", "D", "VA")]),
+        make_roll_call(2, [("H1", "G.", "Hopper", "D", "VA"), ("L1", "Ada", "Lovelace", "D", "MA")]),
+    ]
+    pairs = [(position, row["rollCallNumber"]) for position, row in multi.iter_rows(roll_calls)]
+    assert pairs == [(1, 1), (0, 1), (0, 2), (1, 2)]
+    assert targets[0].resolved_bioguide_id == "H1"
+
+
+def test_multi_filter_keeps_unresolved_names_out_of_id_index():
+    targets = [VotesFilter("Grace", "Hopper"), VotesFilter("Ada", "Lovelace")]
+    multi = MultiMemberVotesFilter(targets=targets)
+    roll_calls = [
+        # No IDs in this payload: Lovelace stays on name matching
+        make_roll_call(1, [(None, "Ada", "Lovelace", "D", "MA"), ("H1", "Grace", "Hopper", "D", "VA")]),
+        make_roll_call(2, [("L1", "Ada", "Lovelace", "D", "MA"), ("H1", "G.", "Hopper", "D", "VA")]),
+    ]
+    pairs = [(position, row["rollCallNumber"]) for position, row in multi.iter_rows(roll_calls)]
+    assert pairs == [(1, 1), (0, 1), (1, 2), (0, 2)]
+    assert [target.resolved_bioguide_id for target in targets] == ["H1", "L1"]
+    assert not targets[1].matches_last_name("Hopper")
+
+
+def test_cli_bioguide_dispatch(tmp_path):
+    captured = {}
+
+    class DummySingle:
+        def __init__(self, **kwargs):
+            captured["single"] = kwargs
+
+        def run(self):
+            return tmp_path / "x.csv"
+
+    class DummyMembers:
+        def __init__(self, **kwargs):
+            captured["members"] = kwargs
+
+        def run(self):
+            return [tmp_path / "a.csv", tmp_path / "b.csv"]
+
+    with mock.patch("congress_api.cli.ExportNotVotingCommand", DummySingle), \
+            mock.patch("congress_api.cli.ExportMembersCommand", DummyMembers):
+        assert cli.main(["--bioguide", "A000148", "--congress", "118", "--no-cache"]) == 0
+        assert cli.main(["--bioguide", "A000148", "--bioguide", "H1", "--congress", "118", "--no-cache"]) == 0
+    assert captured["single"]["bioguide_id"] == "A000148"
+    assert captured["single"]["member_last"] == ""
+    assert captured["members"]["bioguide_ids"] == ["A000148", "H1"]
+    assert cli.main(["--all-members", "--bioguide", "A000148", "--congress", "118"]) == 2
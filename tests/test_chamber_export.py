@@ -0,0 +1,116 @@
+import csv
+from unittest import mock
+
+import pytest
+
+import congress_api.cli as cli
+from congress_api.commands.export_command import ExportChamberCommand
+from congress_api.domain.models import MemberVote, RollCall
+from congress_api.services.vote_matrix import VoteMatrix
+
+
+def make_roll_call(session_number, number, votes):
+    return RollCall(
+        congress=118,
+        session_number=session_number,
+        roll_call_number=number,
+        start_date="2023-02-15T12:00:00-05:00",
+        members=[
+            MemberVote(bioguide_id=bioguide, first_name=first, last_name=last, vote_cast=vote, party="D", state="MA")
+            for bioguide, first, last, vote in votes
+        ],
+    )
+
+
+ROLL_CALLS = [
+    make_roll_call(1, 1, [("L1", "Ada", "Lovelace", "Yea"), ("H1", "Grace", "Hopper", "Nay")]),
+    # Turing is sworn in late; Hopper misses one
+    make_roll_call(1, 2, [("L1", "Ada", "Lovelace", "Not Voting"), ("T1", "Alan", "Turing", "Present")]),
+    make_roll_call(2, 1, [("L1", "Ada", "Lovelace", "Aye"), ("H1", "Grace", "Hopper", "No"), ("T1", "Alan", "Turing", "Guilty")]),
+]
+
+
+class StaticIterator:
+    def __init__(self, client=None, congress_number=0, **kwargs):
+        pass
+
+    def __iter__(self):
+        return iter(ROLL_CALLS)
+
+
+def test_vote_matrix_codes_and_absences():
+    matrix = VoteMatrix().add_roll_calls(ROLL_CALLS)
+    assert matrix.roll_call_keys == [(118, 1, 1), (118, 1, 2), (118, 2, 1)]
+    rows = {info.key: votes for info, votes in matrix.iter_labeled_rows()}
+    assert rows == {
+        "L1": ["Yea", "Not Voting", "Aye"],
+        "H1": ["Nay", "", "No"],
+        "T1": ["", "Present", "Guilty"],
+    }
+    assert all(len(row) == 3 for row in matrix.rows)
+
+
+def test_chamber_long_export(tmp_path, monkeypatch):
+    monkeypatch.setenv("CONGRESS_API_KEY", "k")
+    with mock.patch("congress_api.commands.export_command.RollCallIterator", StaticIterator):
+        path = ExportChamberCommand(congress_number=118, outputs_dir=tmp_path).run()
+    rows = list(csv.DictReader(path.open("r", encoding="utf-8")))
+    assert len(rows) == 7
+    assert rows[0]["bioguideId"] == "L1"
+    assert rows[0]["voteUrl"] == "https://clerk.house.gov/Votes/20231"
+    assert rows[-1]["voteCast"] == "Guilty"
+
+
+def test_chamber_wide_export(tmp_path, monkeypatch):
+    monkeypatch.setenv("CONGRESS_API_KEY", "k")
+    with mock.patch("congress_api.commands.export_command.RollCallIterator", StaticIterator):
+        path = ExportChamberCommand(congress_number=118, layout="wide", outputs_dir=tmp_path).run()
+    with path.open("r", encoding="utf-8") as f:
+        table = list(csv.reader(f))
+    assert table[0] == ["bioguideId", "memberName", "party", "state", "1-1", "1-2", "2-1"]
+    assert table[2] == ["H1", "Grace Hopper", "D", "MA", "Nay", "", "No"]
+
+
+def test_cli_all_members_dispatch(tmp_path):
+    captured = {}
+
+    class DummyChamber:
+        def __init__(self, **kwargs):
+            captured.update(kwargs)
+
+        def run(self):
+            return tmp_path / "x.csv"
+
+    with mock.patch("congress_api.cli.ExportChamberCommand", DummyChamber):
+        assert cli.main(["--all-members", "--layout", "wide", "--congress", "118", "--no-cache"]) == 0
+    assert captured["layout"] == "wide"
+    assert cli.main(["--all-members", "--first", "A", "--last", "B", "--congress", "118"]) == 2
+
+
+def test_vote_matrix_slices_counts_and_metadata():
+    matrix = VoteMatrix.from_roll_calls(ROLL_CALLS)
+    assert matrix.shape == (3, 3)
+    assert list(matrix.session_numbers) == [1, 1, 2]
+    assert bytes(matrix.member_codes("H1")) == bytes([matrix.codes["Nay"], 0, matrix.codes["No"]])
+    assert matrix.member_counts("L1") == {"Yea": 1, "Not Voting": 1, "Aye": 1}
+    assert matrix.roll_call_codes(1) == bytes([matrix.codes["Not Voting"], 0, matrix.codes["Present"]])
+
+
+def test_vote_matrix_from_repository(tmp_path):
+    from congress_api.repositories.sqlite_repository import SqliteVotesRepository
+
+    repo = SqliteVotesRepository(db_path=tmp_path / "votes.db")
+    repo.save_roll_calls(reversed(ROLL_CALLS))
+    matrix = VoteMatrix.from_repository(repo, 118)
+    assert matrix.roll_call_keys == [(118, 1, 1), (118, 1, 2), (118, 2, 1)]
+    rows = {info.key: votes for info, votes in matrix.iter_labeled_rows()}
+    assert rows["T1"] == ["", "Present", "Guilty"]
+    assert VoteMatrix.from_repository(repo, 117).shape == (0, 0)
+
+
+def test_vote_matrix_to_numpy():
+    np = pytest.importorskip("numpy")
+    array = VoteMatrix.from_roll_calls(ROLL_CALLS).to_numpy()
+    assert array.shape == (3, 3)
+    assert array.dtype == np.uint8
+    assert (array != 0).sum(axis=1).tolist() == [3, 2, 2]
@@ -0,0 +1,102 @@
+import json
+
+import pytest
+
+from congress_api.commands.export_command import ExportNotVotingCommand
+from congress_api.services.checkpoint import CheckpointStore, ExportCheckpoint
+
+
+def export(tmp_path, **kwargs):
+    return ExportNotVotingCommand(
+        member_first="Ryan",
+        member_last="Zinke",
+        congress_number=118,
+        outputs_dir=tmp_path / "outputs",
+        api_key="k",
+        checkpoint_dir=tmp_path / "checkpoints",
+        **kwargs,
+    ).run()
+
+
+@pytest.fixture
+def scan_client(fake_api, member_votes):
+    """25 roll calls in session 1 and 12 in session 2; set ``fail_at`` to interrupt at a roll call."""
+
+    def payload(session, roll_call):
+        vote = "Yea" if roll_call % 3 else "Nay"
+        voters = (("Z000017", "Ryan", "Zinke", vote), ("H000001", "Grace", "Hopper", "Yea"))
+        return member_votes(session, voters=voters)
+
+    return fake_api({1: 25, 2: 12}, payload=payload)
+
+
+def test_resume_completes_identical_csv(tmp_path, scan_client):
+    expected = export(tmp_path / "clean").read_bytes()
+    assert not list((tmp_path / "clean" / "checkpoints").glob("*.json"))
+
+    scan_client.fail_at = (2, 5)
+    with pytest.raises(KeyboardInterrupt):
+        export(tmp_path)
+    checkpoint = CheckpointStore(tmp_path / "checkpoints" / "Ryan_Zinke_congress_118.json").load()
+    assert checkpoint.position == (2, 4)
+    assert checkpoint.resolved_bioguide_id == "Z000017"
+
+    scan_client.fail_at, scan_client.calls = None, []
+    output_path = export(tmp_path, resume=True)
+    assert str(output_path) == checkpoint.output_path
+    assert output_path.read_bytes() == expected
+    assert scan_client.calls[0] == (2, 5)
+    assert not (tmp_path / "checkpoints" / "Ryan_Zinke_congress_118.json").exists()
+
+
+def test_resume_truncates_rows_written_after_checkpoint(tmp_path, scan_client):
+    expected = export(tmp_path / "clean").read_bytes()
+    store = CheckpointStore(tmp_path / "checkpoints" / "Ryan_Zinke_congress_118.json")
+    scan_client.fail_at = (1, 17)
+    with pytest.raises(KeyboardInterrupt):
+        export(tmp_path)
+    checkpoint = store.load()
+    # Simulate a crash that left rows past the checkpoint on disk
+    with open(checkpoint.output_path, "a", encoding="utf-8") as f:
+        f.write("118,1,partial row\n")
+
+    scan_client.fail_at = None
+    assert export(tmp_path, resume=True).read_bytes() == expected
+
+
+def test_checkpoint_records_the_scanned_session(tmp_path, fake_api, member_votes):
+    # Payloads that report the wrong session must not send the resumed scan back into session 1
+    client = fake_api({1: 3, 2: 3}, payload=lambda session, roll_call: member_votes(1), fail_at=(2, 3))
+    with pytest.raises(KeyboardInterrupt):
+        export(tmp_path)
+    checkpoint = CheckpointStore(tmp_path / "checkpoints" / "Ryan_Zinke_congress_118.json").load()
+    assert checkpoint.position == (2, 2)
+
+    client.fail_at, client.calls = None, []
+    export(tmp_path, resume=True)
+    assert client.calls[0] == (2, 3)
+
+
+def test_resume_in_another_format_starts_over(tmp_path, scan_client):
+    output_path = tmp_path / "zinke.out"
+    expected = export(tmp_path / "clean", output_format="ndjson").read_bytes()
+    scan_client.fail_at = (1, 17)
+    with pytest.raises(KeyboardInterrupt):
+        export(tmp_path, output_path=output_path)
+    assert CheckpointStore(tmp_path / "checkpoints" / "Ryan_Zinke_congress_118.json").load().output_format == "csv"
+
+    scan_client.fail_at, scan_client.calls = None, []
+    assert export(tmp_path, resume=True, output_format="ndjson", output_path=output_path).read_bytes() == expected
+    assert scan_client.calls[0] == (1, 1)
+
+
+def test_checkpoint_store_round_trip(tmp_path):
+    store = CheckpointStore(tmp_path / "cp" / "x.json")
+    assert store.load() is None
+    store.save(ExportCheckpoint(congress=118, member={"first": "A"}, output_path="out.csv", session_number=1, roll_call_number=9))
+    assert json.loads(store.path.read_text())["roll_call_number"] == 9
+    assert store.load().position == (1, 9)
+    store.path.write_text("{not json")
+    assert store.load() is None
+    store.clear()
+    store.clear()
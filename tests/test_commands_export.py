@@ -6,7 +6,7 @@ from congress_api.commands.export_command import ExportNotVotingCommand
 
 
 class DummyRollCallIterator:
-    def __init__(self, client=None, congress_number=0):
+    def __init__(self, client=None, congress_number=0, **kwargs):
         self._records = [
             {
                 "houseRollCallVoteMemberVotes": {
@@ -6,6 +6,7 @@ import csv
 from congress_api.commands.export_command import (
     ExportNotVotingCommand,
     SingleRollCallExportCommand,
+    load_api_key,
 )
 
 
@@ -13,7 +14,7 @@ def test_export_missing_api_key_raises(monkeypatch, tmp_path):
     # Force API loader to return None
     monkeypatch.setenv("CONGRESS_API_KEY", "", prepend=False)
     with mock.patch(
-        "congress_api.commands.export_command.ExportNotVotingCommand._load_api_key",
+        "congress_api.commands.export_command.load_api_key",
         return_value=None,
     ):
         cmd = ExportNotVotingCommand(
@@ -31,7 +32,7 @@ def test_export_missing_api_key_raises(monkeypatch, tmp_path):
 
 def test_load_api_key_from_env(monkeypatch):
     monkeypatch.setenv("CONGRESS_API_KEY", "abc123")
-    assert ExportNotVotingCommand._load_api_key() == "abc123"
+    assert load_api_key() == "abc123"
 
 
 def test_load_api_key_from_dotenv_file(monkeypatch, tmp_path):
@@ -41,7 +42,7 @@ def test_load_api_key_from_dotenv_file(monkeypatch, tmp_path):
     # Create .env in CWD
     monkeypatch.chdir(tmp_path)
     (tmp_path / ".env").write_text("CONGRESS_API_KEY=fromfile\n", encoding="utf-8")
-    assert ExportNotVotingCommand._load_api_key() == "fromfile"
+    assert load_api_key() == "fromfile"
 
 
 def test_standard_load_branch(monkeypatch, tmp_path):
@@ -59,7 +60,7 @@ def test_standard_load_branch(monkeypatch, tmp_path):
             "congress_api.commands.export_command.load_dotenv",
             side_effect=fake_load_dotenv,
         ):
-            assert ExportNotVotingCommand._load_api_key() == "from_standard_load"
+            assert load_api_key() == "from_standard_load"
 
 
 def test_manual_fallback_branch(monkeypatch, tmp_path):
@@ -71,7 +72,7 @@ def test_manual_fallback_branch(monkeypatch, tmp_path):
     (tmp_path / ".env").write_text('CONGRESS_API_KEY="quoted_value"\n', encoding="utf-8")
     with mock.patch("congress_api.commands.export_command.find_dotenv", return_value=""):
         with mock.patch("congress_api.commands.export_command.load_dotenv", return_value=False):
-            assert ExportNotVotingCommand._load_api_key() == "quoted_value"
+            assert load_api_key() == "quoted_value"
 
 
 def test_manual_fallback_exception(monkeypatch, tmp_path):
@@ -84,14 +85,14 @@ def test_manual_fallback_exception(monkeypatch, tmp_path):
         with mock.patch("congress_api.commands.export_command.load_dotenv", return_value=False):
             # Force read_text to raise
             with mock.patch("pathlib.Path.read_text", side_effect=Exception("boom")):
-                assert ExportNotVotingCommand._load_api_key() is None
+                assert load_api_key() is None
 
 
 def test_single_rollcall_success(monkeypatch, tmp_path):
     monkeypatch.setenv("CONGRESS_API_KEY", "k")
 
     class DummyClient:
-        def __init__(self, api_key: str):
+        def __init__(self, api_key: str, **kwargs):
             self.api_key = api_key
 
         def get_member_votes(self, congress, session, roll_call):
@@ -132,7 +133,7 @@ def test_single_rollcall_404(monkeypatch):
     monkeypatch.setenv("CONGRESS_API_KEY", "k")
 
     class DummyClient:
-        def __init__(self, api_key: str):
+        def __init__(self, api_key: str, **kwargs):
             pass
 
         def get_member_votes(self, congress, session, roll_call):
@@ -159,7 +160,7 @@ def test_single_rollcall_non200(monkeypatch):
     monkeypatch.setenv("CONGRESS_API_KEY", "k")
 
     class DummyClient:
-        def __init__(self, api_key: str):
+        def __init__(self, api_key: str, **kwargs):
             pass
 
     def make_resp(code):
@@ -187,7 +188,7 @@ def test_single_rollcall_error_payload(monkeypatch):
     monkeypatch.setenv("CONGRESS_API_KEY", "k")
 
     class DummyClient:
-        def __init__(self, api_key: str):
+        def __init__(self, api_key: str, **kwargs):
             pass
 
         def get_member_votes(self, congress, session, roll_call):
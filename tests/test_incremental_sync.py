@@ -0,0 +1,97 @@
+import csv
+
+import pytest
+
+import congress_api.cli as cli
+from congress_api.commands.export_command import ExportNotVotingCommand
+from congress_api.repositories.sqlite_repository import SqliteVotesRepository
+from congress_api.services.roll_call_iterator import RollCallIterator
+
+
+SESSION_LENGTHS = {1: 6, 2: 3}
+
+
+def test_high_water_mark(tmp_path, make_roll_call):
+    repo = SqliteVotesRepository(db_path=tmp_path / "votes.db")
+    assert repo.high_water_mark(118, 1) == 0
+    repo.save_roll_calls([make_roll_call(1, n) for n in (1, 2, 5)] + [make_roll_call(2, 1)])
+    assert repo.high_water_mark(118, 1) == 5
+    assert repo.high_water_mark(118, 2) == 1
+    assert repo.high_water_mark(117, 1) == 0
+
+
+def test_iterator_starts_after_marks(fake_api):
+    client = fake_api(SESSION_LENGTHS)
+    it = RollCallIterator(client=client, congress_number=118, start_after={1: 4, 2: 3})
+    keys = [(r.session_number, r.roll_call_number) for r in it]
+    assert keys == [(1, 5), (1, 6)]
+    assert client.calls == [(1, 5), (1, 6), (1, 7), (2, 4)]
+
+
+def test_discovery_gallops_from_mark(fake_api):
+    client = fake_api(SESSION_LENGTHS)
+    it = RollCallIterator(client=client, congress_number=118, start_after={1: 6, 2: 1}, discover=True)
+    assert [(r.session_number, r.roll_call_number) for r in it] == [(2, 2), (2, 3)]
+    assert it.total == 2
+    assert all(n > 1 for _, n in client.calls)
+
+
+def test_incremental_export_fetches_only_new(tmp_path, monkeypatch, fake_api, make_roll_call):
+    monkeypatch.setenv("CONGRESS_API_KEY", "k")
+    repo = SqliteVotesRepository(db_path=tmp_path / "votes.db")
+    repo.save_roll_calls([make_roll_call(1, n) for n in range(1, 5)])
+    client = fake_api(SESSION_LENGTHS)
+    out_path = ExportNotVotingCommand(
+        member_first="Ryan",
+        member_last="Zinke",
+        congress_number=118,
+        outputs_dir=tmp_path / "outputs",
+        repository=repo,
+        incremental=True,
+    ).run()
+    rows = list(csv.DictReader(out_path.open("r", encoding="utf-8")))
+    assert [(r["sessionNumber"], r["rollCallNumber"]) for r in rows] == [
+        ("1", "5"), ("1", "6"), ("2", "1"), ("2", "2"), ("2", "3"),
+    ]
+    assert min(n for s, n in client.calls if s == 1) == 5
+    assert repo.high_water_mark(118, 1) == 6
+    assert repo.high_water_mark(118, 2) == 3
+
+
+def test_cli_sync_requires_db():
+    assert cli.main(["--first", "A", "--last", "B", "--congress", "118", "--sync"]) == 2
+
+
+class SpyRepository(SqliteVotesRepository):
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        self.batches = []
+
+    def save_roll_calls(self, roll_calls):
+        roll_calls = list(roll_calls)
+        self.batches.append([(rc.session_number, rc.roll_call_number) for rc in roll_calls])
+        super().save_roll_calls(roll_calls)
+
+
+def test_export_persists_in_batches_while_streaming(tmp_path, monkeypatch, fake_api):
+    monkeypatch.setenv("CONGRESS_API_KEY", "k")
+    monkeypatch.setattr("congress_api.commands.export_command.PERSIST_BATCH_SIZE", 4)
+    repo = SpyRepository(tmp_path / "votes.db")
+    fake_api(SESSION_LENGTHS)
+    out_path = ExportNotVotingCommand(
+        member_first="Ryan", member_last="Zinke", congress_number=118, outputs_dir=tmp_path, repository=repo
+    ).run()
+    assert [len(batch) for batch in repo.batches] == [4, 4, 1]
+    assert len(list(csv.DictReader(out_path.open("r", encoding="utf-8")))) == 9
+    assert repo.high_water_mark(118, 2) == 3
+
+
+def test_interrupted_export_keeps_fetched_roll_calls(tmp_path, monkeypatch, fake_api):
+    monkeypatch.setenv("CONGRESS_API_KEY", "k")
+    fake_api(SESSION_LENGTHS, fail_at=(2, 1))
+    repo = SpyRepository(tmp_path / "votes.db")
+    with pytest.raises(KeyboardInterrupt):
+        ExportNotVotingCommand(
+            member_first="Ryan", member_last="Zinke", congress_number=118, outputs_dir=tmp_path, repository=repo
+        ).run()
+    assert repo.high_water_mark(118, 1) == 6
@@ -0,0 +1,45 @@
+import pytest
+
+import congress_api.cli as cli
+from congress_api.services.roll_call_iterator import RollCallIterator
+
+
+# Random per-request delay, so completions arrive out of order
+DELAY = 0.005
+
+
+def test_concurrent_iterator_yields_in_order(fake_api):
+    client = fake_api({1: 23, 2: 7}, delay=DELAY)
+    records = list(RollCallIterator(client=client, congress_number=118, workers=4))
+    keys = [(r.session_number, r.roll_call_number) for r in records]
+    assert keys == [(1, n) for n in range(1, 24)] + [(2, n) for n in range(1, 8)]
+
+
+def test_concurrent_iterator_skips_non_200_and_stops_on_error_payload(fake_api):
+    client = fake_api({1: 5, 2: 3}, skip={(1, 2)}, error_payload_end=True, delay=DELAY)
+    records = list(RollCallIterator(client=client, congress_number=118, workers=3))
+    keys = [(r.session_number, r.roll_call_number) for r in records]
+    assert keys == [(1, 1), (1, 3), (1, 4), (1, 5), (2, 1), (2, 2), (2, 3)]
+    # Never runs further past the end than the in-flight window
+    assert max(n for s, n in client.calls if s == 1) <= 5 + 3
+
+
+def test_concurrent_matches_sequential(fake_api):
+    sequential = list(RollCallIterator(client=fake_api({1: 12, 2: 4}, skip={(2, 2)}), congress_number=118))
+    concurrent = list(
+        RollCallIterator(client=fake_api({1: 12, 2: 4}, skip={(2, 2)}, delay=DELAY), congress_number=118, workers=5)
+    )
+    assert sequential == concurrent
+
+
+def test_iterator_rejects_zero_workers(fake_api):
+    with pytest.raises(ValueError):
+        RollCallIterator(client=fake_api({1: 0, 2: 0}), congress_number=118, workers=0)
+
+
+def test_cli_workers_option():
+    args = cli.parse_args(["--first", "A", "--last", "B", "--congress", "118", "--workers", "8"])
+    assert args.workers == 8
+    assert cli.parse_args(["--first", "A", "--last", "B", "--congress", "118"]).workers == 1
+    with pytest.raises(SystemExit):
+        cli.parse_args(["--first", "A", "--last", "B", "--congress", "118", "--workers", "0"])
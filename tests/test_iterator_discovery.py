@@ -0,0 +1,52 @@
+import pytest
+
+import congress_api.cli as cli
+from congress_api.services.roll_call_iterator import MAX_ROLL_CALL_NUMBER, DiscoveryError, RollCallIterator
+
+
+@pytest.mark.parametrize("last", [0, 1, 2, 3, 7, 8, 9, 724])
+def test_discover_session_length_exact(last, fake_api):
+    client = fake_api({1: last, 2: 0})
+    it = RollCallIterator(client=client, congress_number=118)
+    assert it.discover_session_length(1) == last
+    # Exponential probing plus binary search stays logarithmic
+    assert len(client.calls) <= 2 * (last.bit_length() + 1)
+
+
+def test_discover_treats_transient_failures_as_present(fake_api):
+    client = fake_api({1: 16, 2: 0}, skip={(1, 16)})
+    it = RollCallIterator(client=client, congress_number=118)
+    assert it.discover_session_length(1) == 16
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_discovered_scan_covers_exact_range(workers, fake_api):
+    client = fake_api({1: 37, 2: 5}, skip={(1, 20)})
+    it = RollCallIterator(client=client, congress_number=118, workers=workers, discover=True)
+    records = list(it)
+    assert it.session_lengths == {1: 37, 2: 5}
+    assert it.total == 42
+    keys = [(r.session_number, r.roll_call_number) for r in records]
+    assert keys == [(1, n) for n in range(1, 38) if n != 20] + [(2, n) for n in range(1, 6)]
+    # No end-of-session probe during the scan, and probe hits are not re-fetched
+    assert len(client.calls) == len(set(client.calls))
+
+
+def test_cli_discover_flag():
+    assert cli.parse_args(["--first", "A", "--last", "B", "--congress", "118", "--discover"]).discover is True
+    assert cli.parse_args(["--first", "A", "--last", "B", "--congress", "118"]).discover is False
+
+
+def test_discovery_gives_up_when_probes_keep_failing(fake_api):
+    client = fake_api({1: 40, 2: 0}, skip={(1, n) for n in range(1, 41)})
+    it = RollCallIterator(client=client, congress_number=118, discover=True)
+    with pytest.raises(DiscoveryError):
+        list(it)
+    assert client.calls == [(1, 1), (1, 2), (1, 4)]
+
+
+def test_discovery_stops_at_the_roll_call_bound(fake_api):
+    client = fake_api({1: MAX_ROLL_CALL_NUMBER * 2, 2: 0})
+    with pytest.raises(DiscoveryError):
+        RollCallIterator(client=client, congress_number=118).discover_session_length(1)
+    assert max(n for _, n in client.calls) <= MAX_ROLL_CALL_NUMBER
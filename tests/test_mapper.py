@@ -42,3 +42,47 @@ def test_roll_call_mapper_builds_members():
     assert mv.state == "UK"
 
 
+def test_roll_call_mapper_projects_members_with_filter():
+    from congress_api.services.votes_filter import MultiMemberVotesFilter, VotesFilter
+
+    results = [
+        {"bioguideID": "H1", "firstName": "Grace", "lastName": "Hopper", "voteCast": "Yea"},
+        {"bioguideID": "H2", "firstName": "Ed", "lastName": "Hopper", "voteCast": "Nay"},
+        {"bioguideID": "L1", "firstName": "Ada", "lastName": "Lovelace", "voteCast": "Yea"},
+    ]
+    payload = {"houseRollCallVoteMemberVotes": {"sessionNumber": 1, "results": results}}
+
+    vf = VotesFilter("Grace", "Hopper")
+    rc = RollCallMapper.from_api_payload(118, 1, payload, member_filter=vf.raw_member_predicate())
+    # Unresolved: every Hopper is kept so the filter can pick by first name
+    assert [mv.bioguide_id for mv in rc.members] == ["H1", "H2"]
+    assert [mv.bioguide_id for mv in vf.matching(rc)] == ["H1"]
+    rc = RollCallMapper.from_api_payload(118, 2, payload, member_filter=vf.raw_member_predicate())
+    assert [mv.bioguide_id for mv in rc.members] == ["H1"]
+
+    multi = MultiMemberVotesFilter(targets=[VotesFilter(bioguide_id="L1"), VotesFilter("Ed", "Hopper")])
+    rc = RollCallMapper.from_api_payload(118, 1, payload, member_filter=multi.raw_member_predicate())
+    assert [mv.bioguide_id for mv in rc.members] == ["H1", "H2", "L1"]
+
+
+def test_mapped_members_are_slotted_frozen_and_interned():
+    import dataclasses
+
+    import pytest
+
+    def payload(first):
+        return {
+            "houseRollCallVoteMemberVotes": {
+                "sessionNumber": 1,
+                "results": [{"bioguideID": "A000001", "firstName": first, "lastName": "Lovelace", "voteCast": "Yea", "voteParty": "D"}],
+            }
+        }
+
+    # Build equal strings at runtime so they start out as distinct objects
+    first = RollCallMapper.from_api_payload(118, 1, payload("".join(["A", "da"]))).members[0]
+    second = RollCallMapper.from_api_payload(118, 2, payload("".join(["Ad", "a"]))).members[0]
+    assert first.first_name is second.first_name
+    assert first.vote_cast is second.vote_cast
+    assert not hasattr(first, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.vote_cast = "Nay"
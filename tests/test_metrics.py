@@ -0,0 +1,152 @@
+import json
+import logging
+
+import pytest
+
+import congress_api.cli as cli
+from congress_api.replay import ReplayServer
+from congress_api.services.api_client import BASE_URL_ENV, CongressApiClient
+from congress_api.services.metrics import MEMBER_VOTES_ENDPOINT, Histogram, Metrics, ProgressReporter
+from congress_api.services.transport import InMemoryTransport, TransportResponse
+from congress_api.services.writers import CsvRowWriter
+
+
+def test_histogram_percentiles_use_bucket_bounds():
+    histogram = Histogram()
+    for seconds in [0.002] * 90 + [0.2] * 9 + [3.0]:
+        histogram.observe(seconds)
+    report = histogram.to_dict()
+    assert report["count"] == 100
+    assert (report["p50_seconds"], report["p90_seconds"], report["p99_seconds"]) == (0.0025, 0.0025, 0.25)
+    assert report["max_seconds"] == 3.0
+    assert report["buckets"]["le_5"] == 1
+
+
+def test_metrics_report_groups_by_labels(fake_clock):
+    metrics = Metrics(clock=fake_clock)
+    metrics.increment("requests", status=200)
+    metrics.increment("requests", status=200)
+    metrics.increment("requests", status=404)
+    with metrics.timer("map_seconds"):
+        fake_clock.now += 0.004
+    report = metrics.report()
+    assert report["counters"] == [
+        {"name": "requests", "labels": {"status": "200"}, "value": 2},
+        {"name": "requests", "labels": {"status": "404"}, "value": 1},
+    ]
+    assert report["histograms"][0]["name"] == "map_seconds"
+    assert report["histograms"][0]["sum_seconds"] == 0.004
+    assert report["elapsed_seconds"] == 0.004
+
+
+def test_progress_reports_rate_and_eta(fake_clock):
+    logger = logging.getLogger("test.progress")
+    progress = ProgressReporter(118, total=100, every=10, logger=logger, clock=fake_clock)
+    fake_clock.now = 5.0
+    for number in range(1, 11):
+        progress.advance(1, number)
+    assert progress.message(1, 10) == (
+        "Processing congress=118 session=1 roll_call=10 (10 of 100, 2.0 roll calls/s, ETA 0:00:45)"
+    )
+
+
+def test_client_records_requests_retries_and_bytes():
+    replies = iter([
+        TransportResponse.from_json(429, None, headers={"Retry-After": "0"}),
+        TransportResponse.from_json(200, {"ok": True}),
+    ])
+    metrics = Metrics()
+    client = CongressApiClient(
+        api_key="k", transport=InMemoryTransport(lambda url, params: next(replies)), metrics=metrics
+    )
+    assert client.get_member_votes(118, 1, 1).status_code == 200
+    assert metrics.counter("requests", endpoint=MEMBER_VOTES_ENDPOINT, status=429) == 1
+    assert metrics.counter("requests", endpoint=MEMBER_VOTES_ENDPOINT, status=200) == 1
+    assert metrics.counter("retries", endpoint=MEMBER_VOTES_ENDPOINT, status=429) == 1
+    assert metrics.counter("bytes_received", endpoint=MEMBER_VOTES_ENDPOINT) == len(b'{"ok": true}')
+    assert metrics.histogram("request_seconds", endpoint=MEMBER_VOTES_ENDPOINT, status=200).count == 1
+
+
+# (bioguide ID, first name, last name, vote)
+VOTERS = (("Z000017", "Ryan", "Zinke", "Yea"), ("H000001", "Grace", "Hopper", "Nay"))
+
+
+@pytest.fixture
+def replayed_votes(member_votes):
+    """Replay response for one roll call's member votes."""
+    return lambda session: TransportResponse.from_json(200, member_votes(session, voters=VOTERS))
+
+
+def test_cli_writes_metrics_report(tmp_path, monkeypatch, capsys, replayed_votes):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CONGRESS_API_KEY", "k")
+    responses = {(118, session, n): replayed_votes(session) for session in (1, 2) for n in range(1, 11)}
+    report_path = tmp_path / "metrics" / "run.json"
+    argv = ["--first", "Ryan", "--last", "Zinke", "--congress", "118", "--no-cache", "--metrics-out", str(report_path)]
+    with ReplayServer(responses) as server:
+        monkeypatch.setenv(BASE_URL_ENV, server.base_url)
+        assert cli.main(argv) == 0
+        progress = capsys.readouterr().err
+        assert cli.main(argv + ["--quiet"]) == 0
+        assert "Processing" not in capsys.readouterr().err
+
+    assert "[INFO] Processing congress=118 session=1 roll_call=10 (10 done" in progress
+    # Each run's log handler is removed when it ends
+    assert not logging.getLogger("congress_api").handlers
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    counters = {(c["name"], tuple(sorted(c["labels"].items()))): c["value"] for c in report["counters"]}
+    assert counters[("requests", (("endpoint", MEMBER_VOTES_ENDPOINT), ("status", "200")))] == 20
+    assert counters[("requests", (("endpoint", MEMBER_VOTES_ENDPOINT), ("status", "404")))] == 2
+    assert counters[("roll_calls", (("outcome", "ok"),))] == 20
+    assert counters[("rows_written", (("format", "csv"),))] == 20
+    assert counters[("members_mapped", ())] == 20
+    histograms = {h["name"]: h for h in report["histograms"]}
+    assert histograms["map_seconds"]["count"] == 20
+    assert histograms["filter_seconds"]["count"] == 20
+    assert histograms["rate_limit_wait_seconds"]["count"] == 22
+
+
+def test_cli_reports_unwritable_metrics_path(tmp_path, monkeypatch, capsys, replayed_votes):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CONGRESS_API_KEY", "k")
+    (tmp_path / "not_a_dir").write_text("", encoding="utf-8")
+    argv = ["--first", "Ryan", "--last", "Zinke", "--congress", "118", "--no-cache"]
+    assert cli.main(argv + ["--metrics-out", str(tmp_path / "not_a_dir" / "run.json")]) == 2
+    assert "[ERROR] --metrics-out: cannot create" in capsys.readouterr().out
+
+    def fail(self, path):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(Metrics, "write_json", fail)
+    responses = {(118, 1, 1): replayed_votes(1)}
+    with ReplayServer(responses) as server:
+        monkeypatch.setenv(BASE_URL_ENV, server.base_url)
+        assert cli.main(argv + ["--quiet", "--metrics-out", str(tmp_path / "run.json")]) == 2
+    out = capsys.readouterr().out
+    assert "[OK] Wrote results to" in out
+    assert "[ERROR] Could not write metrics report: disk full" in out
+
+
+def test_metrics_keep_rows_on_the_writers_fast_path(tmp_path, monkeypatch, replayed_votes):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CONGRESS_API_KEY", "k")
+    handed_over = []
+    write_value_rows = CsvRowWriter.write_value_rows
+
+    def spy(self, rows):
+        handed_over.append(rows)
+        return write_value_rows(self, rows)
+
+    monkeypatch.setattr(CsvRowWriter, "write_value_rows", spy)
+    report_path = tmp_path / "run.json"
+    argv = ["--first", "Ryan", "--last", "Zinke", "--congress", "118", "--no-cache", "--quiet"]
+    with ReplayServer({(118, 1, n): replayed_votes(1) for n in range(1, 4)}) as server:
+        monkeypatch.setenv(BASE_URL_ENV, server.base_url)
+        assert cli.main(argv + ["--metrics-out", str(report_path)]) == 0
+
+    # The filter's own generator reaches csv.writerows, with no per-row timing wrapper
+    (rows,) = handed_over
+    assert rows.gi_code.co_name == "iter_member_values"
+    histograms = json.loads(report_path.read_text(encoding="utf-8"))["histograms"]
+    write = {tuple(h["labels"].items()): h["count"] for h in histograms if h["name"] == "write_seconds"}
+    assert write == {(): 3, (("format", "csv"),): 1}
@@ -0,0 +1,111 @@
+import csv
+from unittest import mock
+
+import congress_api.cli as cli
+from congress_api.commands.export_command import ExportMembersCommand
+from congress_api.domain.models import MemberVote, RollCall
+from congress_api.services.votes_filter import MultiMemberVotesFilter, VotesFilter
+
+
+def make_roll_call(number):
+    return RollCall(
+        congress=118,
+        session_number=1,
+        roll_call_number=number,
+        start_date="2023-02-15T12:00:00-05:00",
+        members=[
+            MemberVote(bioguide_id="L1", first_name="Ada", last_name="Lovelace", vote_cast="Yea"),
+            MemberVote(bioguide_id="H1", first_name="Grace", last_name="Hopper", vote_cast="Nay"),
+            MemberVote(bioguide_id="T1", first_name="Alan", last_name="Turing", vote_cast="Not Voting"),
+        ],
+    )
+
+
+class CountingIterator:
+    instances = []
+
+    def __init__(self, client=None, congress_number=0, **kwargs):
+        self.passes = 0
+        CountingIterator.instances.append(self)
+
+    def __iter__(self):
+        self.passes += 1
+        for number in (1, 2, 3):
+            yield make_roll_call(number)
+
+
+def test_multi_filter_single_pass():
+    targets = [VotesFilter("Ada", "Lovelace"), VotesFilter("Alan", "Turing")]
+    pairs = list(MultiMemberVotesFilter(targets=targets).iter_rows([make_roll_call(1), make_roll_call(2)]))
+    assert [(index, row["memberName"], row["rollCallNumber"]) for index, row in pairs] == [
+        (0, "Ada Lovelace", 1),
+        (1, "Alan Turing", 1),
+        (0, "Ada Lovelace", 2),
+        (1, "Alan Turing", 2),
+    ]
+
+
+def test_members_command_one_csv_per_member(tmp_path, monkeypatch):
+    monkeypatch.setenv("CONGRESS_API_KEY", "k")
+    CountingIterator.instances = []
+    with mock.patch("congress_api.commands.export_command.RollCallIterator", CountingIterator):
+        paths = ExportMembersCommand(
+            members=[("Ada", "Lovelace"), ("Grace", "Hopper"), ("Ada", "Lovelace")],
+            congress_number=118,
+            outputs_dir=tmp_path / "outputs",
+        ).run()
+    assert len(CountingIterator.instances) == 1 and CountingIterator.instances[0].passes == 1
+    assert len(paths) == 2
+    for path, expected in zip(paths, ["Ada Lovelace", "Grace Hopper"]):
+        rows = list(csv.DictReader(path.open("r", encoding="utf-8")))
+        assert [r["memberName"] for r in rows] == [expected] * 3
+
+
+def test_members_command_combined(tmp_path, monkeypatch):
+    monkeypatch.setenv("CONGRESS_API_KEY", "k")
+    with mock.patch("congress_api.commands.export_command.RollCallIterator", CountingIterator):
+        paths = ExportMembersCommand(
+            members=[("Ada", "Lovelace"), ("Alan", "Turing")],
+            congress_number=118,
+            combined=True,
+            outputs_dir=tmp_path / "outputs",
+        ).run()
+    assert len(paths) == 1
+    rows = list(csv.DictReader(paths[0].open("r", encoding="utf-8")))
+    assert len(rows) == 6
+    assert {r["memberName"] for r in rows} == {"Ada Lovelace", "Alan Turing"}
+
+
+def test_read_roster(tmp_path):
+    roster = tmp_path / "roster.csv"
+    roster.write_text("first,last\nAda,Lovelace\n\n# comment\nJeff, Van Drew\n", encoding="utf-8")
+    assert cli.read_roster(roster) == [("Ada", "Lovelace"), ("Jeff", "Van Drew")]
+
+
+def test_cli_dispatches_members(tmp_path):
+    roster = tmp_path / "roster.csv"
+    roster.write_text("Alan,Turing\n", encoding="utf-8")
+    captured = {}
+
+    class DummyMembersCommand:
+        def __init__(self, **kwargs):
+            captured.update(kwargs)
+
+        def run(self):
+            return [tmp_path / "a.csv"]
+
+    with mock.patch("congress_api.cli.ExportMembersCommand", DummyMembersCommand):
+        rc = cli.main([
+            "--first", "Ada", "--last", "Lovelace",
+            "--member", "Grace", "Hopper",
+            "--roster", str(roster),
+            "--congress", "118", "--combined", "--no-cache",
+        ])
+    assert rc == 0
+    assert captured["members"] == [("Ada", "Lovelace"), ("Grace", "Hopper"), ("Alan", "Turing")]
+    assert captured["combined"] is True
+
+
+def test_cli_requires_some_member():
+    assert cli.main(["--congress", "118"]) == 2
+    assert cli.main(["--first", "Ada", "--congress", "118"]) == 2
@@ -0,0 +1,104 @@
+import sqlite3
+from unittest import mock
+
+import congress_api.cli as cli
+
+
+# (bioguide ID, first name, last name, vote)
+VOTERS = (("Z000017", "Ryan", "Zinke", "Yea"), ("H000001", "Grace", "Hopper", "Nay"))
+
+
+class NoNetwork:
+    def __init__(self, *args, **kwargs):
+        raise AssertionError("offline export must not build an API client")
+
+
+def exported_csv(capsys):
+    out = capsys.readouterr().out
+    path = out.strip().rsplit("Wrote results to ", 1)[1]
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def test_from_db_reproduces_online_csv(tmp_path, monkeypatch, capsys, fake_api, member_votes):
+    monkeypatch.chdir(tmp_path)
+    db = tmp_path / "votes.db"
+    monkeypatch.setenv("CONGRESS_API_KEY", "k")
+    # Two sessions of three roll calls, each with two members voting
+    fake_api(
+        {1: 3, 2: 3},
+        payload=lambda session, roll_call: member_votes(
+            session,
+            voters=VOTERS,
+            startDate=f"202{2 + session}-03-01T12:00:00-05:00",
+            voteQuestion="On Passage",
+            legislationType="HR",
+            legislationNumber=str(roll_call),
+        ),
+    )
+    assert cli.main(["--first", "Ryan", "--last", "Zinke", "--congress", "118", "--db", str(db), "--no-cache"]) == 0
+    online = exported_csv(capsys)
+
+    monkeypatch.delenv("CONGRESS_API_KEY")
+    with mock.patch("congress_api.commands.export_command.CongressApiClient", NoNetwork), \
+            mock.patch("congress_api.commands.export_command.load_api_key", return_value=None):
+        assert cli.main(["--first", "Ryan", "--last", "Zinke", "--congress", "118", "--from-db", str(db)]) == 0
+        assert exported_csv(capsys) == online
+        assert cli.main(["--bioguide", "Z000017", "--congress", "118", "--from-db", str(db)]) == 0
+        assert exported_csv(capsys) == online
+        assert cli.main(
+            ["--first", "Grace", "--last", "Hopper", "--congress", "118", "--session", "2", "--rollcall", "3",
+             "--from-db", str(db)]
+        ) == 0
+        assert exported_csv(capsys).splitlines()[1].startswith("118,2,2024-03-01T12:00:00-05:00,Grace Hopper,Nay,3,")
+    assert online.count("\n") == 7
+
+
+def test_from_db_matches_non_ascii_names_like_online(tmp_path, monkeypatch, capsys, fake_api, member_votes):
+    monkeypatch.chdir(tmp_path)
+    db = tmp_path / "votes.db"
+    monkeypatch.setenv("CONGRESS_API_KEY", "k")
+    # Stored with padding and in capitals that SQLite's NOCASE would not fold
+    sanchez = ("S000030", "Linda", " SÁNCHEZ ", "Yea")
+    fake_api({1: 2, 2: 0}, payload=lambda session, roll_call: member_votes(session, voters=(sanchez,)))
+    argv = ["--first", "Linda", "--last", "Sánchez", "--congress", "118"]
+    assert cli.main(argv + ["--db", str(db), "--no-cache"]) == 0
+    online = exported_csv(capsys)
+    assert online.count("\n") == 3
+
+    with mock.patch("congress_api.commands.export_command.CongressApiClient", NoNetwork):
+        assert cli.main(argv + ["--from-db", str(db)]) == 0
+    assert exported_csv(capsys) == online
+
+
+def test_from_db_never_writes_the_database(tmp_path, monkeypatch, capsys, fake_api):
+    monkeypatch.chdir(tmp_path)
+    db = tmp_path / "votes.db"
+    monkeypatch.setenv("CONGRESS_API_KEY", "k")
+    fake_api({1: 2, 2: 0})
+    argv = ["--first", "Ryan", "--last", "Zinke", "--congress", "118"]
+    assert cli.main(argv + ["--db", str(db), "--no-cache"]) == 0
+    with sqlite3.connect(db) as conn:
+        conn.execute("PRAGMA journal_mode = DELETE")
+    stored = db.read_bytes()
+    capsys.readouterr()
+
+    assert cli.main(argv + ["--from-db", str(db)]) == 0
+    assert db.read_bytes() == stored
+    assert sorted(path.name for path in tmp_path.glob("votes.db*")) == ["votes.db"]
+
+    # An older schema is reported rather than migrated
+    with sqlite3.connect(db) as conn:
+        conn.execute("PRAGMA user_version = 2")
+    stored = db.read_bytes()
+    capsys.readouterr()
+    assert cli.main(argv + ["--from-db", str(db)]) == 2
+    assert "uses schema version 2" in capsys.readouterr().out
+    assert db.read_bytes() == stored
+
+
+def test_from_db_validation(tmp_path):
+    assert cli.main(["--first", "A", "--last", "B", "--congress", "118", "--from-db", str(tmp_path / "missing.db")]) == 2
+    db = tmp_path / "votes.db"
+    db.touch()
+    assert cli.main(["--first", "A", "--last", "B", "--congress", "118", "--from-db", str(db), "--db", str(db)]) == 2
@@ -0,0 +1,84 @@
+import csv
+import gzip
+import io
+import json
+
+import congress_api.cli as cli
+from congress_api.services.exporter import CsvExporter
+from congress_api.services.writers import STDOUT, open_row_writer
+
+
+ROWS = [{"a": "1", "b": "x,y"}, {"a": "2", "b": "é"}]
+
+
+def test_gzip_csv_round_trip(tmp_path):
+    path = tmp_path / "out.csv.gz"
+    with open_row_writer(path, "csv.gz", ["a", "b"]) as writer:
+        writer.writerows(ROWS)
+        writer.write_values(["3", None])
+    with gzip.open(path, "rt", newline="", encoding="utf-8") as f:
+        assert list(csv.DictReader(f)) == ROWS + [{"a": "3", "b": ""}]
+
+
+def test_ndjson_rows_keep_column_order(tmp_path):
+    path = tmp_path / "out.ndjson"
+    with open_row_writer(path, "ndjson", ["a", "b"]) as writer:
+        writer.writerow({"b": "y", "a": "1", "extra": "ignored"})
+        writer.write_values(["2", None])
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines == ['{"a":"1","b":"y"}', '{"a":"2","b":null}']
+
+
+def test_value_rows_write_like_dict_rows(tmp_path):
+    for fmt in ("csv", "ndjson"):
+        by_dict, by_values = tmp_path / f"dict.{fmt}", tmp_path / f"values.{fmt}"
+        with open_row_writer(by_dict, fmt, ["a", "b"]) as writer:
+            writer.writerows(ROWS)
+        with open_row_writer(by_values, fmt, ["a", "b"]) as writer:
+            writer.write_value_rows(iter([("1", "x,y"), ("2", "é")]))
+        assert by_values.read_bytes() == by_dict.read_bytes()
+
+
+def test_exporter_names_files_by_format(tmp_path):
+    exporter = CsvExporter(outputs_dir=tmp_path, output_format="ndjson")
+    assert exporter.build_combined_output_filepath(118).name.endswith(".ndjson")
+    fixed = tmp_path / "fixed.csv.gz"
+    assert CsvExporter(output_format="csv.gz", output_path=fixed).build_combined_output_filepath(118) == fixed
+
+
+def test_cli_streams_ndjson_to_stdout(tmp_path, monkeypatch, capsys, fake_api, member_votes):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CONGRESS_API_KEY", "k")
+    # Three roll calls per session, one member voting Nay
+    hopper = ("H000001", "Grace", "Hopper", "Nay")
+    fake_api({1: 3, 2: 3}, payload=lambda session, roll_call: member_votes(session, voters=(hopper,)))
+    code = cli.main(
+        ["--first", "Grace", "--last", "Hopper", "--congress", "118", "--no-cache", "--format", "ndjson", "--output", "-"]
+    )
+    assert code == 0
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    assert [(r["sessionNumber"], r["rollCallNumber"], r["voteCast"]) for r in records][:2] == [
+        (1, 1, "Nay"), (1, 2, "Nay"),
+    ]
+    assert len(records) == 6
+    assert f"Wrote results to {STDOUT}" in captured.err
+    assert not (tmp_path / "outputs").exists()
+    assert not (tmp_path / ".cache" / "checkpoints").exists()
+
+
+def test_cli_output_validation(tmp_path, capsys):
+    out = str(tmp_path / "all.csv")
+    assert cli.main(["--member", "A", "B", "--member", "C", "D", "--congress", "118", "--output", out]) == 2
+    assert "--combined" in capsys.readouterr().out
+    assert cli.main(["--first", "A", "--last", "B", "--congress", "118", "--resume", "--format", "csv.gz"]) == 2
+
+
+def test_cli_streams_gzip_to_stdout(tmp_path, monkeypatch, capsysbinary, fake_api):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CONGRESS_API_KEY", "k")
+    fake_api({1: 2, 2: 1})
+    argv = ["--first", "Ryan", "--last", "Zinke", "--congress", "118", "--no-cache", "--format", "csv.gz", "--output", "-"]
+    assert cli.main(argv) == 0
+    rows = list(csv.DictReader(io.StringIO(gzip.decompress(capsysbinary.readouterr().out).decode("utf-8"))))
+    assert [(r["sessionNumber"], r["rollCallNumber"]) for r in rows] == [("1", "1"), ("1", "2"), ("2", "1")]
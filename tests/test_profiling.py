@@ -0,0 +1,75 @@
+import json
+import pstats
+
+import pytest
+
+import congress_api.cli as cli
+from congress_api.replay import ReplayServer
+from congress_api.services.api_client import BASE_URL_ENV
+from congress_api.services.metrics import Metrics
+from congress_api.services.profiling import RunProfiler, stage_timings
+from congress_api.services.transport import TransportResponse
+
+
+def test_stage_timings_sum_across_labels():
+    metrics = Metrics()
+    metrics.observe("write_seconds", 0.5, format="csv")
+    metrics.observe("write_seconds", 0.25, format="ndjson")
+    metrics.observe("map_seconds", 0.125)
+    timings = stage_timings(metrics)
+    assert list(timings) == ["key_load", "fetch", "map", "filter", "write"]
+    assert timings["write"] == {"seconds": 0.75, "calls": 2}
+    assert timings["map"] == {"seconds": 0.125, "calls": 1}
+    assert timings["fetch"] == {"seconds": 0.0, "calls": 0}
+
+
+@pytest.fixture
+def replayed_votes(member_votes):
+    """Replay response for one roll call's member votes."""
+    return lambda session: TransportResponse.from_json(200, member_votes(session))
+
+
+def test_cli_profile_writes_cpu_memory_and_stage_timings(tmp_path, monkeypatch, capsys, replayed_votes):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CONGRESS_API_KEY", "k")
+    responses = {(118, session, n): replayed_votes(session) for session in (1, 2) for n in range(1, 6)}
+    argv = [
+        "--first", "Ryan", "--last", "Zinke", "--congress", "118", "--no-cache",
+        "--profile", "--profile-memory", "--profile-dir", str(tmp_path / "profiles"),
+    ]
+    with ReplayServer(responses) as server:
+        monkeypatch.setenv(BASE_URL_ENV, server.base_url)
+        assert cli.main(argv) == 0
+    assert "[INFO] Stage timings: key_load" in capsys.readouterr().err
+
+    (dump,) = (tmp_path / "profiles").glob("*.prof")
+    assert "_get_member_votes" in str(pstats.Stats(str(dump)).stats)
+    assert "Top 25 allocation sites:" in dump.with_suffix(".memory.txt").read_text(encoding="utf-8")
+    stages = json.loads(dump.with_suffix(".stages.json").read_text(encoding="utf-8"))["stages"]
+    assert stages["key_load"]["calls"] == 1
+    assert stages["fetch"]["calls"] == 12
+    assert stages["map"]["calls"] == stages["filter"]["calls"] == 10
+    # One burst of rows per roll call, plus opening and closing the file
+    assert stages["write"]["calls"] == 11
+    assert all(timing["seconds"] > 0 for timing in stages.values())
+
+
+def test_cli_reports_profile_failures(tmp_path, monkeypatch, capsys, replayed_votes):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CONGRESS_API_KEY", "k")
+    (tmp_path / "not_a_dir").write_text("", encoding="utf-8")
+    argv = ["--first", "Ryan", "--last", "Zinke", "--congress", "118", "--no-cache", "--quiet", "--profile"]
+    assert cli.main(argv + ["--profile-dir", str(tmp_path / "not_a_dir")]) == 2
+    assert "[ERROR] --profile-dir: cannot create" in capsys.readouterr().out
+
+    def fail(self, prefix):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(RunProfiler, "_write_cpu", fail)
+    metrics_path = tmp_path / "run.json"
+    with ReplayServer({(118, 1, 1): replayed_votes(1)}) as server:
+        monkeypatch.setenv(BASE_URL_ENV, server.base_url)
+        assert cli.main(argv + ["--profile-dir", str(tmp_path / "profiles"), "--metrics-out", str(metrics_path)]) == 2
+    assert "[ERROR] Could not write profile: disk full" in capsys.readouterr().out
+    # A failed profile write does not cost the metrics report
+    assert metrics_path.is_file()
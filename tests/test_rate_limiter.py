@@ -0,0 +1,87 @@
+import threading
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from congress_api.services.api_client import CongressApiClient, SimpleResponse
+from congress_api.services.rate_limiter import (
+    RateLimiter,
+    RateLimitError,
+    backoff_delay,
+    retry_after_seconds,
+)
+from congress_api.services.roll_call_iterator import RollCallIterator
+from congress_api.services.transport import InMemoryTransport, TransportResponse
+
+
+def test_bucket_paces_after_burst(fake_clock):
+    limiter = RateLimiter(3600, burst=2, clock=fake_clock, sleep=fake_clock.sleep)
+    waits = [limiter.acquire() for _ in range(4)]
+    # Two burst tokens, then one request per second
+    assert waits == [0.0, 0.0, pytest.approx(1.0), pytest.approx(1.0)]
+
+
+def test_bucket_reservations_are_thread_safe():
+    limiter = RateLimiter(3600, burst=100, clock=lambda: 0.0, sleep=lambda s: None)
+    threads = [threading.Thread(target=lambda: [limiter.reserve() for _ in range(50)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # 200 reservations against 100 tokens: the last waits 100 refill seconds
+    assert limiter.reserve() == pytest.approx(101.0)
+
+
+def test_observe_and_pause(fake_clock):
+    limiter = RateLimiter(3600, clock=fake_clock, sleep=fake_clock.sleep)
+    limiter.observe({"x-ratelimit-remaining": "0"})
+    assert limiter.reserve() == pytest.approx(1.0)
+    limiter.pause(30)
+    assert limiter.reserve() == pytest.approx(30.0)
+
+
+def test_retry_after_parsing_and_backoff():
+    assert retry_after_seconds({"Retry-After": "12"}) == 12.0
+    now = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    assert retry_after_seconds({"Retry-After": "Mon, 01 Jan 2024 00:00:30 GMT"}, now=now) == 30.0
+    assert retry_after_seconds({"Retry-After": "soon"}) is None
+    assert retry_after_seconds({}) is None
+    assert backoff_delay(3, rng=lambda: 1.0) == 8.0
+    assert backoff_delay(10, rng=lambda: 1.0) == 60.0
+    assert backoff_delay(3, rng=lambda: 0.5) == 4.0
+
+
+def test_client_honors_retry_after_through_limiter(fake_clock):
+    limiter = RateLimiter(3600, clock=fake_clock, sleep=fake_clock.sleep)
+    responses = [
+        TransportResponse.from_json(429, {}, headers={"Retry-After": "7"}),
+        TransportResponse.from_json(200, {"ok": True}, headers={"X-RateLimit-Remaining": "4999"}),
+    ]
+    transport = InMemoryTransport(lambda url, params: responses.pop(0))
+    client = CongressApiClient(api_key="k", transport=transport, rate_limiter=limiter)
+    resp = client.get_member_votes(118, 1, 1)
+    assert resp.status_code == 200
+    assert fake_clock.sleeps == [pytest.approx(7.0)]
+
+
+@patch("congress_api.services.api_client.time.sleep")
+def test_client_gives_up_after_max_retries(mock_sleep):
+    transport = InMemoryTransport(lambda url, params: TransportResponse.from_json(429, {}))
+    client = CongressApiClient(api_key="k", transport=transport, max_retries=3)
+    assert client.get_member_votes(118, 1, 1).status_code == 429
+    assert len(transport.requests) == 4
+    assert mock_sleep.call_count == 3
+
+
+def test_iterator_raises_instead_of_skipping_throttled_roll_call():
+    class ThrottledClient:
+        def get_member_votes(self, congress, session, roll_call):
+            if roll_call == 2:
+                return SimpleResponse(status_code=429, json=None)
+            return SimpleResponse(status_code=200, json={"houseRollCallVoteMemberVotes": {"results": []}})
+
+    iterator = iter(RollCallIterator(ThrottledClient(), congress_number=118))
+    next(iterator)
+    with pytest.raises(RateLimitError):
+        next(iterator)
@@ -0,0 +1,107 @@
+import csv
+import json
+import time
+
+import pytest
+
+from congress_api.commands.export_command import ExportNotVotingCommand, _build_client
+from congress_api.replay import (
+    Recording,
+    RecordingTransport,
+    ReplayConfig,
+    ReplayServer,
+    main as replay_main,
+    parse_member_votes_url,
+)
+from congress_api.services.api_client import BASE_URL_ENV, CongressApiClient
+from congress_api.services.response_cache import ResponseCache
+from congress_api.services.roll_call_iterator import RollCallIterator
+from congress_api.services.transport import InMemoryTransport, TransportResponse
+
+
+LAST_BY_SESSION = {1: 5, 2: 3}
+
+
+@pytest.fixture
+def recording(tmp_path, member_votes):
+    def upstream(url, params):
+        _, session, roll_call = parse_member_votes_url(url)
+        if roll_call > LAST_BY_SESSION[session]:
+            # Session 1 ends with a 404, session 2 with a 200 error payload
+            if session == 1:
+                return TransportResponse.from_json(404, None)
+            return TransportResponse.from_json(200, {"error": "No Vote matches the given query."})
+        return TransportResponse.from_json(200, member_votes(session))
+
+    recording = Recording(tmp_path / "recording")
+    transport = RecordingTransport(InMemoryTransport(upstream), recording)
+    client = CongressApiClient(api_key="k", transport=transport)
+    assert len(list(RollCallIterator(client=client, congress_number=118))) == 8
+    assert transport.recorded == 10
+    return recording
+
+
+def keys(roll_calls):
+    return [(rc.session_number, rc.roll_call_number) for rc in roll_calls]
+
+
+def test_replay_serves_recorded_scan(recording):
+    responses = recording.load()
+    assert responses[(118, 1, 6)].status_code == 404
+    assert json.loads(responses[(118, 2, 4)].content) == {"error": "No Vote matches the given query."}
+    with ReplayServer(responses) as server:
+        with CongressApiClient(api_key="k", base_url=server.base_url) as client:
+            roll_calls = list(RollCallIterator(client=client, congress_number=118, workers=4))
+            # Never recorded: answered like the API's end of session
+            assert client.get_member_votes(117, 1, 1).status_code == 404
+    assert keys(roll_calls) == [(1, n) for n in range(1, 6)] + [(2, n) for n in range(1, 4)]
+    assert roll_calls[0].members[0].last_name == "Zinke"
+
+
+def test_replay_injects_latency_and_throttling(recording):
+    config = ReplayConfig(latency=0.05, throttle_rate=1.0, retry_after=7, seed=1)
+    with ReplayServer(recording.load(), config) as server:
+        with CongressApiClient(api_key="k", base_url=server.base_url, max_retries=0) as client:
+            start = time.monotonic()
+            response = client.get_member_votes(118, 1, 1)
+            assert time.monotonic() - start >= 0.05
+            assert response.status_code == 429
+        server.config = ReplayConfig(error_rate=1.0)
+        with CongressApiClient(api_key="k", base_url=server.base_url) as client:
+            assert client.get_member_votes(118, 1, 1).status_code == 503
+    assert server.status_counts == {429: 1, 503: 1}
+
+
+def test_cli_export_against_replay(recording, tmp_path, monkeypatch):
+    monkeypatch.setenv("CONGRESS_API_KEY", "k")
+    with ReplayServer(recording.load()) as server:
+        monkeypatch.setenv(BASE_URL_ENV, server.base_url)
+        out_path = ExportNotVotingCommand(
+            member_first="Ryan", member_last="Zinke", congress_number=118, outputs_dir=tmp_path / "outputs", workers=2
+        ).run()
+    assert len(list(csv.DictReader(out_path.open("r", encoding="utf-8")))) == 8
+    assert server.status_counts[200] >= 8
+
+
+def test_base_url_override_from_dotenv_bypasses_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CONGRESS_API_KEY", "k")
+    monkeypatch.delenv(BASE_URL_ENV, raising=False)
+    cache_path = tmp_path / "cache.sqlite3"
+    assert _build_client("k", cache_path=cache_path).cache is not None
+
+    (tmp_path / ".env").write_text(f"{BASE_URL_ENV}=http://127.0.0.1:8765/v3\n", encoding="utf-8")
+    client = _build_client("k", cache_path=cache_path)
+    assert client.base_url == "http://127.0.0.1:8765/v3"
+    # Replayed responses must never be served as, or stored as, real API data
+    assert client.cache is None
+
+
+def test_record_from_cache(tmp_path, member_votes):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    for roll_call in (1, 2):
+        cache.put(118, 1, roll_call, 200, json.dumps(member_votes(1)).encode("utf-8"))
+    cache.close()
+    assert replay_main(["record", str(tmp_path / "rec"), "--congress", "118", "--from-cache", str(tmp_path / "cache.sqlite3")]) == 0
+    assert sorted(Recording(tmp_path / "rec").load()) == [(118, 1, 1), (118, 1, 2)]
+    assert replay_main(["record", str(tmp_path / "rec"), "--congress", "118", "--from-cache", str(tmp_path / "none")]) == 2
@@ -0,0 +1,102 @@
+import random
+from datetime import date
+
+import congress_api.cli as cli
+from congress_api.services.api_client import CongressApiClient
+from congress_api.services.response_cache import CachePolicy, ResponseCache, session_calendar_year
+from congress_api.services.transport import InMemoryTransport, TransportResponse
+
+
+PAYLOAD = {"houseRollCallVoteMemberVotes": {"sessionNumber": 1, "results": [{"lastName": "Zinke"}]}}
+
+
+def make_cache(tmp_path, today=date(2026, 6, 1), **kwargs):
+    return ResponseCache(tmp_path / "cache.sqlite3", policy=CachePolicy(today=lambda: today), **kwargs)
+
+
+def payload_transport():
+    def handler(url, params):
+        if url.endswith("/999/members"):
+            return TransportResponse.from_json(404, {"error": "No Vote matches the given query."})
+        return TransportResponse.from_json(200, PAYLOAD)
+
+    return InMemoryTransport(handler)
+
+
+def test_session_calendar_year():
+    assert session_calendar_year(118, 1) == 2023
+    assert session_calendar_year(119, 2) == 2026
+
+
+def test_repeat_fetch_served_from_cache(tmp_path):
+    transport = payload_transport()
+    client = CongressApiClient(api_key="k", transport=transport, cache=make_cache(tmp_path))
+    first = client.get_member_votes(118, 1, 5)
+    second = client.get_member_votes(118, 1, 5)
+    assert first.json == second.json == PAYLOAD
+    assert len(transport.requests) == 1
+
+    # A new client over the same file needs no network either
+    other_transport = payload_transport()
+    other = CongressApiClient(api_key="k", transport=other_transport, cache=make_cache(tmp_path))
+    assert other.get_member_votes(118, 1, 5).json == PAYLOAD
+    assert other_transport.requests == []
+
+
+def test_end_marker_cached_only_for_closed_sessions(tmp_path):
+    transport = payload_transport()
+    client = CongressApiClient(api_key="k", transport=transport, cache=make_cache(tmp_path))
+    client.get_member_votes(118, 1, 999)
+    client.get_member_votes(118, 1, 999)
+    client.get_member_votes(119, 2, 999)
+    client.get_member_votes(119, 2, 999)
+    assert len(transport.requests) == 3
+
+
+def test_recent_session_entries_expire(tmp_path, fake_clock):
+    transport = payload_transport()
+    cache = ResponseCache(
+        tmp_path / "c.sqlite3",
+        policy=CachePolicy(recent_ttl_seconds=60, today=lambda: date(2026, 6, 1)),
+        clock=fake_clock,
+    )
+    client = CongressApiClient(api_key="k", transport=transport, cache=cache)
+    client.get_member_votes(119, 2, 1)
+    fake_clock.now += 30
+    client.get_member_votes(119, 2, 1)
+    assert len(transport.requests) == 1
+    fake_clock.now += 60
+    client.get_member_votes(119, 2, 1)
+    assert len(transport.requests) == 2
+
+
+def test_refresh_bypasses_reads_but_updates(tmp_path):
+    transport = payload_transport()
+    cache = make_cache(tmp_path)
+    CongressApiClient(api_key="k", transport=transport, cache=cache, refresh_cache=True).get_member_votes(118, 1, 1)
+    CongressApiClient(api_key="k", transport=transport, cache=cache, refresh_cache=True).get_member_votes(118, 1, 1)
+    assert len(transport.requests) == 2
+    assert cache.get(118, 1, 1) is not None
+
+
+def test_lru_eviction_keeps_size_bounded(tmp_path, fake_clock):
+    body = random.Random(7).randbytes(2048)  # incompressible, so each entry has a real size
+    cache = make_cache(tmp_path, max_bytes=3 * (len(body) + 64), clock=fake_clock)
+    for roll_call in range(1, 4):
+        fake_clock.now += 1
+        cache.put(118, 1, roll_call, 200, body)
+    fake_clock.now += 1
+    assert cache.get(118, 1, 1) is not None  # touch 1 so 2 becomes least recently used
+    fake_clock.now += 1
+    cache.put(118, 1, 4, 200, body + b"x")
+    assert cache.get(118, 1, 2) is None
+    assert cache.get(118, 1, 1) is not None
+    assert cache.get(118, 1, 4) is not None
+
+
+def test_cli_cache_flags():
+    base = ["--first", "A", "--last", "B", "--congress", "118"]
+    assert cli.parse_args(base).cache_path is not None
+    assert cli.parse_args(base + ["--no-cache"]).cache_path is None
+    args = cli.parse_args(base + ["--refresh"])
+    assert args.refresh_cache is True and args.cache_path is not None
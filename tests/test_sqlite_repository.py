@@ -0,0 +1,81 @@
+import sqlite3
+
+import pytest
+
+from congress_api.domain.models import MemberVote
+from congress_api.repositories.sqlite_repository import SqliteVotesRepository
+
+
+def test_save_roll_calls_is_idempotent(tmp_path, make_roll_call):
+    repo = SqliteVotesRepository(db_path=tmp_path / "votes.db", batch_size=2)
+    repo.save_roll_calls([make_roll_call(1, n) for n in (1, 2, 3)])
+    changed = make_roll_call(1, 2)
+    changed.members = [MemberVote(bioguide_id="Z000017", first_name="Ryan", last_name="Zinke", vote_cast="Nay")]
+    repo.save_roll_calls([make_roll_call(1, 1), changed, make_roll_call(1, 3)])
+    with sqlite3.connect(tmp_path / "votes.db") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM roll_calls").fetchone()[0] == 3
+        votes = conn.execute(
+            "SELECT rc.roll_call_number, mv.vote_cast FROM member_votes mv JOIN roll_calls rc ON rc.id = mv.roll_call_id"
+            " ORDER BY rc.roll_call_number"
+        ).fetchall()
+    assert votes == [(1, "Yea"), (2, "Nay"), (3, "Yea")]
+
+
+def test_existing_duplicates_are_removed_on_open(tmp_path, make_roll_call):
+    path = tmp_path / "votes.db"
+    with sqlite3.connect(path) as conn:
+        conn.executescript(
+            """
+            CREATE TABLE roll_calls (id INTEGER PRIMARY KEY AUTOINCREMENT, congress INTEGER NOT NULL,
+                session_number INTEGER NOT NULL, roll_call_number INTEGER NOT NULL, start_date TEXT, result TEXT);
+            CREATE TABLE member_votes (id INTEGER PRIMARY KEY AUTOINCREMENT, roll_call_id INTEGER NOT NULL,
+                bioguide_id TEXT, first_name TEXT NOT NULL, last_name TEXT NOT NULL, vote_cast TEXT NOT NULL,
+                party TEXT, state TEXT);
+            INSERT INTO roll_calls (congress, session_number, roll_call_number) VALUES (118, 1, 1), (118, 1, 1);
+            INSERT INTO member_votes (roll_call_id, first_name, last_name, vote_cast) VALUES (1, 'A', 'B', 'Yea'), (2, 'A', 'B', 'Nay');
+            """
+        )
+    repo = SqliteVotesRepository(db_path=path)
+    assert [[mv.vote_cast for mv in rc.members] for rc in repo.iter_roll_calls(118)] == [["Nay"]]
+    repo.save_roll_calls([make_roll_call(1, 1)])
+    assert len(list(repo.iter_roll_calls(118))) == 1
+
+
+def test_member_queries_span_congresses(tmp_path, make_roll_call):
+    repo = SqliteVotesRepository(db_path=tmp_path / "votes.db")
+    stored = []
+    for congress in (116, 117, 118):
+        rc = make_roll_call(1, 4)
+        rc.congress = congress
+        rc.vote_question = "On Passage"
+        rc.legislation_type, rc.legislation_number = "HR", "1"
+        rc.members.append(MemberVote(bioguide_id="H1", first_name="Grace", last_name="Hopper", vote_cast="Nay"))
+        stored.append(rc)
+    repo.save_roll_calls(stored)
+
+    by_id = list(repo.iter_member_roll_calls(117, 118, bioguide_id="Z000017"))
+    assert [rc.congress for rc in by_id] == [117, 118]
+    assert [[mv.last_name for mv in rc.members] for rc in by_id] == [["Zinke"], ["Zinke"]]
+    assert (by_id[0].vote_question, by_id[0].legislation_type, by_id[0].legislation_number) == ("On Passage", "HR", "1")
+
+    by_name = list(repo.iter_member_roll_calls(116, last_name="hopper"))
+    assert [(rc.congress, rc.members[0].vote_cast) for rc in by_name] == [(116, "Nay")]
+    with pytest.raises(ValueError):
+        list(repo.iter_member_roll_calls(118))
+
+
+def test_member_queries_search_the_member_votes_indexes(tmp_path, monkeypatch, make_roll_call):
+    repo = SqliteVotesRepository(db_path=tmp_path / "votes.db")
+    repo.save_roll_calls([make_roll_call(1, n) for n in range(1, 5)])
+    queries = []
+    monkeypatch.setattr(SqliteVotesRepository, "_query", lambda self, sql, params: queries.append((sql, params)))
+    repo.iter_member_roll_calls(118, bioguide_id="Z000017")
+    repo.iter_member_roll_calls(118, last_name="Zinke")
+
+    with sqlite3.connect(tmp_path / "votes.db") as conn:
+        plans = [[row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params)] for sql, params in queries]
+    by_id, by_name = plans
+    # Plan wording varies across SQLite versions; the index names do not
+    assert any(step.startswith("SEARCH") and "ix_member_votes_bioguide" in step for step in by_id)
+    assert any(step.startswith("SEARCH") and "ix_member_votes_last_name_key" in step for step in by_name)
+    assert not any(step.startswith("SCAN") for step in by_id + by_name)
@@ -1,4 +1,10 @@
-from congress_api.services.votes_filter import VotesFilter
+from congress_api.services.exporter import CHAMBER_FIELDNAMES, FIELDNAMES
+from congress_api.services.votes_filter import (
+    MultiMemberVotesFilter,
+    VotesFilter,
+    iter_chamber_rows,
+    iter_chamber_values,
+)
 from congress_api.domain.models import RollCall, MemberVote
 
 
@@ -25,3 +31,49 @@ def test_votes_filter_matches_not_voting():
     assert rows[0]["voteCast"] == "Not Voting"
 
 
+def test_votes_filter_normalizes_spellings_across_roll_calls():
+    vf = VotesFilter(target_first=" kath", target_last="PORTER")
+    roll_calls = [
+        RollCall(
+            congress=118,
+            session_number=1,
+            roll_call_number=number,
+            start_date="2023-01-10T10:00:00-05:00",
+            members=[
+                MemberVote(bioguide_id=None, first_name="Katherine", last_name=last, vote_cast="Yea"),
+                MemberVote(bioguide_id=None, first_name="Rob", last_name=last, vote_cast="Nay"),
+            ],
+        )
+        for number, last in ((1, "Porter"), (2, " porter "), (3, "Porter"))
+    ]
+    rows = list(vf.iter_member_rows(roll_calls))
+    assert [r["rollCallNumber"] for r in rows] == [1, 2, 3]
+    assert rows[0]["voteUrl"] == "https://clerk.house.gov/Votes/20231"
+
+
+def test_multi_member_filter_shares_last_name():
+    targets = [VotesFilter("Grace", "Hopper"), VotesFilter("Ada", "Lovelace"), VotesFilter("Ed", "Hopper")]
+    pairs = list(MultiMemberVotesFilter(targets=targets).iter_rows([
+        RollCall(
+            congress=118,
+            session_number=1,
+            roll_call_number=7,
+            start_date=None,
+            members=[
+                MemberVote(bioguide_id=None, first_name="Edward", last_name="Hopper", vote_cast="Yea"),
+                MemberVote(bioguide_id=None, first_name="Grace", last_name="Hopper", vote_cast="Nay"),
+                MemberVote(bioguide_id=None, first_name="Alan", last_name="Turing", vote_cast="Yea"),
+            ],
+        )
+    ]))
+    assert [(position, row["memberName"]) for position, row in pairs] == [(2, "Edward Hopper"), (0, "Grace Hopper")]
+
+
+def test_value_rows_match_dict_rows():
+    roll_calls = list(DummyIterator())
+    roll_calls[0].legislation_type, roll_calls[0].legislation_number = "HR", "5"
+    dict_rows = list(VotesFilter("Ada", "Lovelace").iter_member_rows(roll_calls))
+    value_rows = list(VotesFilter("Ada", "Lovelace").iter_member_values(roll_calls))
+    assert [tuple(row[name] for name in FIELDNAMES) for row in dict_rows] == value_rows
+    chamber = [tuple(row[name] for name in CHAMBER_FIELDNAMES) for row in iter_chamber_rows(roll_calls)]
+    assert chamber == list(iter_chamber_values(roll_calls))